@@ -0,0 +1,115 @@
+"""
+    Бенчмарк главной страницы: последовательная загрузка дашборда
+    (семь запросов сервисов) против DashboardService (один запрос).
+
+    Запуск из корня проекта (нужна заполненная БД из .env):
+        python benchmarks/dashboard.py --users 50 --rounds 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from sqlalchemy import event, select
+
+from database import db
+from users.models import User
+from users.service import UserService
+from company.service.company import CompanyService
+from news.service import NewsService
+from meeting.service import MeetingService
+from web.service import DashboardService
+
+
+#   счетчик выполненных SQL-запросов
+class QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine.sync_engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+#   загрузка дашборда до оптимизации: запросы выполняются по очереди
+async def legacy_dashboard(session, user):
+    user_service = UserService(None)
+    if user.company_id:
+        await CompanyService().get_company_users(session, user, user.company_id)
+        await NewsService().get_news(session, user.company_id)
+        await MeetingService().get_meeting(user, session)
+    await user_service.get_rating(session, user)
+    await user_service.get_avg_rating(session, user)
+    await user_service.get_owner_tasks(user, session)
+    await user_service.get_my_tasks(user, session)
+
+#   загрузка дашборда одним запросом
+async def single_query_dashboard(session, user):
+    await DashboardService().get_dashboard(session, user)
+
+#   прогон одного варианта загрузки по всем пользователям
+async def measure(loader, users, rounds, counter):
+    timings = []
+    counter.count = 0
+
+    for _ in range(rounds):
+        for user in users:
+            async with db.session() as session:
+                session.add(user)
+                start = time.perf_counter()
+                await loader(session, user)
+                timings.append((time.perf_counter() - start) * 1000)
+                session.expunge(user)
+
+    pages = rounds * len(users)
+    return {
+        'queries_per_page': counter.count / pages,
+        'p50_ms': statistics.median(timings),
+        'p95_ms': statistics.quantiles(timings, n=20)[18],
+    }
+
+async def main(users_limit, rounds):
+    db.engine.sync_engine.echo = False
+    counter = QueryCounter(db.engine)
+
+    async with db.session() as session:
+        query = (
+            select(User)
+            .where(User.company_id.is_not(None))
+            .order_by(User.id)
+            .limit(users_limit)
+        )
+        users = (await session.execute(query)).scalars().all()
+        for user in users:
+            session.expunge(user)
+
+    if len(users) < 2:
+        raise SystemExit('Недостаточно пользователей с компанией для бенчмарка')
+
+    results = {
+        'before': await measure(legacy_dashboard, users, rounds, counter),
+        'after': await measure(single_query_dashboard, users, rounds, counter),
+    }
+
+    print(f'{"":8}{"queries/page":>14}{"p50, ms":>10}{"p95, ms":>10}')
+    for name, result in results.items():
+        print(
+            f'{name:8}{result["queries_per_page"]:>14.1f}'
+            f'{result["p50_ms"]:>10.2f}{result["p95_ms"]:>10.2f}'
+        )
+
+    await db.engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Бенчмарк главной страницы')
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.rounds))
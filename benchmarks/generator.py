@@ -0,0 +1,385 @@
+"""
+    Генератор синтетических данных для бенчмарков на масштабе компаний.
+
+    Заполняет все таблицы схемы (migrations/versions/31cda2386525_.py):
+    company, department, user, task, comment, rating, calendar, meeting, news.
+    Данные загружаются через COPY asyncpg в одной транзакции, внешние ключи
+    соблюдаются, записи календаря не нарушают uix_user_datetime.
+    После загрузки пересчитываются квартальные суммы оценок (rating_rollup).
+    Для одинаковых --seed и --today результат одинаков.
+
+    Пример (500 компаний, 50k пользователей, 2M задач, 10M строк календаря):
+        python benchmarks/generator.py --companies 500 --users 50000 \\
+            --tasks 2000000 --meetings 200000 --participants 40 \\
+            --comments 2000000 --news 25000 --quarters 6 --seed 1
+
+    Строки календаря: одна на задачу плюс meetings * participants.
+"""
+
+import argparse
+import asyncio
+import bisect
+import datetime
+import os
+import random
+import sys
+import time
+from typing import Iterator
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+import asyncpg
+from fastapi_users.password import PasswordHelper
+
+from config import get_setting
+
+
+PASSWORD = 'password'
+FIRST_NAMES = ('Анна', 'Иван', 'Мария', 'Петр', 'Ольга', 'Денис', 'Елена', 'Сергей')
+LAST_NAMES = ('Иванов', 'Смирнов', 'Кузнецов', 'Попов', 'Соколов', 'Орлов', 'Волков')
+USERS_PER_DEPARTMENT = 20
+#   слоты встреч: с 8:00 до 19:30 каждые 30 минут
+MEETING_SLOTS = 24
+
+TABLES = (
+    'company', 'department', 'user', 'task', 'comment',
+    'rating', 'calendar', 'meeting', 'news',
+)
+
+
+class Layout:
+    """
+        Раскладка пользователей по компаниям и отделам.
+
+        У каждой компании непрерывный диапазон идентификаторов пользователей:
+        первый - админ, следующие 10% - менеджеры, остальные - сотрудники.
+        Отдел - каждые USERS_PER_DEPARTMENT пользователей, руководитель -
+        первый пользователь отдела.
+    """
+
+    def __init__(self, companies: int, users: int, offsets: dict[str, int]):
+        if users < companies * 2:
+            raise SystemExit('Нужно минимум два пользователя на компанию')
+
+        self.companies = companies
+        self.offsets = offsets
+        base, extra = divmod(users, companies)
+        self.sizes = [base + (c < extra) for c in range(companies)]
+
+        self.user_start, self.department_start = [], []
+        user_id, department_id = offsets['user'] + 1, offsets['department'] + 1
+        for size in self.sizes:
+            self.user_start.append(user_id)
+            self.department_start.append(department_id)
+            user_id += size
+            department_id += self.departments(size)
+
+        #   накопленные размеры для выбора компании с весом по числу сотрудников
+        self.cumulative = []
+        total = 0
+        for size in self.sizes:
+            total += size
+            self.cumulative.append(total)
+
+    @staticmethod
+    def departments(size: int) -> int:
+        return max(1, size // USERS_PER_DEPARTMENT)
+
+    @staticmethod
+    def managers(size: int) -> int:
+        return max(1, size // 10)
+
+    def company_id(self, c: int) -> int:
+        return self.offsets['company'] + 1 + c
+
+    def random_company(self, rng: random.Random) -> int:
+        return bisect.bisect_right(self.cumulative, rng.randrange(self.cumulative[-1]))
+
+    def random_user(self, rng: random.Random, c: int) -> int:
+        return self.user_start[c] + rng.randrange(self.sizes[c])
+
+    def random_manager(self, rng: random.Random, c: int) -> int:
+        return self.user_start[c] + rng.randrange(self.managers(self.sizes[c]) + 1)
+
+
+class Generator:
+    """
+        Построчная генерация таблиц.
+
+        Задачи и встречи генерируются детерминированным потоком случайных
+        чисел: зависимые таблицы (календарь, оценки, комментарии) получают
+        тот же поток повторным проходом, без хранения миллионов строк.
+    """
+
+    def __init__(self, args, layout: Layout, hashed_password: str):
+        self.args = args
+        self.layout = layout
+        self.hashed_password = hashed_password
+        self.today = args.today
+        self.first_day = self.today - datetime.timedelta(days=91 * args.quarters)
+        self.span = (self.today - self.first_day).days
+
+    def rng(self, name: str) -> random.Random:
+        return random.Random(f'{self.args.seed}:{name}')
+
+    def companies(self) -> Iterator[tuple]:
+        for c in range(self.layout.companies):
+            company_id = self.layout.company_id(c)
+            yield (
+                company_id, f'Компания {company_id}', 'Синтетические данные',
+                f'{company_id % 10000:04d}', f'{company_id % 1000000:06d}'
+            )
+
+    def departments(self) -> Iterator[tuple]:
+        for c, size in enumerate(self.layout.sizes):
+            for k in range(self.layout.departments(size)):
+                yield (
+                    self.layout.department_start[c] + k, f'Отдел {k + 1}',
+                    self.layout.company_id(c),
+                    self.layout.user_start[c] + k * USERS_PER_DEPARTMENT
+                )
+
+    def users(self) -> Iterator[tuple]:
+        rng = self.rng('user')
+        for c, size in enumerate(self.layout.sizes):
+            managers = self.layout.managers(size)
+            departments = self.layout.departments(size)
+            for i in range(size):
+                user_id = self.layout.user_start[c] + i
+                role = 'admin' if i == 0 else 'manager' if i <= managers else 'employee'
+                yield (
+                    user_id, rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES), role,
+                    self.layout.company_id(c),
+                    self.layout.department_start[c] + min(i // USERS_PER_DEPARTMENT, departments - 1),
+                    f'u{user_id}@gen.test', self.hashed_password, True, False, True
+                )
+
+    def _tasks(self) -> Iterator[dict]:
+        rng = self.rng('task')
+        comments_per_task = self.args.comments / max(self.args.tasks, 1)
+        for i in range(self.args.tasks):
+            c = self.layout.random_company(rng)
+            start = self.first_day + datetime.timedelta(days=rng.randrange(self.span + 30))
+            end = start + datetime.timedelta(days=rng.randint(1, 14))
+            if end < self.today:
+                status = 'done' if rng.random() < 0.8 else 'in_progress'
+            else:
+                status = 'todo' if rng.random() < 0.6 else 'in_progress'
+
+            yield {
+                'id': self.layout.offsets['task'] + 1 + i,
+                'company': c,
+                'owner_id': self.layout.random_manager(rng, c),
+                'target_id': self.layout.random_user(rng, c),
+                'start_date': start,
+                'end_date': end,
+                'status': status,
+                'rated': status == 'done' and rng.random() < self.args.rated,
+                'scores': (rng.randint(1, 5), rng.randint(1, 5), rng.randint(1, 5)),
+                'comments': int(comments_per_task) + (rng.random() < comments_per_task % 1),
+                'comment_seed': rng.getrandbits(32),
+            }
+
+    def tasks(self) -> Iterator[tuple]:
+        for task in self._tasks():
+            yield (
+                task['id'], self.layout.company_id(task['company']),
+                task['owner_id'], task['target_id'], task['start_date'], task['end_date'],
+                f'Задача {task["id"]}', 'Синтетическая задача', task['status']
+            )
+
+    def comments(self) -> Iterator[tuple]:
+        comment_id = self.layout.offsets['comment']
+        for task in self._tasks():
+            rng = random.Random(task['comment_seed'])
+            for _ in range(task['comments']):
+                comment_id += 1
+                author = rng.choice((
+                    task['owner_id'], task['target_id'],
+                    self.layout.random_user(rng, task['company'])
+                ))
+                yield (comment_id, author, task['id'], f'Комментарий {comment_id}')
+
+    def ratings(self) -> Iterator[tuple]:
+        rating_id = self.layout.offsets['rating']
+        for task in self._tasks():
+            if task['rated']:
+                rating_id += 1
+                yield (
+                    rating_id, task['id'], task['target_id'], task['owner_id'],
+                    *task['scores'], task['end_date']
+                )
+
+    def _meetings(self) -> Iterator[dict]:
+        rng = self.rng('meeting')
+        #   у каждой компании свой счетчик слотов: встречи компании не
+        #   пересекаются по времени, поэтому участники не нарушают uix_user_datetime
+        days = self.span + 60
+        capacity = days * MEETING_SLOTS
+        stride = next(s for s in range(capacity // 2 + 1, capacity) if _coprime(s, capacity))
+        used = [0] * self.layout.companies
+        shift = [rng.randrange(capacity) for _ in range(self.layout.companies)]
+
+        for j in range(self.args.meetings):
+            c = self.layout.random_company(rng)
+            if used[c] >= capacity:
+                raise SystemExit('Слишком много встреч на компанию: увеличьте --quarters')
+            slot = (shift[c] + used[c] * stride) % capacity
+            used[c] += 1
+
+            size = self.layout.sizes[c]
+            count = min(size, max(1, rng.randint(self.args.participants // 2, self.args.participants * 3 // 2)))
+            yield {
+                'id': self.layout.offsets['meeting'] + 1 + j,
+                'company': c,
+                'organizer_id': self.layout.random_manager(rng, c),
+                'date': self.first_day + datetime.timedelta(days=slot // MEETING_SLOTS),
+                'time': datetime.time(8 + slot % MEETING_SLOTS // 2, 30 * (slot % 2)),
+                'participants': [
+                    self.layout.user_start[c] + i for i in rng.sample(range(size), count)
+                ],
+            }
+
+    def meetings(self) -> Iterator[tuple]:
+        for meeting in self._meetings():
+            yield (
+                meeting['id'], meeting['organizer_id'],
+                self.layout.company_id(meeting['company']),
+                f'Встреча {meeting["id"]}', 'Синтетическая встреча',
+                meeting['date'], meeting['time']
+            )
+
+    def calendar(self) -> Iterator[tuple]:
+        calendar_id = self.layout.offsets['calendar']
+        for task in self._tasks():
+            calendar_id += 1
+            yield (
+                calendar_id, task['target_id'], task['end_date'], None,
+                f'Задача {task["id"]}', 'task', task['id'], None
+            )
+        for meeting in self._meetings():
+            for user_id in meeting['participants']:
+                calendar_id += 1
+                yield (
+                    calendar_id, user_id, meeting['date'], meeting['time'],
+                    f'Встреча {meeting["id"]}', 'meeting', None, meeting['id']
+                )
+
+    def news(self) -> Iterator[tuple]:
+        rng = self.rng('news')
+        for n in range(self.args.news):
+            c = self.layout.random_company(rng)
+            news_id = self.layout.offsets['news'] + 1 + n
+            yield (
+                news_id, self.layout.random_manager(rng, c), self.layout.company_id(c),
+                f'Новость {news_id}', 'Синтетическая новость'
+            )
+
+
+def _coprime(a: int, b: int) -> bool:
+    while b:
+        a, b = b, a % b
+    return a == 1
+
+
+#   порядок загрузки: родительские таблицы раньше зависимых
+COPY_PLAN = (
+    ('company', 'companies', ('id', 'name', 'description', 'company_code', 'admin_code')),
+    ('department', 'departments', ('id', 'name', 'company_id', 'head_user_id')),
+    ('user', 'users', (
+        'id', 'first_name', 'last_name', 'company_role', 'company_id', 'department_id',
+        'email', 'hashed_password', 'is_active', 'is_superuser', 'is_verified'
+    )),
+    ('task', 'tasks', (
+        'id', 'company_id', 'owner_id', 'target_id', 'start_date', 'end_date',
+        'title', 'description', 'status'
+    )),
+    ('comment', 'comments', ('id', 'author_id', 'task_id', 'description')),
+    ('rating', 'ratings', (
+        'id', 'task_id', 'owner_id', 'head_id',
+        'score_date', 'score_quality', 'score_complete', 'created_at'
+    )),
+    ('meeting', 'meetings', (
+        'id', 'organizer_id', 'company_id', 'title', 'description',
+        'meeting_date', 'meeting_time'
+    )),
+    ('calendar', 'calendar', (
+        'id', 'user_id', 'event_date', 'event_time', 'title', 'type_event',
+        'task_id', 'meeting_id'
+    )),
+    ('news', 'news', ('id', 'owner_id', 'company_id', 'title', 'description')),
+)
+
+#   пересчет rating_rollup по всем оценкам (как python -m rating.rollup)
+ROLLUP_REBUILD = (
+    'DELETE FROM rating_rollup',
+    """
+    INSERT INTO rating_rollup (
+        owner_id, year, quarter, rating_count, sum_date, sum_quality, sum_complete
+    )
+    SELECT
+        owner_id,
+        CAST(EXTRACT(year FROM created_at) AS INTEGER),
+        CAST(EXTRACT(quarter FROM created_at) AS INTEGER),
+        count(id), sum(score_date), sum(score_quality), sum(score_complete)
+    FROM rating
+    GROUP BY 1, 2, 3
+    """,
+)
+
+
+async def main(args):
+    setting = get_setting()
+    conn = await asyncpg.connect(setting.DB_POSTGRES_URL.replace('+asyncpg', ''))
+
+    try:
+        offsets = {
+            table: await conn.fetchval(f'SELECT coalesce(max(id), 0) FROM "{table}"')
+            for table in TABLES
+        }
+        layout = Layout(args.companies, args.users, offsets)
+        generator = Generator(args, layout, PasswordHelper().hash(PASSWORD))
+
+        async with conn.transaction():
+            #   руководитель отдела ссылается на пользователя, который грузится позже
+            await conn.execute('SET CONSTRAINTS ALL DEFERRED')
+            for table, method, columns in COPY_PLAN:
+                start = time.perf_counter()
+                result = await conn.copy_records_to_table(
+                    table, records=getattr(generator, method)(), columns=columns
+                )
+                print(f'{table:12}{result:>24}{time.perf_counter() - start:>10.1f} s')
+
+            start = time.perf_counter()
+            for statement in ROLLUP_REBUILD:
+                result = await conn.execute(statement)
+            print(f'{"rating_rollup":12}{result:>24}{time.perf_counter() - start:>10.1f} s')
+
+        for table in TABLES:
+            await conn.execute(
+                f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+                f'coalesce(max(id), 0) + 1, false) FROM "{table}"'
+            )
+        await conn.execute('ANALYZE')
+    finally:
+        await conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Генератор синтетических данных')
+    parser.add_argument('--companies', type=int, default=10)
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--tasks', type=int, default=5000)
+    parser.add_argument('--comments', type=int, default=5000)
+    parser.add_argument('--meetings', type=int, default=500)
+    parser.add_argument('--participants', type=int, default=8, help='в среднем на встречу')
+    parser.add_argument('--news', type=int, default=200)
+    parser.add_argument('--quarters', type=int, default=4, help='глубина истории')
+    parser.add_argument('--rated', type=float, default=0.7, help='доля оцененных задач')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument(
+        '--today', type=datetime.date.fromisoformat, default=datetime.date.today(),
+        help='опорная дата (YYYY-MM-DD) для воспроизводимости между днями'
+    )
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,20 @@
+"""
+    Нагрузочное тестирование API и Jinja-страниц.
+
+    Пакет заполняет локальную БД тестовыми компаниями, поднимает main.app
+    (в процессе через ASGI или по адресу запущенного сервера) и прогоняет
+    сценарии через httpx.AsyncClient:
+        login      - вход в систему (POST /login)
+        dashboard  - обновление главной страницы (GET /)
+        tasks      - создание задачи с записью в календарь
+        invites    - приглашения на встречи
+        calendar   - просмотр месячного календаря
+
+    Запуск из корня проекта на отдельной БД из .env:
+        python -m benchmarks.loadtest --companies 20 --users 25 --concurrency 50
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
\ No newline at end of file
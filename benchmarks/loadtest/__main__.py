@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import datetime
+import json
+import os
+
+import httpx
+
+from main import app
+from database import db
+from benchmarks.loadtest.seed import seed, load_fixtures
+from benchmarks.loadtest.scenarios import SCENARIOS, UserPool
+from benchmarks.loadtest.runner import run_scenario
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'results')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Нагрузочное тестирование')
+    parser.add_argument('--companies', type=int, default=10)
+    parser.add_argument('--users', type=int, default=20, help='пользователей в компании')
+    parser.add_argument('--meetings', type=int, default=30, help='встреч в компании')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--requests', type=int, default=500, help='операций на сценарий')
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--base-url', help='адрес запущенного сервера вместо main.app')
+    parser.add_argument('--output', help='файл JSON с результатами')
+    return parser.parse_args()
+
+def print_report(results: dict) -> None:
+    print(
+        f'{"scenario":12}{"req/s":>9}{"p50, ms":>10}{"p95, ms":>10}'
+        f'{"p99, ms":>10}{"queries":>9}{"errors":>8}'
+    )
+    for name, r in results.items():
+        queries = '-' if r['queries_per_request'] is None else f'{r["queries_per_request"]:.1f}'
+        print(
+            f'{name:12}{r["throughput_rps"]:>9.1f}{r["p50_ms"]:>10.1f}{r["p95_ms"]:>10.1f}'
+            f'{r["p99_ms"]:>10.1f}{queries:>9}{r["errors"]:>8}'
+        )
+
+async def main(args):
+    db.engine.sync_engine.echo = False
+    await seed(args.companies, args.users, args.meetings, args.seed)
+    users = UserPool(await load_fixtures())
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+    else:
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        client = httpx.AsyncClient(transport=transport, base_url='http://loadtest', timeout=60)
+
+    results = {}
+    async with client:
+        for name in args.scenarios:
+            results[name] = await run_scenario(
+                client, SCENARIOS[name], users,
+                args.requests, args.concurrency, args.seed
+            )
+
+    await db.engine.dispose()
+    print_report(results)
+
+    started = datetime.datetime.now()
+    output = args.output or os.path.join(
+        RESULTS_DIR, f'loadtest-{started:%Y%m%d-%H%M%S}.json'
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(
+            {
+                'started_at': started.isoformat(timespec='seconds'),
+                'config': vars(args),
+                'results': results,
+            },
+            file, ensure_ascii=False, indent=2
+        )
+    print(f'\nрезультаты: {output}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main(parse_args()))
\ No newline at end of file
@@ -0,0 +1,61 @@
+import asyncio
+import random
+import re
+import statistics
+import time
+from collections import Counter
+
+import httpx
+
+from benchmarks.loadtest.scenarios import Scenario, UserPool
+
+
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+#   перцентиль по отсортированному списку
+def percentile(values: list[float], q: float) -> float:
+    index = min(int(round(q / 100 * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+#   прогон сценария: requests операций в concurrency параллельных клиентов
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, users: UserPool,
+    requests: int, concurrency: int, seed: int
+) -> dict:
+    timings, queries = [], []
+    statuses: Counter[int] = Counter()
+    remaining = requests
+
+    async def worker(worker_id: int):
+        nonlocal remaining
+        rng = random.Random(seed * 1000 + worker_id)
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await scenario(client, users, rng)
+            timings.append((time.perf_counter() - start) * 1000)
+            statuses[response.status_code] += 1
+
+            match = SERVER_TIMING_QUERIES.search(response.headers.get('server-timing', ''))
+            if match:
+                queries.append(int(match.group(1)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    timings.sort()
+    return {
+        'requests': len(timings),
+        'concurrency': concurrency,
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(len(timings) / elapsed, 1),
+        'p50_ms': round(percentile(timings, 50), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'p99_ms': round(percentile(timings, 99), 2),
+        'mean_ms': round(statistics.fmean(timings), 2),
+        'queries_per_request': round(statistics.fmean(queries), 2) if queries else None,
+        'errors': sum(n for code, n in statuses.items() if code >= 500),
+        'statuses': {str(code): n for code, n in sorted(statuses.items())},
+    }
\ No newline at end of file
@@ -0,0 +1,84 @@
+import datetime
+import random
+from typing import Awaitable, Callable
+
+import httpx
+
+from users.models import User
+from users.config_token import get_jwt_strategy, cookie_transport
+from benchmarks.loadtest.seed import CompanyFixture, PASSWORD
+
+
+#   сценарий: одна операция пользователя, возвращает ответ сервера
+Scenario = Callable[
+    [httpx.AsyncClient, 'UserPool', random.Random], Awaitable[httpx.Response]
+]
+
+
+#   авторизация пользователей сценариев без хеширования паролей
+class UserPool:
+    def __init__(self, companies: list[CompanyFixture]):
+        self.companies = companies
+        self._cookies: dict[int, dict] = {}
+
+    async def cookies(self, user: dict) -> dict:
+        if user['id'] not in self._cookies:
+            token = await get_jwt_strategy().write_token(User(id=user['id']))
+            self._cookies[user['id']] = {cookie_transport.cookie_name: token}
+        return self._cookies[user['id']]
+
+    def company(self, rng: random.Random) -> CompanyFixture:
+        return rng.choice(self.companies)
+
+
+async def login(client, users, rng):
+    user = rng.choice(users.company(rng).users)
+    return await client.post(
+        '/login', data={'username': user['email'], 'password': PASSWORD}
+    )
+
+async def dashboard(client, users, rng):
+    user = rng.choice(users.company(rng).users)
+    return await client.get('/', cookies=await users.cookies(user))
+
+async def tasks(client, users, rng):
+    company = users.company(rng)
+    owner = rng.choice(company.managers)
+    start = datetime.date.today() + datetime.timedelta(days=rng.randint(0, 30))
+    return await client.post(
+        '/companies/tasks',
+        json={
+            'target_id': rng.choice(company.users)['id'],
+            'start_date': start.isoformat(),
+            'end_date': (start + datetime.timedelta(days=rng.randint(1, 14))).isoformat(),
+            'title': f'Задача {rng.randint(1, 10 ** 6)}',
+            'description': 'Нагрузочный тест',
+        },
+        cookies=await users.cookies(owner)
+    )
+
+async def invites(client, users, rng):
+    company = users.company(rng)
+    organizer = rng.choice(company.managers)
+    return await client.post(
+        f'/meeting/{rng.choice(company.meetings)}/participants',
+        params={'user_id': rng.choice(company.users)['id']},
+        cookies=await users.cookies(organizer)
+    )
+
+async def calendar(client, users, rng):
+    user = rng.choice(users.company(rng).users)
+    month = datetime.date.today() + datetime.timedelta(days=rng.randint(0, 60))
+    return await client.get(
+        '/calendar/my/month', params={'year': month.year, 'month': month.month},
+        cookies=await users.cookies(user)
+    )
+
+
+SCENARIOS: dict[str, Scenario] = {
+    'login': login,
+    'dashboard': dashboard,
+    'tasks': tasks,
+    'invites': invites,
+    'calendar': calendar,
+}
\ No newline at end of file
@@ -0,0 +1,133 @@
+import datetime
+import random
+
+from sqlalchemy import func, insert, select
+
+from database import db
+from company.models.company import Company
+from users.models import User, RoleType
+from meeting.models import Meeting
+from core.hashing import password_pool
+
+
+PASSWORD = 'loadtest-password'
+COMPANY_NAME = 'loadtest-{}'
+EMAIL = 'lt-{}-{}@load.test'
+
+
+#   тестовые данные одной компании для сценариев
+class CompanyFixture:
+    def __init__(self, company_id: int, users: list[dict], meetings: list[int]):
+        self.id = company_id
+        self.users = users
+        self.meetings = meetings
+
+    @property
+    def managers(self) -> list[dict]:
+        return [u for u in self.users if u['company_role'] != RoleType.employee]
+
+
+#   заполнение БД: компании, пользователи (админ, менеджер, сотрудники), встречи
+async def seed(companies: int, users: int, meetings: int, seed_value: int) -> None:
+    rng = random.Random(seed_value)
+    hashed_password = await password_pool.hash(PASSWORD)
+    today = datetime.date.today()
+
+    async with db.session() as session:
+        exists = await session.scalar(
+            select(Company.id).where(Company.name == COMPANY_NAME.format(0))
+        )
+        if exists:
+            await check_seeded(session, companies, users, meetings)
+            return
+
+        for c in range(companies):
+            company_id = await session.scalar(
+                insert(Company).returning(Company.id).values(
+                    name=COMPANY_NAME.format(c),
+                    description='Компания для нагрузочного теста',
+                    company_code=f'{c:04d}',
+                    admin_code=f'A{c:05d}'
+                )
+            )
+            roles = [RoleType.admin, RoleType.manager] + [RoleType.employee] * (users - 2)
+            user_ids = (await session.scalars(
+                insert(User).returning(User.id, sort_by_parameter_order=True),
+                [
+                    {
+                        'first_name': 'Load', 'last_name': f'Test {u}',
+                        'email': EMAIL.format(c, u), 'hashed_password': hashed_password,
+                        'company_id': company_id, 'company_role': role,
+                    }
+                    for u, role in enumerate(roles)
+                ]
+            )).all()
+            await session.execute(
+                insert(Meeting),
+                [
+                    {
+                        'organizer_id': rng.choice(user_ids[:2]),
+                        'company_id': company_id,
+                        'title': f'Встреча {m}',
+                        'description': 'Нагрузочный тест',
+                        'meeting_date': today + datetime.timedelta(days=rng.randint(1, 60)),
+                        'meeting_time': datetime.time(rng.randint(8, 19), rng.choice((0, 30))),
+                    }
+                    for m in range(meetings)
+                ]
+            )
+
+        await session.commit()
+
+#   сверка уже заполненной БД с запрошенным масштабом: сценарии не создают
+#   компаний, пользователей и встреч, поэтому их число задает масштаб прогона
+async def check_seeded(session, companies: int, users: int, meetings: int) -> None:
+    company_ids = (await session.execute(
+        select(Company.id).where(Company.name.like(COMPANY_NAME.format('%')))
+    )).scalars().all()
+    user_counts = dict((await session.execute(
+        select(User.company_id, func.count()).where(User.company_id.in_(company_ids))
+        .group_by(User.company_id)
+    )).all())
+    meeting_counts = dict((await session.execute(
+        select(Meeting.company_id, func.count()).where(Meeting.company_id.in_(company_ids))
+        .group_by(Meeting.company_id)
+    )).all())
+
+    seeded = (
+        len(company_ids),
+        set(user_counts.get(c, 0) for c in company_ids),
+        set(meeting_counts.get(c, 0) for c in company_ids),
+    )
+    if seeded != (companies, {users}, {meetings}):
+        raise SystemExit(
+            f'БД уже заполнена с другим масштабом: компаний {seeded[0]}, '
+            f'пользователей в компании {sorted(seeded[1])}, встреч {sorted(seeded[2])}; '
+            f'запрошено {companies}/{users}/{meetings}. '
+            'Пересоздайте тестовую БД или запустите с прежними параметрами'
+        )
+
+#   чтение тестовых компаний из БД
+async def load_fixtures() -> list[CompanyFixture]:
+    async with db.session() as session:
+        companies = (await session.execute(
+            select(Company.id).where(Company.name.like(COMPANY_NAME.format('%')))
+            .order_by(Company.id)
+        )).scalars().all()
+        users = (await session.execute(
+            select(User.id, User.email, User.company_id, User.company_role)
+            .where(User.company_id.in_(companies))
+            .order_by(User.id)
+        )).mappings().all()
+        meetings = (await session.execute(
+            select(Meeting.id, Meeting.company_id).where(Meeting.company_id.in_(companies))
+        )).all()
+
+    return [
+        CompanyFixture(
+            company_id,
+            [dict(u) for u in users if u['company_id'] == company_id],
+            [m.id for m in meetings if m.company_id == company_id]
+        )
+        for company_id in companies
+    ]
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+    Бенчмарк входа в систему: пропускная способность POST /login и задержка
+    цикла событий при одновременных входах.
+
+    Скрипт создает пользователей bench-login-N@example.com с общим паролем,
+    выполняет входы через ASGI-приложение и удаляет пользователей.
+    Сравнение режимов - запуском с разным числом потоков хеширования:
+        PASSWORD_HASH_WORKERS=0 python benchmarks/logins.py --concurrency 100
+        PASSWORD_HASH_WORKERS=4 python benchmarks/logins.py --concurrency 100
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+import httpx
+from sqlalchemy import delete
+
+from main import app
+from database import db
+from users.models import User
+from core.hashing import password_pool
+
+
+PASSWORD = 'bench-password'
+EMAIL = 'bench-login-{}@example.com'
+
+
+#   замер задержки цикла событий: насколько позже срабатывает таймер
+class LagMonitor:
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.lags = []
+        self._task = None
+
+    async def _tick(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append((loop.time() - start - self.interval) * 1000)
+
+    def start(self):
+        self._task = asyncio.create_task(self._tick())
+
+    async def stop(self):
+        #   даем таймеру сработать после последней блокировки цикла
+        await asyncio.sleep(self.interval * 2)
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+async def create_users(count):
+    hashed_password = await password_pool.hash(PASSWORD)
+    async with db.session() as session:
+        session.add_all(
+            User(
+                first_name='Bench', last_name=str(i), email=EMAIL.format(i),
+                hashed_password=hashed_password
+            )
+            for i in range(count)
+        )
+        await session.commit()
+
+async def delete_users():
+    async with db.session() as session:
+        await session.execute(delete(User).where(User.email.like(EMAIL.format('%'))))
+        await session.commit()
+
+async def main(concurrency, rounds):
+    db.engine.sync_engine.echo = False
+    await delete_users()
+    await create_users(concurrency)
+
+    timings, failed = [], 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+        async def login(i):
+            nonlocal failed
+            start = time.perf_counter()
+            response = await client.post(
+                '/login', data={'username': EMAIL.format(i), 'password': PASSWORD}
+            )
+            timings.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 302:
+                failed += 1
+
+        monitor = LagMonitor()
+        monitor.start()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            await asyncio.gather(*(login(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        await monitor.stop()
+
+    await delete_users()
+    await db.engine.dispose()
+
+    lags = monitor.lags or [0.0]
+    print(f'password workers: {password_pool.workers}, max queue depth: {password_pool.max_queue_depth}')
+    print(f'logins: {len(timings)}, failed: {failed}, logins/s: {len(timings) / elapsed:.1f}')
+    print(
+        f'login p50: {statistics.median(timings):.1f} ms, '
+        f'p95: {statistics.quantiles(timings, n=20)[18]:.1f} ms'
+    )
+    print(f'event loop lag p50: {statistics.median(lags):.1f} ms, max: {max(lags):.1f} ms')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Бенчмарк входа в систему')
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.concurrency, args.rounds))
@@ -0,0 +1,163 @@
+"""
+    Бенчмарк аналитики оценок: RatingService.get_analytics (один запрос,
+    колонки в NumPy) против такой же статистики по отделам, посчитанной
+    только в SQL (GROUP BY, FILTER, percentile_cont, lag).
+
+    Запуск из корня проекта (нужна заполненная БД из .env), например
+    около 1M оценок у одной компании:
+        python benchmarks/generator.py --companies 1 --users 5000 \\
+            --tasks 2000000 --comments 0 --meetings 0 --news 0 --quarters 4
+        python benchmarks/rating_analytics.py --rounds 5
+"""
+
+import argparse
+import asyncio
+import datetime
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from sqlalchemy import func, select, text
+
+from database import db
+from users.models import User
+from tasks.models.comment import Comment
+from rating.models import Rating
+from rating.analytics import PERCENTILES, SCORE_LEVELS, SCORE_NAMES
+from rating.service import RatingService
+
+
+#   гистограммы оценок: count(*) FILTER для каждого значения
+HISTOGRAMS = ',\n'.join(
+    f'ARRAY[{", ".join(f"count(*) FILTER (WHERE score_{name} = {level})" for level in range(1, SCORE_LEVELS + 1))}]'
+    f' AS histogram_{name}'
+    for name in SCORE_NAMES
+)
+
+SQL_ANALYTICS = text(f"""
+WITH scores AS (
+    SELECT
+        coalesce(u.department_id, 0) AS department_id, r.owner_id,
+        CAST(EXTRACT(quarter FROM r.created_at) AS INTEGER) AS quarter,
+        r.score_date, r.score_quality, r.score_complete,
+        (r.score_date + r.score_quality + r.score_complete) / 3.0 AS total
+    FROM rating r JOIN "user" u ON u.id = r.owner_id
+    WHERE u.company_id = :company_id
+        AND r.created_at >= :date_from AND r.created_at < :date_to
+),
+employees AS (
+    SELECT department_id, owner_id, avg(total) AS avg_total
+    FROM scores GROUP BY department_id, owner_id
+),
+percentiles AS (
+    SELECT
+        department_id, count(*) AS employee_count,
+        percentile_cont(ARRAY[{", ".join(str(p / 100) for p in PERCENTILES)}])
+            WITHIN GROUP (ORDER BY avg_total) AS percentiles
+    FROM employees GROUP BY department_id
+),
+quarters AS (
+    SELECT
+        department_id, quarter, count(*) AS rating_count, avg(total) AS avg_total,
+        CASE WHEN lag(quarter) OVER w = quarter - 1
+            THEN avg(total) - lag(avg(total)) OVER w END AS delta
+    FROM scores GROUP BY department_id, quarter
+    WINDOW w AS (PARTITION BY department_id ORDER BY quarter)
+),
+summary AS (
+    SELECT
+        department_id, count(*) AS rating_count, avg(total) AS avg_total,
+        avg(score_date) AS mean_date, avg(score_quality) AS mean_quality,
+        avg(score_complete) AS mean_complete,
+        {HISTOGRAMS}
+    FROM scores GROUP BY department_id
+)
+SELECT
+    s.*, p.employee_count, p.percentiles,
+    (
+        SELECT json_agg(json_build_object(
+            'quarter', q.quarter, 'rating_count', q.rating_count,
+            'avg_total', q.avg_total, 'delta', q.delta
+        ) ORDER BY q.quarter)
+        FROM quarters q WHERE q.department_id = s.department_id
+    ) AS quarters
+FROM summary s JOIN percentiles p USING (department_id)
+ORDER BY s.department_id
+""")
+
+
+#   та же статистика по отделам только средствами SQL
+async def sql_analytics(session, company_id, year):
+    result = await session.execute(SQL_ANALYTICS, {
+        'company_id': company_id,
+        'date_from': datetime.date(year, 1, 1),
+        'date_to': datetime.date(year + 1, 1, 1),
+    })
+    return result.mappings().all()
+
+#   статистика по отделам через NumPy
+async def numpy_analytics(session, company_id, year):
+    return (await RatingService().get_analytics(session, company_id, year)).departments
+
+async def measure(loader, company_id, year, rounds):
+    timings, result = [], None
+    for _ in range(rounds):
+        async with db.session() as session:
+            start = time.perf_counter()
+            result = await loader(session, company_id, year)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    return result, {'p50_ms': statistics.median(timings), 'min_ms': min(timings)}
+
+async def main(company_id, year, rounds):
+    db.engine.sync_engine.echo = False
+
+    async with db.session() as session:
+        if company_id is None:
+            query = (
+                select(User.company_id)
+                .join(Rating, Rating.owner_id == User.id)
+                .where(
+                    User.company_id.is_not(None),
+                    Rating.created_at >= datetime.date(year, 1, 1),
+                    Rating.created_at < datetime.date(year + 1, 1, 1)
+                )
+                .group_by(User.company_id)
+                .order_by(func.count().desc())
+                .limit(1)
+            )
+            company_id = (await session.execute(query)).scalar()
+        if company_id is None:
+            raise SystemExit(f'Нет оценок за {year} год')
+
+    sql_result, sql_timing = await measure(sql_analytics, company_id, year, rounds)
+    numpy_result, numpy_timing = await measure(numpy_analytics, company_id, year, rounds)
+
+    #   результаты должны совпадать
+    for sql_row, numpy_row in zip(sql_result, numpy_result, strict=True):
+        assert sql_row['rating_count'] == numpy_row.rating_count
+        assert abs(float(sql_row['avg_total']) - numpy_row.avg_total) < 1e-3
+        assert sql_row['histogram_date'] == numpy_row.scores['date'].histogram
+        for value, expected in zip(numpy_row.percentiles.values(), sql_row['percentiles']):
+            assert abs(value - expected) < 1e-3
+
+    ratings = sum(row.rating_count for row in numpy_result)
+    print(f'company {company_id}, year {year}: {ratings} ratings, {len(numpy_result)} departments')
+    print(f'{"":8}{"p50, ms":>10}{"min, ms":>10}')
+    for name, timing in (('sql', sql_timing), ('numpy', numpy_timing)):
+        print(f'{name:8}{timing["p50_ms"]:>10.1f}{timing["min_ms"]:>10.1f}')
+
+    await db.engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Бенчмарк аналитики оценок')
+    parser.add_argument('--company', type=int, default=None, help='по умолчанию - компания с наибольшим числом оценок')
+    parser.add_argument('--year', type=int, default=datetime.date.today().year)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.company, args.year, args.rounds))
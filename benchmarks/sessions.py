@@ -0,0 +1,140 @@
+"""
+    Нагрузочный тест пула соединений: сколько запросов в секунду выдерживает
+    авторизованный эндпоинт до исчерпания пула.
+
+    Сравниваются два режима:
+        separate - пользователь проверяется в отдельной сессии (своё
+                   соединение у fastapi-users и своё у эндпоинта)
+        shared   - одна сессия на запрос (get_session через request.state)
+
+    Запуск из корня проекта (нужна заполненная БД из .env; короткий
+    DB_POOL_TIMEOUT быстрее показывает исчерпание пула):
+        DB_POOL_TIMEOUT=2 python benchmarks/sessions.py --levels 10 25 50 100
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+import httpx
+from fastapi_users.db import SQLAlchemyUserDatabase
+from sqlalchemy import event, select
+
+from main import app
+from database import db
+from users.models import User
+from users.manager import get_user_db
+from users.config_token import get_jwt_strategy, cookie_transport
+
+
+#   проверка пользователя в собственной сессии - поведение до изменения
+async def separate_user_db():
+    async with db.session() as session:
+        yield SQLAlchemyUserDatabase(session, User)
+
+
+#   счетчик занятых соединений пула
+class PoolMonitor:
+    def __init__(self, engine):
+        self.checked_out = 0
+        self.peak = 0
+        event.listen(engine.sync_engine, 'checkout', self._on_checkout)
+        event.listen(engine.sync_engine, 'checkin', self._on_checkin)
+
+    def reset(self):
+        self.peak = self.checked_out
+
+    def _on_checkout(self, *args):
+        self.checked_out += 1
+        self.peak = max(self.peak, self.checked_out)
+
+    def _on_checkin(self, *args):
+        self.checked_out -= 1
+
+
+async def get_cookies(users_limit):
+    async with db.session() as session:
+        query = select(User).where(User.is_active).order_by(User.id).limit(users_limit)
+        users = (await session.execute(query)).scalars().all()
+
+    if not users:
+        raise SystemExit('В БД нет активных пользователей для теста')
+
+    strategy = get_jwt_strategy()
+    return [
+        {cookie_transport.cookie_name: await strategy.write_token(user)}
+        for user in users
+    ]
+
+#   прогон одного уровня конкуренции
+async def run_level(client, path, cookies, concurrency, requests, monitor):
+    timings, errors = [], 0
+    queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(cookies[i % len(cookies)])
+
+    async def worker():
+        nonlocal errors
+        while not queue.empty():
+            cookie = queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.get(path, cookies=cookie)
+            timings.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 500:
+                errors += 1
+
+    monitor.reset()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        'rps': requests / elapsed,
+        'p95_ms': statistics.quantiles(timings, n=20)[18],
+        'errors': errors,
+        'peak_connections': monitor.peak,
+    }
+
+async def main(path, levels, requests, users_limit):
+    db.engine.sync_engine.echo = False
+    monitor = PoolMonitor(db.engine)
+    cookies = await get_cookies(users_limit)
+    pool = db.engine.pool
+    print(f'pool: size={pool.size()} overflow={pool._max_overflow} timeout={pool.timeout()}s')
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+        for mode in ('separate', 'shared'):
+            if mode == 'separate':
+                app.dependency_overrides[get_user_db] = separate_user_db
+            else:
+                app.dependency_overrides.pop(get_user_db, None)
+
+            print(f'\n{mode}')
+            print(f'{"clients":>8}{"req/s":>10}{"p95, ms":>10}{"errors":>8}{"peak conn":>11}')
+            for concurrency in levels:
+                result = await run_level(
+                    client, path, cookies, concurrency, requests, monitor
+                )
+                print(
+                    f'{concurrency:>8}{result["rps"]:>10.1f}{result["p95_ms"]:>10.2f}'
+                    f'{result["errors"]:>8}{result["peak_connections"]:>11}'
+                )
+
+    await db.engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Нагрузочный тест пула соединений')
+    parser.add_argument('--path', default='/users/me/ratings/average')
+    parser.add_argument('--levels', type=int, nargs='+', default=[5, 10, 15, 25, 50, 100])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--users', type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.path, args.levels, args.requests, args.users))
@@ -16,9 +16,9 @@ from users.models import User
 from news.models import News
 from tasks.models.task import Task
 from tasks.models.comment import Comment
-from rating.models import Rating
+from rating.models import Rating, RatingRollup
 from calendars.models import Calendar
-from meeting.models import Meeting
+from meeting.models import Meeting, MeetingException
 from config import get_setting
 from database import Base
 
@@ -0,0 +1,38 @@
+"""keyset pagination indexes
+
+Revision ID: 7c1f0d4a9b2e
+Revises: 31cda2386525
+Create Date: 2026-10-18 10:12:40.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1f0d4a9b2e'
+down_revision: Union[str, None] = '31cda2386525'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_user_company_last_name', 'user', ['company_id', 'last_name', 'id'], unique=False)
+    op.create_index('idx_news_company_id_id', 'news', ['company_id', 'id'], unique=False)
+    op.create_index('idx_meeting_organizer_datetime', 'meeting', ['organizer_id', 'meeting_date', 'meeting_time', 'id'], unique=False)
+    op.create_index('idx_rating_owner_created', 'rating', ['owner_id', 'created_at', 'id'], unique=False)
+    op.create_index('idx_task_target_end', 'task', ['target_id', 'end_date', 'id'], unique=False)
+    op.create_index('idx_task_owner_end', 'task', ['owner_id', 'end_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_task_owner_end', table_name='task')
+    op.drop_index('idx_task_target_end', table_name='task')
+    op.drop_index('idx_rating_owner_created', table_name='rating')
+    op.drop_index('idx_meeting_organizer_datetime', table_name='meeting')
+    op.drop_index('idx_news_company_id_id', table_name='news')
+    op.drop_index('idx_user_company_last_name', table_name='user')
@@ -0,0 +1,55 @@
+"""recurring meetings
+
+Revision ID: a3e5b7c9d1f4
+Revises: 7c1f0d4a9b2e
+Create Date: 2026-10-18 15:42:07.531904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e5b7c9d1f4'
+down_revision: Union[str, None] = '7c1f0d4a9b2e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    recurrence_freq = sa.Enum('daily', 'weekly', name='recurrencefreq')
+    recurrence_freq.create(op.get_bind(), checkfirst=True)
+
+    op.add_column('meeting', sa.Column('recurrence_freq', recurrence_freq, nullable=True))
+    op.add_column('meeting', sa.Column('recurrence_interval', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('meeting', sa.Column('recurrence_until', sa.Date(), nullable=True))
+    op.add_column('calendar', sa.Column('event_until', sa.Date(), nullable=True))
+    op.create_index(
+        'idx_calendar_user_until', 'calendar', ['user_id', 'event_until'], unique=False,
+        postgresql_where=sa.text('event_until IS NOT NULL')
+    )
+    op.create_table('meeting_exception',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('meeting_id', sa.Integer(), nullable=False),
+    sa.Column('occurrence_date', sa.Date(), nullable=False),
+    sa.Column('cancelled', sa.Boolean(), nullable=False),
+    sa.Column('meeting_date', sa.Date(), nullable=True),
+    sa.Column('meeting_time', sa.Time(), nullable=True),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meeting.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('meeting_id', 'occurrence_date', name='uix_meeting_occurrence')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('meeting_exception')
+    op.drop_index('idx_calendar_user_until', table_name='calendar')
+    op.drop_column('calendar', 'event_until')
+    op.drop_column('meeting', 'recurrence_until')
+    op.drop_column('meeting', 'recurrence_interval')
+    op.drop_column('meeting', 'recurrence_freq')
+    sa.Enum(name='recurrencefreq').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,53 @@
+"""rating rollup
+
+Revision ID: b8d2f4a6c0e1
+Revises: a3e5b7c9d1f4
+Create Date: 2026-10-18 16:05:12.480117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f4a6c0e1'
+down_revision: Union[str, None] = 'a3e5b7c9d1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('rating_rollup',
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('quarter', sa.Integer(), nullable=False),
+    sa.Column('rating_count', sa.Integer(), nullable=False),
+    sa.Column('sum_date', sa.Integer(), nullable=False),
+    sa.Column('sum_quality', sa.Integer(), nullable=False),
+    sa.Column('sum_complete', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('owner_id', 'year', 'quarter', name='pk_rating_rollup')
+    )
+    #   начальное заполнение; повторный пересчет - python -m rating.rollup
+    op.execute(
+        """
+        INSERT INTO rating_rollup (
+            owner_id, year, quarter, rating_count, sum_date, sum_quality, sum_complete
+        )
+        SELECT
+            owner_id,
+            CAST(EXTRACT(year FROM created_at) AS INTEGER),
+            CAST(EXTRACT(quarter FROM created_at) AS INTEGER),
+            count(id), sum(score_date), sum(score_quality), sum(score_complete)
+        FROM rating
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('rating_rollup')
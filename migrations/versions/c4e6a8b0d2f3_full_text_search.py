@@ -0,0 +1,53 @@
+"""full text search
+
+Revision ID: c4e6a8b0d2f3
+Revises: b8d2f4a6c0e1
+Create Date: 2026-10-18 17:40:03.215894
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e6a8b0d2f3'
+down_revision: Union[str, None] = 'b8d2f4a6c0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    #   btree_gin: company_id и tsvector в одном GIN-индексе
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gin')
+
+    op.add_column('task', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(
+        "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('russian', coalesce(description, '')), 'B')",
+        persisted=True
+    ), nullable=True))
+    op.add_column('comment', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(
+        "to_tsvector('russian', description)", persisted=True
+    ), nullable=True))
+    op.add_column('news', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(
+        "setweight(to_tsvector('russian', title), 'A') || "
+        "setweight(to_tsvector('russian', description), 'B')",
+        persisted=True
+    ), nullable=True))
+
+    op.create_index('idx_task_search', 'task', ['company_id', 'search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('idx_comment_search', 'comment', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('idx_news_search', 'news', ['company_id', 'search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_news_search', table_name='news', postgresql_using='gin')
+    op.drop_index('idx_comment_search', table_name='comment', postgresql_using='gin')
+    op.drop_index('idx_task_search', table_name='task', postgresql_using='gin')
+    op.drop_column('news', 'search_vector')
+    op.drop_column('comment', 'search_vector')
+    op.drop_column('task', 'search_vector')
@@ -0,0 +1,31 @@
+"""comment task_id, id index
+
+Revision ID: d5f7a9c1e3b4
+Revises: c4e6a8b0d2f3
+Create Date: 2026-10-18 19:05:27.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f7a9c1e3b4'
+down_revision: Union[str, None] = 'c4e6a8b0d2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    #   последние комментарии задачи и их страницы читаются по (task_id, id)
+    op.create_index('idx_comment_task_id_id', 'comment', ['task_id', 'id'], unique=False)
+    op.drop_index('idx_task_id', table_name='comment')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_task_id', 'comment', ['task_id'], unique=False)
+    op.drop_index('idx_comment_task_id_id', table_name='comment')
@@ -0,0 +1,84 @@
+"""rating rollup delete trigger
+
+Revision ID: e6a8c0d2f4b5
+Revises: d5f7a9c1e3b4
+Create Date: 2026-10-18 21:14:52.730416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a8c0d2f4b5'
+down_revision: Union[str, None] = 'd5f7a9c1e3b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    #   оценки удаляются и каскадом (задача, исполнитель, руководитель):
+    #   суммы кварталов уменьшает триггер, один UPDATE на оператор
+    op.execute(
+        """
+        CREATE FUNCTION rating_rollup_remove() RETURNS trigger AS $$
+        BEGIN
+            UPDATE rating_rollup AS rollup
+            SET
+                rating_count = rollup.rating_count - removed.rating_count,
+                sum_date = rollup.sum_date - removed.sum_date,
+                sum_quality = rollup.sum_quality - removed.sum_quality,
+                sum_complete = rollup.sum_complete - removed.sum_complete
+            FROM (
+                SELECT
+                    owner_id,
+                    CAST(EXTRACT(year FROM created_at) AS INTEGER) AS year,
+                    CAST(EXTRACT(quarter FROM created_at) AS INTEGER) AS quarter,
+                    count(id) AS rating_count,
+                    sum(score_date) AS sum_date,
+                    sum(score_quality) AS sum_quality,
+                    sum(score_complete) AS sum_complete
+                FROM removed_ratings
+                GROUP BY 1, 2, 3
+            ) AS removed
+            WHERE rollup.owner_id = removed.owner_id
+                AND rollup.year = removed.year
+                AND rollup.quarter = removed.quarter;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER rating_rollup_delete
+        AFTER DELETE ON rating
+        REFERENCING OLD TABLE AS removed_ratings
+        FOR EACH STATEMENT EXECUTE FUNCTION rating_rollup_remove()
+        """
+    )
+    #   суммы могли разойтись из-за удаленных ранее пользователей
+    op.execute('TRUNCATE rating_rollup')
+    op.execute(
+        """
+        INSERT INTO rating_rollup (
+            owner_id, year, quarter, rating_count, sum_date, sum_quality, sum_complete
+        )
+        SELECT
+            owner_id,
+            CAST(EXTRACT(year FROM created_at) AS INTEGER),
+            CAST(EXTRACT(quarter FROM created_at) AS INTEGER),
+            count(id), sum(score_date), sum(score_quality), sum(score_complete)
+        FROM rating
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER rating_rollup_delete ON rating')
+    op.execute('DROP FUNCTION rating_rollup_remove()')
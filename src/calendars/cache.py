@@ -0,0 +1,31 @@
+from datetime import date
+from typing import Iterable
+
+from core.cache import VersionedCache
+from config import get_setting
+
+
+setting = get_setting()
+
+#   кэш месячного расписания: ключ - (пользователь, год, месяц),
+#   значение - JSON списка событий
+month_cache = VersionedCache(
+    'calendar_month', setting.CALENDAR_CACHE_TTL,
+    setting.CALENDAR_CACHE_SIZE, setting.CALENDAR_CACHE_MAX_BYTES
+)
+
+
+#   ключ записи месяца, в который попадает событие
+def month_key(user_id: int, event_date: date) -> tuple[int, int, int]:
+    return user_id, event_date.year, event_date.month
+
+#   сброс месяцев, в которых изменились события пользователей
+def invalidate_months(events: Iterable[tuple[int, date]]) -> None:
+    month_cache.invalidate(*{month_key(user_id, event_date) for user_id, event_date in events})
+
+#   сброс всех месяцев пользователей: повторы встречи без окончания
+#   попадают в любой месяц
+def invalidate_user_months(user_ids: Iterable[int]) -> None:
+    user_ids = set(user_ids)
+    if user_ids:
+        month_cache.invalidate_where(lambda key, _: key[0] in user_ids)
\ No newline at end of file
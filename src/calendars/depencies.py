@@ -1,6 +1,12 @@
 from calendars.service import CalendarService
+from calendars.feed import CalendarFeedService
+from database import db
 
 
 #   возврат сервиса календаря
 def get_calendar_service() -> CalendarService:
-    return CalendarService()
\ No newline at end of file
+    return CalendarService()
+
+#   возврат сервиса ленты ICS
+def get_calendar_feed_service() -> CalendarFeedService:
+    return CalendarFeedService(db.session)
\ No newline at end of file
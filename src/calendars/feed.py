@@ -0,0 +1,267 @@
+import base64
+import hashlib
+import hmac
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import AsyncIterator, Iterable, Optional
+
+from sqlalchemy import func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from users.models import User
+from calendars.models import Calendar
+from meeting.models import Meeting, MeetingException, RecurrenceFreq
+from meeting.recurrence import FOREVER
+from config import get_setting
+
+
+setting = get_setting()
+
+#   событий в одной порции серверного курсора и одном куске ответа
+FEED_CHUNK_SIZE = 500
+#   длительность встречи в ленте: время окончания в модели не хранится
+MEETING_DURATION = timedelta(minutes=setting.MEETING_DURATION_MINUTES)
+
+
+#   токен ленты: идентификатор пользователя и HMAC от него на SECRET
+def _signature(user_id: int) -> str:
+    digest = hmac.new(
+        setting.SECRET.encode(), f'calendar-feed:{user_id}'.encode(), hashlib.sha256
+    ).digest()
+    return base64.urlsafe_b64encode(digest).decode()[:32]
+
+def feed_token(user_id: int) -> str:
+    return f'{user_id}.{_signature(user_id)}'
+
+def parse_feed_token(token: str) -> Optional[int]:
+    user_id, _, signature = token.partition('.')
+    if not user_id.isdigit() or not hmac.compare_digest(signature, _signature(int(user_id))):
+        return None
+    return int(user_id)
+
+#   экранирование текста и перенос строк длиннее 75 октетов (RFC 5545)
+def _escape(text: str) -> str:
+    return (
+        text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+        .replace('\r\n', '\\n').replace('\n', '\\n')
+    )
+
+def _fold(line: str) -> str:
+    data = line.encode()
+    if len(data) <= 75:
+        return line + '\r\n'
+
+    parts, start, limit = [], 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        #   не разрывать многобайтовый символ UTF-8
+        while end < len(data) and (data[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode())
+        start, limit = end, 74
+    return '\r\n '.join(parts) + '\r\n'
+
+#   правило повтора серии: RRULE с шагом и датой окончания
+def render_rule(freq: RecurrenceFreq, interval: int, until: date) -> str:
+    rule = f'RRULE:FREQ={freq.value.upper()};INTERVAL={interval}'
+    if until != FOREVER:
+        rule += f';UNTIL={until:%Y%m%d}T235959'
+    return rule
+
+def _start(event_date: date, event_time: Optional[time]) -> str:
+    if event_time is None:
+        return f'{event_date:%Y%m%d}'
+    return f'{datetime.combine(event_date, event_time):%Y%m%dT%H%M%S}'
+
+def render_event(
+    event_id: int, event_date: date, event_time: Optional[time], title: str, type_event: str,
+    rule: Optional[str] = None, exdates: Iterable[date] = (),
+    recurrence_id: Optional[datetime] = None
+) -> str:
+    """
+        Событие календаря в формате VEVENT.
+
+        Вывод зависит только от строки calendar, поэтому лента побайтно
+        совпадает при неизменных данных (условие сильного ETag).
+
+        Args:
+            event_id (int): Идентификатор записи календаря.
+            event_date (date): Дата события.
+            event_time (time): Время события (None - событие на весь день).
+            title (str): Заголовок события.
+            type_event (str): Тип события.
+            rule (str): Строка RRULE серии (None - разовое событие).
+            exdates (Iterable[date]): Отмененные даты серии.
+            recurrence_id (datetime): Исходное начало повтора, который переносит событие.
+
+        Returns:
+            str: Строки VEVENT.
+    """
+
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:calendar-{event_id}@final-project',
+        f'DTSTAMP:{event_date:%Y%m%d}T000000Z',
+    ]
+    if event_time is None:
+        lines += [
+            f'DTSTART;VALUE=DATE:{event_date:%Y%m%d}',
+            f'DTEND;VALUE=DATE:{event_date + timedelta(days=1):%Y%m%d}',
+        ]
+    else:
+        start = datetime.combine(event_date, event_time)
+        lines += [
+            f'DTSTART:{start:%Y%m%dT%H%M%S}',
+            f'DTEND:{start + MEETING_DURATION:%Y%m%dT%H%M%S}',
+        ]
+    if rule:
+        lines.append(rule)
+        lines += [f'EXDATE:{_start(day, event_time)}' for day in sorted(exdates)]
+    if recurrence_id:
+        lines.append(f'RECURRENCE-ID:{recurrence_id:%Y%m%dT%H%M%S}')
+    lines += [
+        f'SUMMARY:{_escape(title)}',
+        f'CATEGORIES:{type_event.upper()}',
+        'END:VEVENT',
+    ]
+
+    return ''.join(_fold(line) for line in lines)
+
+
+FEED_HEADER = ''.join(_fold(line) for line in (
+    'BEGIN:VCALENDAR',
+    'VERSION:2.0',
+    'PRODID:-//final-project//calendar//RU',
+    'CALSCALE:GREGORIAN',
+    'METHOD:PUBLISH',
+    'X-WR-CALNAME:Календарь',
+))
+FEED_FOOTER = 'END:VCALENDAR\r\n'
+
+
+class CalendarFeedService:
+    """
+        Сервисный слой ленты iCalendar (ICS) пользователя:
+            - сильный ETag по состоянию записей календаря одним запросом
+            - потоковая генерация ленты серверным курсором
+            - повторяющиеся встречи одним VEVENT с RRULE и EXDATE
+    """
+
+    def __init__(self, session_factory: async_sessionmaker):
+        self.session_factory = session_factory
+
+    async def get_etag(self, session: AsyncSession, user_id: int) -> Optional[str]:
+        """
+            ETag ленты пользователя.
+
+            Записи календаря и исключения повторов только создаются и
+            удаляются сервисами, поэтому их число и максимальный id меняются
+            при любом изменении. Запрос агрегирует индекс idx_calendar_user
+            и не читает события.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                user_id (int): Идентификатор пользователя.
+
+            Returns:
+                str: ETag в кавычках (None - пользователя не существует).
+        """
+
+        exceptions = (
+            select(
+                func.count(MeetingException.id).label('count'),
+                func.max(MeetingException.id).label('max_id')
+            )
+            .join(Calendar, Calendar.meeting_id == MeetingException.meeting_id)
+            .where(Calendar.user_id == user_id)
+            .subquery()
+        )
+        query = (
+            select(
+                func.count(Calendar.id), func.max(Calendar.id),
+                func.min(exceptions.c.count), func.min(exceptions.c.max_id)
+            )
+            .select_from(User)
+            .outerjoin(Calendar, Calendar.user_id == User.id)
+            .join(exceptions, true())
+            .where(User.id == user_id)
+            .group_by(User.id)
+        )
+        stamp = (await session.execute(query)).first()
+        if stamp is None:
+            return None
+
+        digest = hashlib.sha256(f'{user_id}:{stamp[0]}:{stamp[1]}:{stamp[2]}:{stamp[3]}'.encode()).hexdigest()
+        return f'"{digest[:32]}"'
+
+    async def stream(self, user_id: int) -> AsyncIterator[bytes]:
+        """
+            Потоковая генерация ленты.
+
+            Генератор открывает собственную сессию: ответ отправляется после
+            закрытия сессии запроса. Время и память линейны по числу событий,
+            в памяти не больше FEED_CHUNK_SIZE строк.
+
+            Args:
+                user_id (int): Идентификатор пользователя.
+
+            Returns:
+                AsyncIterator[bytes]: Куски файла .ics.
+        """
+
+        yield FEED_HEADER.encode()
+
+        query = (
+            select(
+                Calendar.id, Calendar.event_date, Calendar.event_time,
+                Calendar.title, Calendar.type_event, Calendar.event_until,
+                Calendar.meeting_id, Meeting.recurrence_freq, Meeting.recurrence_interval
+            )
+            .outerjoin(Meeting, Meeting.id == Calendar.meeting_id)
+            .where(Calendar.user_id == user_id)
+            .order_by(Calendar.event_date, Calendar.event_time, Calendar.id)
+            .execution_options(yield_per=FEED_CHUNK_SIZE)
+        )
+        async with self.session_factory() as session:
+            exceptions = await self.get_exceptions(session, user_id)
+            result = await session.stream(query)
+            async for rows in result.partitions():
+                yield ''.join(
+                    self.render_row(row, exceptions.get(row.meeting_id, ()))
+                    for row in rows
+                ).encode()
+
+        yield FEED_FOOTER.encode()
+
+    async def get_exceptions(
+        self, session: AsyncSession, user_id: int
+    ) -> defaultdict[int, list[MeetingException]]:
+        #   исключения всех серий пользователя: их на порядки меньше событий
+        query = (
+            select(MeetingException)
+            .join(Calendar, Calendar.meeting_id == MeetingException.meeting_id)
+            .where(Calendar.user_id == user_id, Calendar.event_until.is_not(None))
+        )
+        exceptions = defaultdict(list)
+        for exception in (await session.execute(query)).scalars():
+            exceptions[exception.meeting_id].append(exception)
+        return exceptions
+
+    @staticmethod
+    def render_row(row, exceptions: Iterable[MeetingException]) -> str:
+        if row.event_until is None:
+            return render_event(row.id, row.event_date, row.event_time, row.title, row.type_event.value)
+
+        rule = render_rule(row.recurrence_freq, row.recurrence_interval, row.event_until)
+        exdates = [exception.occurrence_date for exception in exceptions if exception.cancelled]
+        moved = ''.join(
+            render_event(
+                row.id, exception.meeting_date or exception.occurrence_date,
+                exception.meeting_time or row.event_time, row.title, row.type_event.value,
+                recurrence_id=datetime.combine(exception.occurrence_date, row.event_time)
+            )
+            for exception in exceptions if not exception.cancelled
+        )
+        return render_event(
+            row.id, row.event_date, row.event_time, row.title, row.type_event.value, rule, exdates
+        ) + moved
\ No newline at end of file
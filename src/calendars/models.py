@@ -2,7 +2,7 @@ import datetime
 from typing import Optional
 import enum
 
-from sqlalchemy import Enum, Index, ForeignKey, UniqueConstraint
+from sqlalchemy import Enum, Index, ForeignKey, UniqueConstraint, text
 from sqlalchemy.orm import mapped_column, Mapped
 
 from database import Base
@@ -26,6 +26,8 @@ class Calendar(Base):
         - type_event: Тип события
         - task_id: Идентификатор задачи
         - meeting_id: Идентификатор встречи
+        - event_until: Последняя дата повторов (только у повторяющихся
+          встреч, event_date - дата первого повтора)
     """
 
     __tablename__ = 'calendar'
@@ -44,6 +46,7 @@ class Calendar(Base):
     meeting_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("meeting.id", ondelete="CASCADE"), nullable=True
     )
+    event_until: Mapped[Optional[datetime.date]] = mapped_column(nullable=True)
 
     #   настройка ограничений и индексов
     __table_args__ = (
@@ -52,4 +55,9 @@ class Calendar(Base):
         Index("idx_calendar_date", "event_date"),
         Index("idx_calendar_task", "task_id"),
         Index("idx_calendar_meeting", "meeting_id"),
+        #   повторяющиеся события, начавшиеся до запрошенного периода
+        Index(
+            "idx_calendar_user_until", "user_id", "event_until",
+            postgresql_where=text("event_until IS NOT NULL")
+        ),
     )
\ No newline at end of file
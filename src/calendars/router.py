@@ -1,20 +1,27 @@
-from typing import Union
+from typing import Optional, Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_session
-from calendars.depencies import get_calendar_service
+from calendars.depencies import get_calendar_service, get_calendar_feed_service
 from calendars.service import CalendarService
+from calendars.feed import CalendarFeedService, feed_token, parse_feed_token
 from users.models import User
 from core_depencies import get_user
-from calendars.schemas import CalendarRead
+from calendars.schemas import CalendarRead, CalendarFeedRead
 
 
 calendar_router = APIRouter(
     prefix='/calendar/my', tags=['Calendars']
 )
 
+#   лента ICS открывается календарными клиентами без авторизации - по токену
+calendar_feed_router = APIRouter(
+    prefix='/calendar/feed', tags=['Calendars']
+)
+
 @calendar_router.get('/day', response_model=list[CalendarRead])
 async def get_schedule_for_day(
     day: int,
@@ -60,6 +67,70 @@ async def get_month_schedule(
             CalendarRead: Схема для отображения событий.
     """
 
-    schedule = await service.get_month_schedule(session, user, year, month)
+    schedule = await service.get_month_schedule_json(session, user, year, month)
     
-    return [CalendarRead.model_validate(item) for item in schedule]
\ No newline at end of file
+    return Response(schedule, media_type='application/json')
+
+@calendar_router.get('/feed', response_model=CalendarFeedRead)
+async def get_feed_url(
+    request: Request,
+    user: User = Depends(get_user)
+) -> CalendarFeedRead:
+    """
+        Получение ссылки на ленту ICS для подписки в Outlook или Google Calendar.
+
+        Args:
+            request (Request): Запрос (для построения ссылки).
+            user (User): Получение текущего пользователя.
+            
+        Returns:
+            CalendarFeedRead: Схема со ссылкой на ленту.
+    """
+
+    url = request.url_for('get_calendar_feed', token=feed_token(user.id))
+
+    return CalendarFeedRead(url=str(url))
+
+@calendar_feed_router.get('/{token}.ics', name='get_calendar_feed')
+async def get_calendar_feed(
+    token: str,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_session),
+    service: CalendarFeedService = Depends(get_calendar_feed_service)
+) -> Response:
+    """
+        Лента ICS пользователя с условным GET.
+
+        Неизменная лента отвечает 304 по ETag после одного агрегирующего
+        запроса, измененная - отдается потоком.
+
+        Args:
+            token (str): Токен ленты из ссылки подписки.
+            if_none_match (str): ETag ленты, сохраненный клиентом.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (CalendarFeedService): Сервис ленты ICS.
+            
+        Returns:
+            Response: Файл .ics или ответ 304.
+    """
+
+    user_id = parse_feed_token(token)
+    etag = await service.get_etag(session, user_id) if user_id is not None else None
+    if etag is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Лента календаря не найдена'
+        )
+
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+    if if_none_match and (
+        if_none_match.strip() == '*'
+        or etag in (tag.strip() for tag in if_none_match.split(','))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return StreamingResponse(
+        service.stream(user_id),
+        media_type='text/calendar; charset=utf-8',
+        headers={**headers, 'Content-Disposition': 'inline; filename="calendar.ics"'}
+    )
\ No newline at end of file
@@ -28,4 +28,15 @@ class CalendarRead(BaseModel):
 
     model_config = {
         'from_attributes': True
-    }
\ No newline at end of file
+    }
+
+
+class CalendarFeedRead(BaseModel):
+    """
+        Схема ссылки на ленту календаря
+
+        Fields:
+        - url: Ссылка на ленту ICS для подписки.
+    """
+
+    url: str
\ No newline at end of file
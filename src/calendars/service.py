@@ -1,12 +1,23 @@
-from datetime import date
+from collections import defaultdict
+from datetime import date, time
 from typing import Union
 from calendar import monthrange
 
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from users.models import User
 from calendars.models import Calendar
+from calendars.schemas import CalendarRead
+from calendars.cache import month_cache
+from meeting.models import Meeting, MeetingException
+from meeting.recurrence import Series, expand, step_days
+from database import replica_read
+
+
+#   сериализация и разбор списка событий месяца
+month_adapter = TypeAdapter(list[CalendarRead])
 
 
 
@@ -15,8 +26,11 @@ class CalendarService:
         Сервисный слой для работы с календарем:
             - отображение дневного расписания
             - отображение месячного расписания
+            - месячное расписание из кэша в виде JSON
+            - развертывание повторяющихся встреч в периоде расписания
     """
 
+    @replica_read
     async def get_day_schedule(
     self, user: User, session: AsyncSession, day: int
 ) -> Union[list[Calendar]]:
@@ -35,18 +49,9 @@ class CalendarService:
         today = date.today()
         target_date = date(today.year, today.month, day)
 
-        query = (
-            select(Calendar)
-            .where(
-                Calendar.user_id == user.id,
-                Calendar.event_date == target_date
-            )
-            .order_by(Calendar.event_time)
-        )
-        result = await session.execute(query)
-
-        return result.scalars().all()
+        return await self.get_schedule(session, user.id, target_date, target_date)
     
+    @replica_read
     async def get_month_schedule(
         self, session: AsyncSession, user: User, year: int, month: int
     ) -> Union[list[Calendar]]:
@@ -67,14 +72,124 @@ class CalendarService:
         last_day = monthrange(year, month)[1]
         end_date = date(year, month, last_day)
 
+        return await self.get_schedule(session, user.id, start_date, end_date)
+
+    async def get_schedule(
+        self, session: AsyncSession, user_id: int, start_date: date, end_date: date
+    ) -> list[Calendar]:
+        """
+            События пользователя за период с развернутыми повторами встреч.
+
+            Повторяющаяся встреча хранится одной записью календаря (дата
+            первого повтора и event_until), поэтому выборка - это события
+            периода (индекс uix_user_datetime) и серии, начавшиеся раньше
+            и идущие в периоде (частичный индекс idx_calendar_user_until).
+            Повторы вычисляются по правилу встречи, из БД читаются только
+            исключения.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                user_id (int): Идентификатор пользователя.
+                start_date (date): Начало периода.
+                end_date (date): Конец периода (включительно).
+
+            Returns:
+                list[Calendar]: События по дате и времени; повторы - несохраняемые
+                копии записи серии.
+        """
+
         query = (
-            select(Calendar)
+            select(Calendar, Meeting.recurrence_freq, Meeting.recurrence_interval)
+            .outerjoin(Meeting, Meeting.id == Calendar.meeting_id)
             .where(
-                Calendar.user_id == user.id,
-                Calendar.event_date >= start_date,
-                Calendar.event_date <= end_date
+                Calendar.user_id == user_id,
+                or_(
+                    and_(Calendar.event_date >= start_date, Calendar.event_date <= end_date),
+                    and_(
+                        Calendar.event_until.is_not(None),
+                        Calendar.event_until >= start_date,
+                        Calendar.event_date < start_date
+                    )
+                )
+            )
+        )
+        rows = (await session.execute(query)).all()
+
+        series_ids = [row.Calendar.meeting_id for row in rows if row.Calendar.event_until]
+        exceptions = defaultdict(list)
+        if series_ids:
+            query = select(MeetingException).where(
+                MeetingException.meeting_id.in_(series_ids),
+                or_(
+                    MeetingException.occurrence_date.between(start_date, end_date),
+                    MeetingException.meeting_date.between(start_date, end_date)
+                )
+            )
+            for exception in (await session.execute(query)).scalars():
+                exceptions[exception.meeting_id].append(exception)
+
+        events = []
+        for event, freq, interval in rows:
+            if event.event_until is None:
+                events.append(event)
+                continue
+
+            series = Series(
+                event.event_date, event.event_time,
+                step_days(freq, interval), event.event_until
+            )
+            events.extend(
+                self._occurrence(event, day, at)
+                for day, at in expand(series, exceptions[event.meeting_id], start_date, end_date)
             )
-            .order_by(Calendar.event_date, Calendar.event_time)
+
+        return sorted(events, key=lambda item: (
+            item.event_date, item.event_time is None, item.event_time or time.min
+        ))
+
+    @staticmethod
+    def _occurrence(event: Calendar, event_date: date, event_time: time) -> Calendar:
+        #   копия не добавляется в сессию: запись серии не изменяется
+        return Calendar(
+            id=event.id, user_id=event.user_id, event_date=event_date,
+            event_time=event_time, title=event.title, type_event=event.type_event,
+            task_id=event.task_id, meeting_id=event.meeting_id,
+            event_until=event.event_until
+        )
+
+    async def get_month_schedule_json(
+        self, session: AsyncSession, user: User, year: int, month: int
+    ) -> bytes:
+        """
+            Получение месячного расписания в виде JSON через кэш month_cache.
+
+            Версия ключа запоминается до запроса: если расписание изменилось,
+            пока запрос выполнялся, результат не попадет в кэш. Промах кэша
+            читается из основной БД, иначе отстающая реплика попала бы в кэш
+            на CALENDAR_CACHE_TTL уже после инвалидации.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                user (User): Получение текущего пользователя.
+                year (int): Номер года
+                month (int): Номер месяца
+
+            Returns:
+                bytes: JSON списка событий (схема CalendarRead).
+        """
+
+        key = (user.id, year, month)
+        payload = month_cache.get(key)
+        if payload is not None:
+            return payload
+
+        version = month_cache.version(key)
+        start_date = date(year, month, 1)
+        end_date = date(year, month, monthrange(year, month)[1])
+        schedule = await self.get_schedule(session, user.id, start_date, end_date)
+        payload = month_adapter.dump_json(
+            [CalendarRead.model_validate(item) for item in schedule]
         )
-        result = await session.execute(query)
-        return result.scalars().all()
\ No newline at end of file
+        month_cache.set(key, payload, version)
+
+        return payload
\ No newline at end of file
@@ -3,6 +3,7 @@ from fastapi import Depends, HTTPException, status
 from users.models import User
 from company.service.company import CompanyService
 from company.service.department import DepartmentService
+from company.service.user_import import UserImportService
 from core_depencies import check_role
 
 
@@ -24,4 +25,20 @@ def validate_company_presence(
             detail='Создавать оргструктуру можно при наличии компании'
         )
     
+    return user
+
+#   возврат сервиса импорта пользователей
+def get_user_import_service() -> UserImportService:
+    return UserImportService()
+
+#   работа с пользователями компании доступна только ее админу
+def validate_company_admin(
+    company_id: int, user: User = Depends(check_role)
+) -> User:
+    if user.company_id != company_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Доступно только админу этой компании'
+        )
+
     return user
\ No newline at end of file
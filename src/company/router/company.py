@@ -1,15 +1,20 @@
 from typing import Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, File, Request, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_session
 from users.models import User
 from users.schemas import UserInformation
 from company.schemas.company import CompanyRead, CompanyCreate
-from company.depencies import get_company_service
+from company.schemas.user_import import UserImportReport
+from company.depencies import (
+    get_company_service, get_user_import_service, validate_company_admin
+)
 from company.service.company import CompanyService
+from company.service.user_import import UserImportService
 from core_depencies import check_role, get_user
+from core.pagination import Page, PageParams, build_page
 
 
 company_router = APIRouter(
@@ -66,6 +71,30 @@ async def add_user(
 
     return UserInformation.model_validate(add_user)
 
+@company_router.post('/{company_id}/users/import', response_model=UserImportReport)
+async def import_users(
+    company_id: int,
+    file: UploadFile = File(..., description='CSV: name, surname, role, email, password'),
+    session: AsyncSession = Depends(get_session),
+    service: UserImportService = Depends(get_user_import_service),
+    user: User = Depends(validate_company_admin)
+) -> Union[UserImportReport, Exception]:
+    """
+        Массовый импорт пользователей в компанию из CSV.
+
+        Args:
+            company_id (int): Идентификатор компании
+            file (UploadFile): CSV-файл с пользователями.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (UserImportService): Сервис импорта пользователей.
+            user (User): Получение текущего пользователя.
+            
+        Returns:
+            UserImportReport: Число созданных пользователей и ошибки по строкам.
+    """
+
+    return await service.import_users(session, company_id, await file.read())
+
 @company_router.patch('/{company_id}/users/{user_id}', response_model=UserInformation)
 async def delete_user(
     company_id: int,
@@ -111,26 +140,30 @@ async def delete_company(
 
     await service.delete_company(session, company_id)
 
-@company_router.get('/{company_id}/users', response_model=list[UserInformation])
+@company_router.get('/{company_id}/users', response_model=Page[UserInformation])
 async def get_company_users(
     company_id: int,
+    request: Request,
+    page: PageParams = Depends(),
     session: AsyncSession = Depends(get_session),
     service: CompanyService = Depends(get_company_service),
     user: User = Depends(get_user)
-) -> list[UserInformation]:
+) -> Page[UserInformation]:
     """
         Получение пользователей компании.
 
         Args:
             company_id (int): Идентификатор компании
+            request (Request): Запрос (для ссылки на следующую страницу).
+            page (PageParams): Курсор и размер страницы.
             session (AsyncSession): SQLAlchemy-сессия.
             service (CompanyService): Сервис для создания компании.
             user (User): Получение текущего пользователя.
             
         Returns:
-            company_users (list[UserInformation]): Схема для получения данных пользователя.
+            company_users (Page[UserInformation]): Страница пользователей компании.
     """ 
     
-    company_users = await service.get_company_users(session, user, company_id)
+    company_users = await service.get_company_users(session, user, company_id, page)
 
-    return company_users
\ No newline at end of file
+    return build_page(request, UserInformation, company_users)
\ No newline at end of file
@@ -0,0 +1,33 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class UserImportError(BaseModel):
+    """
+        Схема ошибки строки файла импорта
+
+        Fields:
+        - row: Номер строки в файле (заголовок - строка 1).
+        - email: Почта из строки, если она указана.
+        - detail: Причина, по которой пользователь не создан.
+    """
+
+    row: int
+    email: Optional[str] = None
+    detail: str
+
+
+class UserImportReport(BaseModel):
+    """
+        Схема отчета об импорте пользователей
+
+        Fields:
+        - total: Число строк с данными в файле.
+        - created: Число созданных пользователей.
+        - errors: Строки, которые не были импортированы.
+    """
+
+    total: int
+    created: int
+    errors: list[UserImportError]
\ No newline at end of file
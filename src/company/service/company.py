@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Optional, Union
 
 from fastapi import HTTPException, status
 from sqlalchemy import delete, select, update
@@ -6,9 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from company.models.department import Department
 from users.models import User
-from users.schemas import UserInformation
+from users.cache import invalidate_users, invalidate_users_where
 from company.schemas.company import CompanyCreate
 from company.models.company import Company
+from database import replica_read
+from core.pagination import KeysetPage, PageParams, paginate
 
 
 class CompanyService:
@@ -93,6 +95,7 @@ class CompanyService:
             session.add(user)
             await session.commit()
             await session.refresh(user)
+            invalidate_users(user_id)
 
             return user
         except Exception as e:
@@ -135,6 +138,7 @@ class CompanyService:
             session.add(user)
             await session.commit()
             await session.refresh(user)
+            invalidate_users(user_id)
 
             return user
         except Exception as e:
@@ -168,6 +172,7 @@ class CompanyService:
 
             await session.delete(company)
             await session.commit()
+            invalidate_users_where(lambda user: user['company_id'] == company_id)
 
         except Exception as e:
             raise HTTPException(
@@ -175,19 +180,22 @@ class CompanyService:
                 detail=str(e)
             )
         
+    @replica_read
     async def get_company_users(
-        self, session: AsyncSession, user: User, company_id: int
-    ) -> UserInformation:
+        self, session: AsyncSession, user: User, company_id: int,
+        page: Optional[PageParams] = None
+    ) -> KeysetPage[User]:
         """
-            Получение списка пользователей.
+            Получение списка пользователей по фамилии.
 
             Args:
                 session (AsyncSession): SQLAlchemy-сессия.
                 company_id (int): Идентификатор компании
                 user (User): Объект пользователя
+                page (PageParams): Параметры страницы (None - все пользователи).
 
             Returns:
-                UserInformation: Схема для отображения пользователей
+                KeysetPage[User]: Страница пользователей компании
         """
 
         if user.company_id != company_id:
@@ -197,6 +205,5 @@ class CompanyService:
             )
         
         query = select(User).where(User.company_id == company_id)
-        result = (await session.execute(query)).scalars().all()
 
-        return [UserInformation.model_validate(user) for user in result]
\ No newline at end of file
+        return await paginate(session, query, (User.last_name, User.id), page)
\ No newline at end of file
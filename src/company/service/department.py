@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from users.models import User
+from users.cache import invalidate_users
 from company.schemas.department import DepartmentCreate
 from company.models.department import Department
 
@@ -73,6 +74,7 @@ class DepartmentService:
             target_user.department_id = new_department.id
             await session.commit()
             await session.refresh(new_department)
+            invalidate_users(data['head_user_id'])
 
             return new_department
         except Exception as e:
@@ -132,10 +134,13 @@ class DepartmentService:
             target_department.head_user_id = target_user.id
             target_user.department_id = target_department.id
 
+            changed_ids = [user_id]
             if old_user:
                 old_user.department_id = None
+                changed_ids.append(old_user.id)
 
             await session.commit()
+            invalidate_users(*changed_ids)
 
             await session.refresh(target_department)
             await session.refresh(target_user)
@@ -181,10 +186,12 @@ class DepartmentService:
             query_users = select(User).where(User.department_id == department_id)
             users_to_update = (await session.execute(query_users)).scalars().all()
 
+            changed_ids = [user.id for user in users_to_update]
             for user in users_to_update:
                 user.department_id = None
             await session.delete(target_department)
             await session.commit()
+            invalidate_users(*changed_ids)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
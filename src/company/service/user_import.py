@@ -0,0 +1,229 @@
+import asyncio
+import csv
+import io
+from typing import Union
+
+from asyncpg import PostgresError
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import column, exists, false, func, literal, select, table, text, true
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from users.models import User
+from users.schemas import UserRegistration
+from company.models.company import Company
+from company.schemas.user_import import UserImportError, UserImportReport
+from core.hashing import import_password_pool
+from config import get_setting
+
+
+setting = get_setting()
+
+#   временная таблица пачки: удаляется при завершении транзакции импорта
+IMPORT_COLUMNS = ('first_name', 'last_name', 'company_role', 'email', 'hashed_password')
+import_table = table('user_import', *(column(name) for name in IMPORT_COLUMNS))
+
+#   ограничения длины колонок "user": UserRegistration их не проверяет,
+#   а COPY прервал бы транзакцию всего файла
+COLUMN_LENGTHS = {
+    name: User.__table__.c[name].type.length
+    for name in ('first_name', 'last_name', 'email')
+}
+
+
+class UserImportService:
+    """
+        Сервисный слой массового импорта пользователей из CSV:
+            - проверка строк по правилам UserRegistration
+            - хеширование паролей в пуле import_password_pool
+            - загрузка пачек через COPY во временную таблицу
+              и INSERT ... ON CONFLICT DO NOTHING в таблицу пользователей
+            - отчет по строкам без прерывания импорта всего файла
+    """
+
+    async def import_users(
+        self, session: AsyncSession, company_id: int, content: bytes
+    ) -> Union[UserImportReport, HTTPException]:
+        """
+            Импорт пользователей в компанию.
+
+            Колонки файла совпадают с полями регистрации: name (first_name),
+            surname (last_name), role (company_role), email, password.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                company_id (int): Идентификатор компании.
+                content (bytes): Содержимое CSV-файла.
+
+            Returns:
+                UserImportReport: Число созданных пользователей и ошибки строк.
+        """
+
+        company = await session.get(Company, company_id)
+        if not company:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Компания с id {company_id} не существует'
+            )
+
+        total, rows, errors = self.parse_rows(content)
+
+        await session.execute(text(
+            f'CREATE TEMP TABLE user_import ON COMMIT DROP AS '
+            f'SELECT {", ".join(IMPORT_COLUMNS)} FROM "user" WITH NO DATA'
+        ))
+        connection = await (await session.connection()).get_raw_connection()
+
+        created = 0
+        batch_size = max(setting.USER_IMPORT_BATCH_SIZE, 1)
+        try:
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                hashes = await asyncio.gather(
+                    *(import_password_pool.hash(data.password) for _, data in batch)
+                )
+
+                await connection.driver_connection.copy_records_to_table(
+                    'user_import',
+                    records=[
+                        (
+                            data.first_name, data.last_name, data.company_role.name,
+                            data.email, hashed_password
+                        )
+                        for (_, data), hashed_password in zip(batch, hashes)
+                    ],
+                    columns=IMPORT_COLUMNS
+                )
+                inserted = set(
+                    (await session.execute(self.insert_query(company_id))).scalars().all()
+                )
+                await session.execute(text('TRUNCATE user_import'))
+
+                created += len(inserted)
+                errors.extend(
+                    UserImportError(
+                        row=row, email=data.email,
+                        detail=f'Пользователь {data.email} уже существует'
+                    )
+                    for row, data in batch if data.email not in inserted
+                )
+
+        except (PostgresError, DBAPIError) as e:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f'Файл не импортирован: {e}'
+            )
+
+        await session.commit()
+
+        return UserImportReport(
+            total=total, created=created,
+            errors=sorted(errors, key=lambda error: error.row)
+        )
+
+    def parse_rows(
+        self, content: bytes
+    ) -> Union[tuple[int, list[tuple[int, UserRegistration]], list[UserImportError]], HTTPException]:
+        """
+            Разбор и проверка строк файла.
+
+            Почта, повторно встречающаяся в файле (без учета регистра),
+            считается дубликатом и не импортируется; значения длиннее колонок
+            таблицы пользователей отклоняются здесь, а не при COPY.
+
+            Args:
+                content (bytes): Содержимое CSV-файла.
+
+            Returns:
+                tuple: Число строк, проверенные строки с номерами и ошибки.
+        """
+
+        try:
+            reader = csv.DictReader(io.StringIO(content.decode('utf-8-sig')))
+            records = list(reader)
+        except (UnicodeDecodeError, csv.Error):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='Файл должен быть CSV в кодировке UTF-8'
+            )
+
+        rows, errors, seen = [], [], set()
+        for row, record in enumerate(records, start=2):
+            record.pop('code', None)
+            record.pop('company_code', None)
+            try:
+                data = UserRegistration.model_validate(
+                    {key: value for key, value in record.items() if key and value}
+                )
+            except ValidationError as e:
+                errors.append(UserImportError(
+                    row=row, email=record.get('email') or None,
+                    detail='; '.join(
+                        f'{".".join(map(str, error["loc"]))}: {error["msg"]}'
+                        for error in e.errors()
+                    )
+                ))
+                continue
+
+            too_long = [
+                f'{name}: длина больше {length}'
+                for name, length in COLUMN_LENGTHS.items()
+                if len(getattr(data, name)) > length
+            ]
+            if too_long:
+                errors.append(UserImportError(
+                    row=row, email=data.email, detail='; '.join(too_long)
+                ))
+                continue
+
+            email = data.email.lower()
+            if email in seen:
+                errors.append(UserImportError(
+                    row=row, email=data.email,
+                    detail=f'Почта {data.email} повторяется в файле'
+                ))
+                continue
+
+            seen.add(email)
+            rows.append((row, data))
+
+        return len(records), rows, errors
+
+    def insert_query(self, company_id: int):
+        """
+            Перенос пачки из временной таблицы в таблицу пользователей.
+
+            Почты, уже занятые без учета регистра (как при регистрации),
+            пропускаются; ON CONFLICT закрывает гонку с параллельной вставкой.
+
+            Args:
+                company_id (int): Идентификатор компании.
+
+            Returns:
+                Insert: Запрос, возвращающий почты созданных пользователей.
+        """
+
+        source = import_table.c
+        taken = exists().where(func.lower(User.email) == func.lower(source.email))
+
+        return (
+            insert(User)
+            .from_select(
+                [
+                    User.first_name, User.last_name, User.company_role, User.email,
+                    User.hashed_password, User.company_id, User.is_active,
+                    User.is_superuser, User.is_verified
+                ],
+                select(
+                    source.first_name, source.last_name, source.company_role,
+                    source.email, source.hashed_password, literal(company_id),
+                    true(), false(), false()
+                )
+                .where(~taken)
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.email)
+        )
\ No newline at end of file
@@ -1,4 +1,6 @@
+import datetime
 from pathlib import Path
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,6 +19,71 @@ class Setting(BaseSettings):
     STATIC_DIR: str
     TEMPLATES_DIR: str
 
+    #   DSN реплики для чтений (postgresql+asyncpg://...), по умолчанию нет
+    DB_REPLICA_URL: Optional[str] = None
+    #   после записи чтения клиента идут на основную БД столько секунд
+    #   (подписанная cookie переживает редирект POST -> GET)
+    DB_REPLICA_PIN_SECONDS: int = 5
+
+    #   вывод всех SQL-запросов в stdout
+    DB_ECHO: bool = False
+    #   число повторов одной формы запроса, после которого запрос
+    #   помечается как подозрение на N+1
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+
+    #   пул соединений с БД
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+
+    #   кэш авторизованных пользователей
+    USER_CACHE_TTL: int = 60
+    USER_CACHE_SIZE: int = 10000
+
+    #   потоки для хеширования паролей (0 - хешировать в цикле событий)
+    PASSWORD_HASH_WORKERS: int = 2
+
+    #   массовый импорт пользователей: отдельный пул хеширования,
+    #   чтобы импорт не занимал потоки входа, и размер пачки вставки
+    USER_IMPORT_HASH_WORKERS: int = 4
+    USER_IMPORT_BATCH_SIZE: int = 1000
+
+    #   параллельная загрузка независимых запросов страницы
+    DB_FANOUT_ENABLED: bool = False
+    DB_FANOUT_LIMIT: int = 3
+
+    #   кэш контекста главной страницы для повторной отрисовки форм
+    DASHBOARD_CACHE_TTL: int = 15
+    DASHBOARD_CACHE_SIZE: int = 10000
+
+    #   кэш месячного расписания: TTL страхует от изменений в других
+    #   процессах, размер ограничен числом записей и байтами
+    CALENDAR_CACHE_TTL: int = 300
+    CALENDAR_CACHE_SIZE: int = 10000
+    CALENDAR_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    #   кэш рейтинга сотрудников компании за период
+    LEADERBOARD_CACHE_TTL: int = 600
+    LEADERBOARD_CACHE_SIZE: int = 2000
+    LEADERBOARD_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+    #   SSE-поток событий: очередь соединения ограничена, при переполнении
+    #   клиент получает reset и перечитывает страницу
+    SSE_QUEUE_SIZE: int = 100
+    SSE_HEARTBEAT_SECONDS: float = 15
+    SSE_MAX_CONNECTIONS_PER_USER: int = 5
+
+    #   число последних комментариев в списках задач; остальные
+    #   отдаются постранично по /companies/tasks/{task_id}/comments
+    TASK_LATEST_COMMENTS: int = 3
+
+    #   рабочий день и сетка слотов для подбора времени встреч;
+    #   встреча занимает MEETING_DURATION_MINUTES от своего времени
+    MEETING_DAY_START: datetime.time = datetime.time(9, 0)
+    MEETING_DAY_END: datetime.time = datetime.time(18, 0)
+    MEETING_SLOT_MINUTES: int = 30
+    MEETING_DURATION_MINUTES: int = 60
+
     #   метод для возврата ссылки подключения к БД в формате DSN
     @property
     def DB_POSTGRES_URL(self) -> str:
@@ -0,0 +1,213 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+#   реестр кэшей процесса для вывода статистики
+caches: dict[str, 'TTLCache'] = {}
+
+
+class TTLCache:
+    """
+        Кэш в памяти процесса:
+            - время жизни записей (TTL)
+            - вытеснение давно не использованных записей (LRU)
+            - ограничение по числу записей
+            - счетчики попаданий и промахов
+    """
+
+    def __init__(self, name: str, ttl: float, max_size: int):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+        caches[name] = self
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+            Получение значения по ключу.
+
+            Args:
+                key (Hashable): Ключ записи.
+                default (Any): Значение при промахе.
+
+            Returns:
+                Any: Значение записи или default.
+        """
+
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+            Сохранение значения с вытеснением самых старых записей.
+
+            Args:
+                key (Hashable): Ключ записи.
+                value (Any): Значение записи.
+        """
+
+        if key in self._data:
+            self._remove(key)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+        while len(self._data) > self.max_size:
+            self._remove(next(iter(self._data)))
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """
+            Удаление записей по ключам.
+
+            Args:
+                keys (Hashable): Ключи записей.
+        """
+
+        for key in keys:
+            if key in self._data:
+                self._remove(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]) -> None:
+        """
+            Удаление записей, подходящих под условие.
+
+            Args:
+                predicate (Callable): Условие от ключа и значения записи.
+        """
+
+        for key in [k for k, (_, v) in self._data.items() if predicate(k, v)]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        for key in list(self._data):
+            self._remove(key)
+
+    def stats(self) -> dict:
+        """
+            Статистика кэша.
+
+            Returns:
+                dict: Размер, попадания, промахи и доля попаданий.
+        """
+
+        total = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else None,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        del self._data[key]
+
+
+class VersionedCache(TTLCache):
+    """
+        Кэш сериализованных ответов (bytes) с версиями ключей:
+            - ограничение по суммарному размеру значений в байтах
+            - сброс ключа увеличивает его версию, и заполнение, начатое
+              до сброса, не сохраняет устаревшие данные
+    """
+
+    def __init__(self, name: str, ttl: float, max_size: int, max_bytes: int):
+        super().__init__(name, ttl, max_size)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.stale_writes = 0
+        self._clock = 0
+        self._generation = 0
+        self._versions: OrderedDict[Hashable, int] = OrderedDict()
+
+    def version(self, key: Hashable) -> tuple[int, int]:
+        """
+            Текущая версия ключа: запоминается перед чтением из БД
+            и передается в set.
+
+            Args:
+                key (Hashable): Ключ записи.
+
+            Returns:
+                tuple: Поколение кэша и версия ключа.
+        """
+
+        return self._generation, self._versions.get(key, 0)
+
+    def set(
+        self, key: Hashable, value: bytes, version: Optional[tuple[int, int]] = None
+    ) -> None:
+        """
+            Сохранение значения, если ключ не сбрасывался после чтения.
+
+            Args:
+                key (Hashable): Ключ записи.
+                value (bytes): Сериализованное значение.
+                version (tuple): Версия ключа на момент чтения из БД.
+        """
+
+        if version is not None and version != self.version(key):
+            self.stale_writes += 1
+            return
+        if len(value) > self.max_bytes:
+            return
+
+        super().set(key, value)
+        self.bytes += len(value)
+
+        while self.bytes > self.max_bytes:
+            self._remove(next(iter(self._data)))
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """
+            Удаление записей с увеличением версий ключей.
+
+            Args:
+                keys (Hashable): Ключи записей.
+        """
+
+        for key in keys:
+            self._clock += 1
+            self._versions[key] = self._clock
+            self._versions.move_to_end(key)
+        #   версии нужны только на время заполнения - храним последние
+        while len(self._versions) > self.max_size:
+            self._versions.popitem(last=False)
+
+        super().invalidate(*keys)
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]) -> None:
+        """
+            Удаление записей по условию.
+
+            Условие не проверить для ключей, которые еще заполняются,
+            поэтому сброс увеличивает поколение всего кэша.
+
+            Args:
+                predicate (Callable): Условие от ключа и значения записи.
+        """
+
+        self._generation += 1
+        super().invalidate_where(predicate)
+
+    def stats(self) -> dict:
+        return {
+            **super().stats(),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'stale_writes': self.stale_writes,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        self.bytes -= len(self._data[key][1])
+        super()._remove(key)
@@ -0,0 +1,100 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
+
+from fastapi_users.password import PasswordHelper
+
+from config import get_setting
+
+
+setting = get_setting()
+
+
+class PasswordPool:
+    """
+        Хеширование и проверка паролей вне цикла событий:
+            - ограниченный пул потоков (argon2 и bcrypt отпускают GIL,
+              поэтому потоки выполняются параллельно)
+            - глубина очереди ожидающих задач для метрик
+            - выполнение в цикле событий, если workers = 0
+    """
+
+    def __init__(self, workers: int, helper: Optional[PasswordHelper] = None):
+        self.workers = max(workers, 0)
+        self.helper = helper or PasswordHelper()
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self._executor = (
+            ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='password')
+            if self.workers else None
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self.in_flight - self.workers, 0)
+
+    async def hash(self, password: str) -> str:
+        """
+            Хеширование пароля.
+
+            Args:
+                password (str): Пароль в открытом виде.
+
+            Returns:
+                str: Хеш пароля.
+        """
+
+        return await self._run(self.helper.hash, password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, Union[str, None]]:
+        """
+            Проверка пароля с пересчетом устаревшего хеша.
+
+            Args:
+                password (str): Пароль в открытом виде.
+                hashed_password (str): Сохраненный хеш пароля.
+
+            Returns:
+                tuple: Флаг совпадения и новый хеш (или None).
+        """
+
+        return await self._run(self.helper.verify_and_update, password, hashed_password)
+
+    def stats(self) -> dict:
+        """
+            Статистика пула.
+
+            Returns:
+                dict: Число потоков, задачи в работе, глубина очереди.
+        """
+
+        return {
+            'workers': self.workers,
+            'in_flight': self.in_flight,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'completed': self.completed,
+        }
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        self.in_flight += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            if self._executor is None:
+                return func(*args)
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+
+#   общий пул процесса: его используют UserManager и Jinja-вход
+password_pool = PasswordPool(setting.PASSWORD_HASH_WORKERS)
+
+#   пул массового импорта: тысячи хешей не задерживают вход пользователей
+import_password_pool = PasswordPool(setting.USER_IMPORT_HASH_WORKERS, password_pool.helper)
\ No newline at end of file
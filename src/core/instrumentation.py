@@ -0,0 +1,146 @@
+import json
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from config import get_setting
+
+
+setting = get_setting()
+
+logger = logging.getLogger('sql')
+if not logger.handlers:
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class RequestStats:
+    """
+        Статистика SQL одного HTTP-запроса:
+            - число запросов и суммарное время в БД
+            - время ожидания соединения из пула
+            - число повторов каждой формы запроса (для поиска N+1)
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.pool_wait = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def suspected_n_plus_one(self, threshold: int) -> list[dict]:
+        return [
+            {'statement': ' '.join(statement.split())[:200], 'count': count}
+            for statement, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries", '
+            f'pool;dur={self.pool_wait * 1000:.1f}'
+        )
+
+
+#   статистика текущего запроса (None вне запроса)
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar('request_stats', default=None)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+        Пул соединений, замеряющий ожидание свободного соединения
+        (включая открытие нового) для статистики запроса.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            stats = request_stats.get()
+            if stats is not None:
+                stats.pool_wait += time.perf_counter() - start
+
+
+#   подписка на события движка: подсчет запросов и времени в БД
+def instrument_engine(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, 'before_cursor_execute')
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, 'after_cursor_execute')
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info['query_start'].pop()
+        stats = request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_time += time.perf_counter() - start
+            stats.shapes[statement] += 1
+
+
+class SQLInstrumentationMiddleware:
+    """
+        ASGI-middleware статистики SQL по запросам:
+            - заголовок Server-Timing (db и pool)
+            - структурированная строка лога для запросов к БД
+            - предупреждение о повторах одной формы запроса (N+1)
+    """
+
+    def __init__(self, app, threshold: int = setting.SQL_N_PLUS_ONE_THRESHOLD):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                headers = list(message.get('headers', []))
+                headers.append((b'server-timing', stats.server_timing().encode()))
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_stats.reset(token)
+            if stats.queries:
+                self._log(scope, stats, status_code, time.perf_counter() - start)
+
+    def _log(self, scope, stats: RequestStats, status_code: int, duration: float) -> None:
+        route = scope.get('route')
+        route_name = getattr(route, 'path', None) or scope['path']
+        suspects = stats.suspected_n_plus_one(self.threshold)
+
+        record = {
+            'method': scope['method'],
+            'route': route_name,
+            'endpoint': getattr(route, 'name', None),
+            'status': status_code,
+            'duration_ms': round(duration * 1000, 1),
+            'queries': stats.queries,
+            'db_ms': round(stats.db_time * 1000, 1),
+            'pool_wait_ms': round(stats.pool_wait * 1000, 1),
+        }
+        if suspects:
+            record['n_plus_one'] = suspects
+            logger.warning(json.dumps(record, ensure_ascii=False))
+        else:
+            logger.info(json.dumps(record, ensure_ascii=False))
\ No newline at end of file
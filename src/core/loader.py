@@ -0,0 +1,60 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+#   функция чтения, получающая сессию, в которой ей нужно выполниться
+Loader = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class ConcurrentLoader:
+    """
+        Загрузчик независимых чтений одной страницы:
+            - параллельное выполнение в коротких сессиях из пула
+            - ограничение числа соединений на один запрос страницы
+            - последовательное выполнение на сессии запроса, если
+              параллельная загрузка выключена
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker, limit: int, concurrent: bool
+    ):
+        self.session_factory = session_factory
+        self.limit = max(limit, 1)
+        self.concurrent = concurrent
+
+    async def run(self, session: AsyncSession, *loaders: Loader) -> list[Any]:
+        """
+            Выполнение чтений страницы.
+
+            В параллельном режиме каждое чтение получает собственную сессию,
+            а семафор не дает одной странице занять больше limit соединений
+            пула. Время загрузки сводится к самому медленному запросу.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия запроса.
+                loaders (Loader): Независимые функции чтения.
+
+            Returns:
+                list: Результаты в порядке переданных функций.
+        """
+
+        if not self.concurrent or len(loaders) < 2:
+            return [await loader(session) for loader in loaders]
+
+        semaphore = asyncio.Semaphore(self.limit)
+
+        async def _run(loader: Loader) -> Any:
+            async with semaphore:
+                async with self.session_factory() as task_session:
+                    return await loader(task_session)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(_run(loader)) for loader in loaders]
+        except ExceptionGroup as errors:
+            #   как и в последовательном режиме, наружу уходит первая ошибка
+            raise errors.exceptions[0]
+
+        return [task.result() for task in tasks]
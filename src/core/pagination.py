@@ -0,0 +1,143 @@
+import base64
+import binascii
+import datetime
+import json
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Query, Request, status
+from pydantic import BaseModel
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+T = TypeVar('T')
+
+
+class PageParams:
+    """
+        Параметры страницы списка:
+            - cursor: непрозрачный курсор из next_cursor прошлой страницы
+            - limit: число записей на странице
+    """
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description='Курсор следующей страницы'),
+        limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT)
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+class KeysetPage(Generic[T]):
+    """
+        Результат выборки страницы из сервиса: записи и курсор следующей
+        страницы (None - страница последняя).
+    """
+
+    def __init__(self, items: Sequence[T], next_cursor: Optional[str] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+class Page(BaseModel, Generic[T]):
+    """
+        Схема страницы списка
+
+        Fields:
+        - items: Записи страницы.
+        - next_cursor: Курсор следующей страницы.
+        - next: Ссылка на следующую страницу.
+    """
+
+    items: list[T]
+    next_cursor: Optional[str] = None
+    next: Optional[str] = None
+
+
+#   курсор - значения ключа сортировки последней записи в base64(JSON)
+def encode_cursor(values: list[Any]) -> str:
+    data = json.dumps(values, default=lambda value: value.isoformat(), separators=(',', ':'))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor: str, columns: Sequence[InstrumentedAttribute]) -> list[Any]:
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(data)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError(cursor)
+
+        result = []
+        for column, value in zip(columns, values):
+            python_type = column.type.python_type
+            if value is not None and python_type in (datetime.date, datetime.time, datetime.datetime):
+                value = python_type.fromisoformat(value)
+            result.append(value)
+        return result
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Некорректный курсор страницы'
+        )
+
+async def paginate(
+    session: AsyncSession, query: Select, order_by: Sequence[InstrumentedAttribute],
+    page: Optional[PageParams], descending: bool = False
+) -> KeysetPage:
+    """
+        Keyset-пагинация выборки.
+
+        Следующая страница ищется сравнением кортежа ключа сортировки
+        (последняя колонка - id) с курсором, поэтому составной индекс
+        дает одинаковое время ответа на любой глубине.
+
+        Args:
+            session (AsyncSession): SQLAlchemy-сессия.
+            query (Select): Выборка с фильтрами.
+            order_by (Sequence): Колонки ключа сортировки, последняя - id.
+            page (PageParams): Параметры страницы (None - все записи).
+            descending (bool): Сортировка по убыванию.
+
+        Returns:
+            KeysetPage: Записи страницы и курсор следующей.
+    """
+
+    if page is None:
+        query = query.order_by(*(column.desc() if descending else column for column in order_by))
+        return KeysetPage((await session.execute(query)).scalars().all())
+
+    if page.cursor:
+        values = decode_cursor(page.cursor, order_by)
+        key = tuple_(*order_by)
+        bound = tuple_(*(literal(value, column.type) for column, value in zip(order_by, values)))
+        query = query.where(key < bound if descending else key > bound)
+
+    query = (
+        query
+        .order_by(*(column.desc() if descending else column for column in order_by))
+        .limit(page.limit + 1)
+    )
+    items = (await session.execute(query)).scalars().all()
+
+    next_cursor = None
+    if len(items) > page.limit:
+        items = items[:page.limit]
+        next_cursor = encode_cursor([getattr(items[-1], column.key) for column in order_by])
+
+    return KeysetPage(items, next_cursor)
+
+#   сборка ответа со ссылкой на следующую страницу
+def build_page(request: Request, schema: type[BaseModel], result: KeysetPage) -> Page:
+    next_link = None
+    if result.next_cursor:
+        next_link = str(request.url.include_query_params(cursor=result.next_cursor))
+
+    return Page[schema](
+        items=[schema.model_validate(item) for item in result.items],
+        next_cursor=result.next_cursor,
+        next=next_link
+    )
@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Depends
+
+from core.cache import caches
+from core.hashing import password_pool
+from events.broker import broker
+from users.manager import fastapi_users
+from users.models import User
+
+
+metrics_router = APIRouter(prefix='/metrics', tags=['Metrics'])
+
+
+@metrics_router.get('/cache')
+async def get_cache_metrics(
+    user: User = Depends(fastapi_users.current_user(superuser=True))
+) -> dict[str, dict]:
+    """
+        Статистика кэшей процесса.
+
+        Args:
+            user (User): Получение текущего суперпользователя.
+
+        Returns:
+            dict: Размер, попадания и промахи по каждому кэшу.
+    """
+
+    return {name: cache.stats() for name, cache in caches.items()}
+
+@metrics_router.get('/password')
+async def get_password_metrics(
+    user: User = Depends(fastapi_users.current_user(superuser=True))
+) -> dict[str, int]:
+    """
+        Статистика пула хеширования паролей.
+
+        Args:
+            user (User): Получение текущего суперпользователя.
+
+        Returns:
+            dict: Число потоков, задачи в работе и глубина очереди.
+    """
+
+    return password_pool.stats()
+
+@metrics_router.get('/events')
+async def get_event_metrics(
+    user: User = Depends(fastapi_users.current_user(superuser=True))
+) -> dict[str, int]:
+    """
+        Статистика SSE-брокера событий.
+
+        Args:
+            user (User): Получение текущего суперпользователя.
+
+        Returns:
+            dict: Соединения, пользователи, опубликованные и вытесненные события.
+    """
+
+    return broker.stats()
\ No newline at end of file
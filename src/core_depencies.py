@@ -2,6 +2,8 @@ from fastapi import Depends, HTTPException, status
 
 from users.models import User, RoleType
 from users.manager import fastapi_users
+from core.loader import ConcurrentLoader
+from database import db, setting
 
 
 #   проверка роли пользователя перез работой эндпоинтов
@@ -16,4 +18,10 @@ def check_role(user: User = Depends(fastapi_users.current_user())):
 
 #   получение текущего авторизированного пользователя
 def get_user(user: User = Depends(fastapi_users.current_user())):
-    return user
\ No newline at end of file
+    return user
+
+#   получение загрузчика независимых чтений страницы
+def get_loader() -> ConcurrentLoader:
+    return ConcurrentLoader(
+        db.session, setting.DB_FANOUT_LIMIT, setting.DB_FANOUT_ENABLED
+    )
\ No newline at end of file
@@ -1,25 +1,187 @@
+import hashlib
+import hmac
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 
 from config import get_setting, Setting
+from core.instrumentation import TimedQueuePool, instrument_engine
+
+
+#   флаг чтения с реплики для текущего вызова сервиса
+use_replica: ContextVar[bool] = ContextVar('use_replica', default=False)
+
+#   cookie закрепления клиента за основной БД после записи
+PRIMARY_PIN_COOKIE = 'db_primary_until'
+
+T = TypeVar('T')
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class PrimaryPin:
+    """
+        Закрепление запроса за основной БД: pinned - клиент недавно писал
+        (cookie PRIMARY_PIN_COOKIE), wrote - запрос выполнил запись.
+        Общий объект для всех сессий запроса, в том числе параллельных.
+    """
+
+    def __init__(self, pinned: bool = False):
+        self.pinned = pinned
+        self.wrote = False
+
+
+#   закрепление текущего HTTP-запроса (None - вне запроса)
+primary_pin: ContextVar[Optional[PrimaryPin]] = ContextVar('primary_pin', default=None)
+
+
+class RoutingSession(Session):
+    """
+        Сессия с маршрутизацией запросов:
+            - чтения внутри replica_read уходят на реплику
+            - запись и все чтения после нее идут на основную БД
+              (сессия живет один запрос, поэтому закрепление - на запрос)
+            - следующие запросы клиента DB_REPLICA_PIN_SECONDS секунд после
+              записи тоже читают основную БД (см. PrimaryPinMiddleware)
+    """
+
+    def __init__(self, *args, replica_bind: Optional[Engine] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        pin = primary_pin.get()
+        if self._flushing or (clause is not None and not getattr(clause, 'is_select', False)):
+            self.info['primary_pinned'] = True
+            if pin is not None:
+                pin.wrote = True
+        elif (
+            self.replica_bind is not None
+            and use_replica.get()
+            and not self.info.get('primary_pinned')
+            and not (pin is not None and pin.pinned)
+        ):
+            return self.replica_bind
+
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+#   после коммита запрос должен видеть свои изменения - только основная БД
+@event.listens_for(RoutingSession, 'after_commit')
+def _pin_primary(session: Session) -> None:
+    session.info['primary_pinned'] = True
+
+
+#   отметка метода сервиса как чтения, которое можно выполнить на реплике
+def replica_read(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        token = use_replica.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            use_replica.reset(token)
+    return wrapper
+
+
+class PrimaryPinMiddleware:
+    """
+        ASGI-middleware чтения своих записей между запросами:
+            - ответ на запрос с записью получает подписанную cookie со сроком
+              закрепления (редирект POST -> GET тоже)
+            - пока срок не истек, replica_read запросы клиента идут на основную БД
+    """
+
+    def __init__(self, app, seconds: int, secret: str):
+        self.app = app
+        self.seconds = seconds
+        self.secret = secret.encode()
+
+    def _sign(self, until: int) -> str:
+        return hmac.new(self.secret, str(until).encode(), hashlib.sha256).hexdigest()
+
+    def _pinned(self, value: Optional[str]) -> bool:
+        until, _, signature = (value or '').partition('.')
+        if not until.isdigit() or not hmac.compare_digest(signature, self._sign(int(until))):
+            return False
+        return 0 <= int(until) - time.time() <= self.seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or self.seconds <= 0:
+            return await self.app(scope, receive, send)
+
+        pin = PrimaryPin(self._pinned(Request(scope).cookies.get(PRIMARY_PIN_COOKIE)))
+        token = primary_pin.set(pin)
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start' and pin.wrote:
+                until = int(time.time()) + self.seconds
+                cookie = (
+                    f'{PRIMARY_PIN_COOKIE}={until}.{self._sign(until)}; '
+                    f'Max-Age={self.seconds}; Path=/; HttpOnly; SameSite=lax'
+                )
+                headers = list(message.get('headers', []))
+                headers.append((b'set-cookie', cookie.encode()))
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            primary_pin.reset(token)
+
+
 #   инициализация движка и сессии для Алхимии
 class Database:
     def __init__(self, setting: Setting):
-        self.engine = create_async_engine(
-            url=setting.DB_POSTGRES_URL, echo=True, pool_size=5, max_overflow=10
+        self.engine = self._create_engine(setting, setting.DB_POSTGRES_URL)
+        self.replica_engine = (
+            self._create_engine(setting, setting.DB_REPLICA_URL)
+            if setting.DB_REPLICA_URL else None
+        )
+        self.session = async_sessionmaker(
+            self.engine,
+            sync_session_class=RoutingSession,
+            replica_bind=self.replica_engine.sync_engine if self.replica_engine else None
+        )
+
+    @staticmethod
+    def _create_engine(setting: Setting, url: str):
+        engine = create_async_engine(
+            url=url, echo=setting.DB_ECHO,
+            poolclass=TimedQueuePool,
+            pool_size=setting.DB_POOL_SIZE,
+            max_overflow=setting.DB_MAX_OVERFLOW,
+            pool_timeout=setting.DB_POOL_TIMEOUT
         )
-        self.session = async_sessionmaker(self.engine)
+        instrument_engine(engine)
+
+        return engine
     
+    #   одна сессия (и одно соединение) на запрос: ее получают проверка
+    #   пользователя, UserManager и все сервисы эндпоинта
     def get_session(self):
-        async def _session():
-            async with self.session() as session:
+        async def _session(request: Request):
+            session = getattr(request.state, 'db_session', None)
+            if session is not None:
                 yield session
+                return
+
+            async with self.session() as session:
+                request.state.db_session = session
+                try:
+                    yield session
+                finally:
+                    del request.state.db_session
         return _session
 
 
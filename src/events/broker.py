@@ -0,0 +1,140 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Iterable, Optional
+
+from config import get_setting
+
+
+setting = get_setting()
+
+#   событие вместо вытесненных: клиент перечитывает страницу целиком
+RESET_EVENT = {'type': 'reset'}
+
+
+class Subscription:
+    """
+        Подписка одного SSE-соединения.
+
+        Очередь ограничена: при переполнении она очищается и в нее кладется
+        RESET_EVENT, поэтому медленный клиент не накапливает память, а
+        получает одно событие вместо пропущенных.
+    """
+
+    def __init__(self, user_id: int, company_id: Optional[int], max_size: int):
+        self.user_id = user_id
+        self.company_id = company_id
+        self.dropped = 0
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(max_size)
+
+    def put(self, event: dict) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self.dropped += 1
+            self._queue.put_nowait(RESET_EVENT)
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        #   None - за timeout событий не было
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBroker:
+    """
+        Брокер событий процесса для SSE-потоков:
+            - подписки соединений по пользователю и по компании
+            - публикация без ожидания (put_nowait) из сервисов после коммита
+            - ограничение числа соединений пользователя
+
+        Брокер живет в памяти процесса: при нескольких воркерах клиент
+        получает события, опубликованные его воркером.
+    """
+
+    def __init__(self, queue_size: int, max_connections: int):
+        self.queue_size = queue_size
+        self.max_connections = max_connections
+        self.published = 0
+        self.dropped = 0
+        self._users: defaultdict[int, set[Subscription]] = defaultdict(set)
+        self._companies: defaultdict[int, set[Subscription]] = defaultdict(set)
+
+    def connections(self, user_id: int) -> int:
+        return len(self._users.get(user_id, ()))
+
+    def subscribe(self, user_id: int, company_id: Optional[int]) -> Optional[Subscription]:
+        """
+            Регистрация соединения.
+
+            Args:
+                user_id (int): Идентификатор пользователя.
+                company_id (int): Компания пользователя (события новостей).
+
+            Returns:
+                Subscription: Подписка (None - превышено число соединений).
+        """
+
+        if self.connections(user_id) >= self.max_connections:
+            return None
+
+        subscription = Subscription(user_id, company_id, self.queue_size)
+        self._users[user_id].add(subscription)
+        if company_id:
+            self._companies[company_id].add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self.dropped += subscription.dropped
+        for index, key in ((self._users, subscription.user_id), (self._companies, subscription.company_id)):
+            subscriptions = index.get(key)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del index[key]
+
+    def publish_users(self, user_ids: Iterable[int], event_type: str, **data: Any) -> None:
+        """
+            Событие для соединений пользователей.
+
+            Args:
+                user_ids (Iterable[int]): Получатели (повторы игнорируются).
+                event_type (str): Тип события.
+                data: Поля события.
+        """
+
+        event = {'type': event_type, **data}
+        for user_id in set(user_ids):
+            for subscription in self._users.get(user_id, ()):
+                subscription.put(event)
+        self.published += 1
+
+    def publish_company(self, company_id: int, event_type: str, **data: Any) -> None:
+        """
+            Событие для соединений всех пользователей компании.
+
+            Args:
+                company_id (int): Идентификатор компании.
+                event_type (str): Тип события.
+                data: Поля события.
+        """
+
+        event = {'type': event_type, **data}
+        for subscription in self._companies.get(company_id, ()):
+            subscription.put(event)
+        self.published += 1
+
+    def stats(self) -> dict:
+        subscriptions = [s for group in self._users.values() for s in group]
+        return {
+            'connections': len(subscriptions),
+            'users': len(self._users),
+            'published': self.published,
+            'dropped': self.dropped + sum(s.dropped for s in subscriptions),
+        }
+
+
+broker = EventBroker(setting.SSE_QUEUE_SIZE, setting.SSE_MAX_CONNECTIONS_PER_USER)
\ No newline at end of file
@@ -0,0 +1,80 @@
+import json
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+
+from users.models import User
+from core_depencies import get_user
+from events.broker import Subscription, broker
+from config import get_setting
+
+
+setting = get_setting()
+
+
+events_router = APIRouter(
+    prefix='/users/me/events', tags=['Events']
+)
+
+
+#   сообщение в формате text/event-stream
+def _format(event: dict) -> bytes:
+    data = json.dumps(event, ensure_ascii=False, separators=(',', ':'))
+    return f'event: {event["type"]}\ndata: {data}\n\n'.encode()
+
+#   события подписки до отключения клиента, между ними - heartbeat
+async def _stream(request: Request, subscription: Subscription) -> AsyncIterator[bytes]:
+    #   клиент переподключается через 3 секунды после обрыва
+    yield b'retry: 3000\n\n'
+    while not await request.is_disconnected():
+        event = await subscription.get(setting.SSE_HEARTBEAT_SECONDS)
+        #   комментарий держит соединение открытым через прокси
+        yield _format(event) if event is not None else b': ping\n\n'
+
+
+#   ответ-поток снимает подписку по завершении, в том числе при обрыве
+#   соединения до того, как генератор начал выполняться
+class EventStreamResponse(StreamingResponse):
+    def __init__(self, request: Request, subscription: Subscription):
+        super().__init__(
+            _stream(request, subscription),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+        self.subscription = subscription
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            broker.unsubscribe(self.subscription)
+
+@events_router.get('')
+async def get_events(
+    request: Request,
+    user: User = Depends(get_user)
+) -> StreamingResponse:
+    """
+        Поток событий пользователя (Server-Sent Events): смена статуса его
+        задач, новые комментарии к ним, новости компании.
+
+        Args:
+            request (Request): Запрос (для проверки отключения клиента).
+            user (User): Получение текущего пользователя.
+
+        Returns:
+            StreamingResponse: Поток text/event-stream (429 - превышено
+            число открытых потоков пользователя).
+    """
+
+    #   подписка до начала ответа: при превышении лимита клиент получает
+    #   429, а не пустой поток с переподключением каждые 3 секунды
+    subscription = broker.subscribe(user.id, user.company_id)
+    if subscription is None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail='Слишком много открытых потоков событий'
+        )
+
+    return EventStreamResponse(request, subscription)
\ No newline at end of file
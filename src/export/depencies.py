@@ -0,0 +1,23 @@
+from fastapi import Depends, HTTPException, status
+
+from users.models import User
+from core_depencies import check_role
+from database import db
+from export.service import ExportService
+
+
+#   получение объекта сервиса выгрузки
+def get_export_service() -> ExportService:
+    return ExportService(db.session)
+
+#   выгружать можно только данные своей компании
+def check_export_access(
+    company_id: int, user: User = Depends(check_role)
+) -> User:
+    if user.company_id != company_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Выгрузка доступна только для своей компании'
+        )
+
+    return user
\ No newline at end of file
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from users.models import User
+from export.schemas import ExportDataset, ExportFormat, MEDIA_TYPES
+from export.depencies import get_export_service, check_export_access
+from export.service import ExportService
+
+
+export_router = APIRouter(
+    prefix='/companies/{company_id}/export', tags=['Export']
+)
+
+@export_router.get('/{dataset}')
+async def export_dataset(
+    company_id: int,
+    dataset: ExportDataset,
+    export_format: ExportFormat = Query(ExportFormat.ndjson, alias='format'),
+    user: User = Depends(check_export_access),
+    service: ExportService = Depends(get_export_service)
+) -> StreamingResponse:
+    """
+        Потоковая выгрузка данных компании.
+
+        Args:
+            company_id (int): Идентификатор компании.
+            dataset (ExportDataset): Набор данных (users, tasks, meetings,
+                calendar, ratings).
+            export_format (ExportFormat): Формат выгрузки (ndjson, csv).
+            user (User): Получение текущего пользователя.
+            service (ExportService): Сервис выгрузки.
+
+        Returns:
+            StreamingResponse: Файл выгрузки, отдаваемый по частям.
+    """
+
+    filename = f'{dataset.value}-{company_id}.{export_format.value}'
+
+    return StreamingResponse(
+        service.stream(dataset, company_id, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
\ No newline at end of file
@@ -0,0 +1,21 @@
+import enum
+
+
+class ExportFormat(enum.Enum):
+    ndjson = 'ndjson'
+    csv = 'csv'
+
+
+class ExportDataset(enum.Enum):
+    users = 'users'
+    tasks = 'tasks'
+    meetings = 'meetings'
+    calendar = 'calendar'
+    ratings = 'ratings'
+
+
+#   MIME-типы ответа по формату выгрузки
+MEDIA_TYPES = {
+    ExportFormat.ndjson: 'application/x-ndjson',
+    ExportFormat.csv: 'text/csv; charset=utf-8',
+}
\ No newline at end of file
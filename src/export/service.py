@@ -0,0 +1,181 @@
+import csv
+import enum
+import io
+import json
+from typing import Any, AsyncIterator
+
+from sqlalchemy import Select, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from users.models import User
+from tasks.models.task import Task
+from tasks.models.comment import Comment
+from meeting.models import Meeting
+from calendars.models import Calendar
+from rating.models import Rating
+from export.schemas import ExportDataset, ExportFormat
+
+
+#   строк в одной порции серверного курсора и одном куске ответа
+CHUNK_SIZE = 1000
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+class ExportService:
+    """
+        Сервисный слой потоковой выгрузки данных компании:
+            - пользователи, задачи с комментариями, встречи,
+              события календаря и оценки
+            - чтение серверным курсором (session.stream) порциями
+            - вывод в NDJSON или CSV кусками по мере чтения
+    """
+
+    def __init__(self, session_factory: async_sessionmaker):
+        self.session_factory = session_factory
+
+    def build_query(self, dataset: ExportDataset, company_id: int) -> Select:
+        """
+            Запрос выгрузки набора данных компании.
+
+            Args:
+                dataset (ExportDataset): Набор данных.
+                company_id (int): Идентификатор компании.
+
+            Returns:
+                Select: Запрос с плоскими колонками, упорядоченный по id.
+        """
+
+        if dataset is ExportDataset.users:
+            return (
+                select(
+                    User.id, User.first_name, User.last_name, User.email,
+                    User.company_role, User.department_id
+                )
+                .where(User.company_id == company_id)
+                .order_by(User.id)
+            )
+
+        if dataset is ExportDataset.tasks:
+            comments = (
+                select(
+                    func.coalesce(
+                        func.json_agg(
+                            aggregate_order_by(
+                                func.json_build_object(
+                                    literal_column("'id'"), Comment.id,
+                                    literal_column("'author_id'"), Comment.author_id,
+                                    literal_column("'description'"), Comment.description
+                                ),
+                                Comment.id
+                            )
+                        ),
+                        literal_column("'[]'::json")
+                    )
+                )
+                .where(Comment.task_id == Task.id)
+                .scalar_subquery()
+            )
+            return (
+                select(
+                    Task.id, Task.owner_id, Task.target_id, Task.start_date,
+                    Task.end_date, Task.title, Task.description, Task.status,
+                    comments.label('comments')
+                )
+                .where(Task.company_id == company_id)
+                .order_by(Task.id)
+            )
+
+        if dataset is ExportDataset.meetings:
+            return (
+                select(
+                    Meeting.id, Meeting.organizer_id, Meeting.title, Meeting.description,
+                    Meeting.meeting_date, Meeting.meeting_time
+                )
+                .where(Meeting.company_id == company_id)
+                .order_by(Meeting.id)
+            )
+
+        if dataset is ExportDataset.calendar:
+            return (
+                select(
+                    Calendar.id, Calendar.user_id, Calendar.event_date, Calendar.event_time,
+                    Calendar.title, Calendar.type_event, Calendar.task_id, Calendar.meeting_id
+                )
+                .join(User, User.id == Calendar.user_id)
+                .where(User.company_id == company_id)
+                .order_by(Calendar.id)
+            )
+
+        return (
+            select(
+                Rating.id, Rating.task_id, Rating.owner_id, Rating.head_id,
+                Rating.score_date, Rating.score_quality, Rating.score_complete,
+                Rating.created_at
+            )
+            .join(Task, Task.id == Rating.task_id)
+            .where(Task.company_id == company_id)
+            .order_by(Rating.id)
+        )
+
+    async def stream(
+        self, dataset: ExportDataset, company_id: int, export_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        """
+            Потоковая выгрузка набора данных.
+
+            Генератор открывает собственную сессию: ответ отправляется
+            после закрытия сессии запроса. В памяти одновременно находится
+            не больше CHUNK_SIZE строк.
+
+            Args:
+                dataset (ExportDataset): Набор данных.
+                company_id (int): Идентификатор компании.
+                export_format (ExportFormat): Формат выгрузки.
+
+            Returns:
+                AsyncIterator[bytes]: Куски файла выгрузки.
+        """
+
+        query = self.build_query(dataset, company_id)
+        columns = [column.name for column in query.selected_columns]
+
+        if export_format is ExportFormat.csv:
+            yield self._csv_chunk([columns])
+
+        async with self.session_factory() as session:
+            result = await session.stream(
+                query.execution_options(yield_per=CHUNK_SIZE)
+            )
+            async for rows in result.partitions():
+                if export_format is ExportFormat.csv:
+                    yield self._csv_chunk(
+                        [[self._csv_value(value) for value in row] for row in rows]
+                    )
+                else:
+                    yield ''.join(
+                        json.dumps(
+                            {name: _plain(value) for name, value in zip(columns, row)},
+                            ensure_ascii=False
+                        ) + '\n'
+                        for row in rows
+                    ).encode()
+
+    @staticmethod
+    def _csv_value(value: Any) -> Any:
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, ensure_ascii=False)
+        return _plain(value)
+
+    @staticmethod
+    def _csv_chunk(rows: list[list]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode()
\ No newline at end of file
@@ -7,10 +7,15 @@ from company.router.department import department_router
 from news.router import news_router
 from tasks.router.task import task_router
 from tasks.router.comment import comment_router
-from rating.router import rating_router
+from rating.router import rating_router, company_rating_router
 from meeting.router import meeting_router
-from calendars.router import calendar_router
-from database import db
+from calendars.router import calendar_router, calendar_feed_router
+from export.router import export_router
+from search.router import search_router
+from events.router import events_router
+from core.router import metrics_router
+from core.instrumentation import SQLInstrumentationMiddleware
+from database import db, PrimaryPinMiddleware
 from config import get_setting
 from admin.setup import init_admin
 from web.router import router as web_router
@@ -23,6 +28,16 @@ STATIC_DIR = setting.STATIC_DIR
 
 app = FastAPI(title='Final project')
 
+#   статистика SQL по запросам: Server-Timing, лог, поиск N+1
+app.add_middleware(SQLInstrumentationMiddleware)
+
+#   чтение своих записей после редиректа: без реплики не нужно
+if setting.DB_REPLICA_URL:
+    app.add_middleware(
+        PrimaryPinMiddleware,
+        seconds=setting.DB_REPLICA_PIN_SECONDS, secret=setting.SECRET
+    )
+
 #   подключение статики
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
@@ -42,5 +57,11 @@ app.include_router(news_router)
 app.include_router(task_router)
 app.include_router(comment_router)
 app.include_router(rating_router)
+app.include_router(company_rating_router)
 app.include_router(meeting_router)
 app.include_router(calendar_router)
+app.include_router(calendar_feed_router)
+app.include_router(export_router)
+app.include_router(search_router)
+app.include_router(events_router)
+app.include_router(metrics_router)
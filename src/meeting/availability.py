@@ -0,0 +1,121 @@
+from datetime import date, datetime, time, timedelta
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+#   минуты от полуночи
+def _minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+class SlotGrid:
+    """
+        Сетка слотов рабочего времени для подбора встреч:
+            - занятость каждого пользователя - битовая карта (дни x слоты)
+            - общая занятость - поразрядное ИЛИ карт участников
+            - начало встречи - слот, после которого подряд свободно
+              столько слотов, сколько длится встреча
+    """
+
+    def __init__(
+        self, date_from: date, date_to: date,
+        day_start: time, day_end: time, slot_minutes: int
+    ):
+        self.date_from = date_from
+        self.days = (date_to - date_from).days + 1
+        self.day_start = _minutes(day_start)
+        self.slot_minutes = slot_minutes
+        self.slots_per_day = max((_minutes(day_end) - self.day_start) // slot_minutes, 0)
+
+    def busy_bitmaps(
+        self, users: int, user_index: Sequence[int], event_dates: Sequence[date],
+        event_times: Sequence[time], duration_minutes: int
+    ) -> np.ndarray:
+        """
+            Битовые карты занятости участников.
+
+            Событие занимает все слоты, пересекающиеся с интервалом
+            [время события, время события + длительность встречи).
+
+            Args:
+                users (int): Число участников.
+                user_index (Sequence[int]): Номер участника для каждого события.
+                event_dates (Sequence[date]): Даты событий.
+                event_times (Sequence[time]): Время событий.
+                duration_minutes (int): Длительность события в минутах.
+
+            Returns:
+                np.ndarray: Массив bool формы (участники, дни, слоты).
+        """
+
+        busy = np.zeros((users, self.days, self.slots_per_day), dtype=bool)
+        if not len(user_index):
+            return busy
+
+        owner = np.asarray(user_index, dtype=np.int64)
+        day = np.array([(event_date - self.date_from).days for event_date in event_dates])
+        start = np.array([_minutes(event_time) for event_time in event_times]) - self.day_start
+
+        first = np.floor_divide(start, self.slot_minutes)
+        last = -np.floor_divide(-(start + duration_minutes), self.slot_minutes)
+        first = np.clip(first, 0, self.slots_per_day)
+        last = np.clip(last, 0, self.slots_per_day)
+
+        for offset in range(int((last - first).max(initial=0))):
+            slot = first + offset
+            mask = slot < last
+            busy[owner[mask], day[mask], slot[mask]] = True
+
+        return busy
+
+    def free_starts(
+        self, busy: np.ndarray, length: int, weekends: bool = False,
+        now: Optional[datetime] = None
+    ) -> np.ndarray:
+        """
+            Слоты, с которых можно начать встречу всем участникам.
+
+            Args:
+                busy (np.ndarray): Карты занятости (участники, дни, слоты).
+                length (int): Длительность встречи в слотах.
+                weekends (bool): Предлагать субботу и воскресенье.
+                now (datetime): Слоты раньше этого момента не предлагаются.
+
+            Returns:
+                np.ndarray: Массив bool формы (дни, слоты).
+        """
+
+        combined = np.logical_or.reduce(busy, axis=0) if len(busy) else np.zeros(
+            (self.days, self.slots_per_day), dtype=bool
+        )
+        starts = np.zeros_like(combined)
+        if length < 1 or length > self.slots_per_day:
+            return starts
+
+        #   занятых слотов в окне [s, s + length) - разность префиксных сумм
+        prefix = np.zeros((self.days, self.slots_per_day + 1), dtype=np.int32)
+        np.cumsum(combined, axis=1, out=prefix[:, 1:])
+        window = prefix[:, length:] - prefix[:, :-length]
+        starts[:, :window.shape[1]] = window == 0
+
+        if not weekends:
+            weekday = (self.date_from.weekday() + np.arange(self.days)) % 7
+            starts[weekday >= 5] = False
+        if now is not None:
+            passed = self.to_index(now)
+            starts.reshape(-1)[:max(min(passed, starts.size), 0)] = False
+
+        return starts
+
+    def to_index(self, moment: datetime) -> int:
+        #   номер первого слота, начинающегося не раньше moment
+        day = (moment.date() - self.date_from).days
+        minutes = moment.hour * 60 + moment.minute - self.day_start
+        slot = -(-minutes // self.slot_minutes)
+        return day * self.slots_per_day + min(max(slot, 0), self.slots_per_day)
+
+    def to_slot(self, index: int) -> tuple[date, time]:
+        day, slot = divmod(int(index), self.slots_per_day)
+        minutes = self.day_start + slot * self.slot_minutes
+        return self.date_from + timedelta(days=day), time(minutes // 60, minutes % 60)
\ No newline at end of file
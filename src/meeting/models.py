@@ -1,12 +1,18 @@
 from datetime import date, time
 from typing import Optional
+import enum
 
-from sqlalchemy import ForeignKey, Index
+from sqlalchemy import Enum, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database import Base
 
 
+class RecurrenceFreq(enum.Enum):
+    daily = 'daily'
+    weekly = 'weekly'
+
+
 class Meeting(Base):
     """
         Модель встреч компании
@@ -17,8 +23,11 @@ class Meeting(Base):
         - company_id: Идентификатор компании.
         - title: Заголовок встречи.
         - description: Описание встречи.
-        - meeting_date: Дата встречи.
+        - meeting_date: Дата встречи (первого повтора).
         - meeting_time: Время встречи.
+        - recurrence_freq: Частота повтора (None - разовая встреча).
+        - recurrence_interval: Повтор каждые N дней или недель.
+        - recurrence_until: Последняя дата повтора (None - без окончания).
     """
 
     __tablename__ = "meeting"
@@ -38,9 +47,50 @@ class Meeting(Base):
     meeting_date: Mapped[date] = mapped_column(nullable=False)
     meeting_time: Mapped[time] = mapped_column(nullable=False)
 
+    recurrence_freq: Mapped[Optional[RecurrenceFreq]] = mapped_column(
+        Enum(RecurrenceFreq), nullable=True
+    )
+    recurrence_interval: Mapped[int] = mapped_column(default=1, server_default='1', nullable=False)
+    recurrence_until: Mapped[Optional[date]] = mapped_column(nullable=True)
+
     #   настройка индексов
     __table_args__ = (
         Index('idx_meeting_company', 'company_id'),
         Index('idx_meeting_organizer', 'organizer_id'),
         Index('idx_meeting_date_time', 'meeting_date', 'meeting_time'),
+        Index(
+            'idx_meeting_organizer_datetime',
+            'organizer_id', 'meeting_date', 'meeting_time', 'id'
+        ),
+    )
+
+
+class MeetingException(Base):
+    """
+        Модель исключения из повторов встречи: хранятся только
+        отмененные и перенесенные повторы, остальные вычисляются по правилу
+
+        Fields:
+        - id: Идентификатор исключения
+        - meeting_id: Идентификатор повторяющейся встречи.
+        - occurrence_date: Дата повтора по правилу.
+        - cancelled: Повтор отменен.
+        - meeting_date: Новая дата повтора (None - без переноса даты).
+        - meeting_time: Новое время повтора (None - время встречи).
+    """
+
+    __tablename__ = "meeting_exception"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    meeting_id: Mapped[int] = mapped_column(
+        ForeignKey("meeting.id", ondelete="CASCADE"), nullable=False
+    )
+    occurrence_date: Mapped[date] = mapped_column(nullable=False)
+    cancelled: Mapped[bool] = mapped_column(default=False, nullable=False)
+    meeting_date: Mapped[Optional[date]] = mapped_column(nullable=True)
+    meeting_time: Mapped[Optional[time]] = mapped_column(nullable=True)
+
+    #   настройка ограничений
+    __table_args__ = (
+        UniqueConstraint('meeting_id', 'occurrence_date', name='uix_meeting_occurrence'),
     )
\ No newline at end of file
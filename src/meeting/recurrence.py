@@ -0,0 +1,203 @@
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
+from math import lcm
+from typing import Iterable, Iterator, Optional
+
+from meeting.models import MeetingException, RecurrenceFreq
+
+
+#   дата окончания для серий без recurrence_until
+FOREVER = date.max
+
+
+#   шаг серии в днях
+def step_days(freq: Optional[RecurrenceFreq], interval: int) -> int:
+    if freq is RecurrenceFreq.weekly:
+        return 7 * interval
+    return interval
+
+
+@dataclass
+class Series:
+    """
+        Серия событий в одно время: даты start, start + step, ... до until
+        без исключенных дат. Разовое событие - серия из одной даты.
+    """
+
+    start: date
+    time: time
+    step: int = 1
+    until: Optional[date] = None
+    excluded: set[date] = field(default_factory=set)
+
+    def __post_init__(self):
+        if self.until is None:
+            self.until = self.start
+
+    def on_rule(self, day: date) -> bool:
+        return self.start <= day <= self.until and (day - self.start).days % self.step == 0
+
+    def contains(self, day: date, at: Optional[time] = None) -> bool:
+        if at is not None and at != self.time:
+            return False
+        return self.on_rule(day) and day not in self.excluded
+
+    def dates(self, date_from: date, date_to: date) -> Iterator[date]:
+        """
+            Даты серии в периоде - без перебора дат до его начала.
+
+            Args:
+                date_from (date): Начало периода.
+                date_to (date): Конец периода (включительно).
+
+            Returns:
+                Iterator[date]: Даты повторов по возрастанию.
+        """
+
+        first = max(self.start, date_from)
+        last = min(self.until, date_to)
+        if first > last:
+            return
+
+        day = first + timedelta(days=-(first - self.start).days % self.step)
+        while day <= last:
+            if day not in self.excluded:
+                yield day
+            if (last - day).days < self.step:
+                break
+            day += timedelta(days=self.step)
+
+
+def first_common(a: Series, b: Series) -> Optional[date]:
+    """
+        Первая дата, в которую события двух серий совпадают по времени.
+
+        Общие даты двух арифметических прогрессий - прогрессия с шагом
+        НОК(шагов), поэтому проверка не зависит от длины серий; исключенные
+        даты пропускаются (их конечное число).
+
+        Args:
+            a (Series): Первая серия.
+            b (Series): Вторая серия.
+
+        Returns:
+            date: Дата совпадения (None - серии не пересекаются).
+    """
+
+    if a.time != b.time:
+        return None
+    start, until = max(a.start, b.start), min(a.until, b.until)
+    if start > until:
+        return None
+
+    common = lcm(a.step, b.step)
+    day = start + timedelta(days=-(start - a.start).days % a.step)
+    for _ in range(common // a.step):
+        if day > until:
+            return None
+        if (day - b.start).days % b.step == 0:
+            break
+        day += timedelta(days=a.step)
+    else:
+        return None
+
+    while day <= until:
+        if day not in a.excluded and day not in b.excluded:
+            return day
+        if (until - day).days < common:
+            return None
+        day += timedelta(days=common)
+
+    return None
+
+
+def apply_exceptions(
+    series: Series, exceptions: Iterable[MeetingException]
+) -> list[tuple[date, time]]:
+    """
+        Исключение повторов серии: отмененные и перенесенные даты
+        добавляются в excluded, перенесенные повторы возвращаются.
+
+        Args:
+            series (Series): Серия встречи.
+            exceptions (Iterable[MeetingException]): Исключения встречи серии.
+
+        Returns:
+            list[tuple]: Дата и время перенесенных повторов.
+    """
+
+    moved = []
+    for exception in exceptions:
+        if not series.on_rule(exception.occurrence_date):
+            continue
+        series.excluded.add(exception.occurrence_date)
+        if not exception.cancelled:
+            moved.append((
+                exception.meeting_date or exception.occurrence_date,
+                exception.meeting_time or series.time
+            ))
+
+    return moved
+
+def expand(
+    series: Series, exceptions: Iterable[MeetingException], date_from: date, date_to: date
+) -> Iterator[tuple[date, time]]:
+    """
+        Повторы серии в периоде с учетом исключений.
+
+        Args:
+            series (Series): Серия встречи.
+            exceptions (Iterable[MeetingException]): Исключения встречи серии.
+            date_from (date): Начало периода.
+            date_to (date): Конец периода (включительно).
+
+        Returns:
+            Iterator[tuple]: Дата и время каждого повтора.
+    """
+
+    for day, at in apply_exceptions(series, exceptions):
+        if date_from <= day <= date_to:
+            yield day, at
+
+    for day in series.dates(date_from, date_to):
+        yield day, series.time
+
+
+@dataclass
+class Schedule:
+    """
+        Занятость пользователя или встречи: серии и отдельные события
+        (разовые события и перенесенные повторы).
+    """
+
+    series: list[Series] = field(default_factory=list)
+    moved: list[tuple[date, time]] = field(default_factory=list)
+
+    def add(self, series: Series, exceptions: Iterable[MeetingException] = ()) -> None:
+        self.moved.extend(apply_exceptions(series, exceptions))
+        self.series.append(series)
+
+    def conflicts(self, other: 'Schedule') -> bool:
+        """
+            Есть ли у двух расписаний событие в одну дату и время.
+
+            Args:
+                other (Schedule): Второе расписание.
+
+            Returns:
+                bool: Найдено пересечение.
+        """
+
+        if set(self.moved) & set(other.moved):
+            return True
+        for day, at in self.moved:
+            if any(series.contains(day, at) for series in other.series):
+                return True
+        for day, at in other.moved:
+            if any(series.contains(day, at) for series in self.series):
+                return True
+
+        return any(
+            first_common(mine, theirs) is not None
+            for mine in self.series for theirs in other.series
+        )
\ No newline at end of file
@@ -1,15 +1,24 @@
+from datetime import date
 from typing import Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_session
 from users.models import User
 from company.depencies import validate_company_presence
-from meeting.schemas import MeetingCreate, MeetingRead, MeetingChange, MeetingResponse
+from meeting.schemas import (
+    MeetingCreate, MeetingRead, MeetingChange, MeetingResponse,
+    MeetingInvite, MeetingInviteResult, MeetingAvailability, MeetingOccurrenceChange
+)
 from meeting.depencies import check_company_role_meeting
 from meeting.service import MeetingService
 from meeting.depencies import get_meeting_service
+from core.pagination import Page, PageParams, build_page
+from config import get_setting
+
+
+setting = get_setting()
 
 
 meeting_router = APIRouter(
@@ -106,27 +115,137 @@ async def add_user_meeting(
             MeetingResponse: Схема для ответа эндпоинта.
     """
     
-    service.add_user_meeting(user, session, meeting_id, user_id)
+    await service.add_user_meeting(user, session, meeting_id, user_id)
     return MeetingResponse(message='Пользователь успешно добавлен')
 
-@meeting_router.get('', response_model=list[MeetingRead])
+@meeting_router.post('/{meeting_id}/participants/batch', response_model=MeetingInviteResult)
+async def invite_users_meeting(
+    meeting_id: int,
+    data: MeetingInvite,
+    user: User = Depends(check_company_role_meeting),
+    session: AsyncSession = Depends(get_session),
+    service: MeetingService = Depends(get_meeting_service)
+) -> Union[MeetingInviteResult, Exception]:
+    """
+        Приглашение группы пользователей или всего отдела на встречу.
+
+        Args:
+            meeting_id (int): Идентификатор встречи.
+            data (MeetingInvite): Пользователи и/или отдел для приглашения.
+            user (User): Получение текущего пользователя.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (MeetingService): Сервис для создания встреч.
+            
+        Returns:
+            MeetingInviteResult: Добавленные, уже приглашенные и занятые пользователи.
+    """
+
+    return await service.invite_users_meeting(user, session, meeting_id, data)
+
+@meeting_router.patch('/{meeting_id}/occurrences/{occurrence_date}', response_model=MeetingResponse)
+async def change_occurrence(
+    meeting_id: int,
+    occurrence_date: date,
+    data: MeetingOccurrenceChange,
+    user: User = Depends(check_company_role_meeting),
+    session: AsyncSession = Depends(get_session),
+    service: MeetingService = Depends(get_meeting_service)
+) -> Union[MeetingResponse, Exception]:
+    """
+        Перенос одного повтора повторяющейся встречи.
+
+        Args:
+            meeting_id (int): Идентификатор встречи.
+            occurrence_date (date): Дата повтора по правилу встречи.
+            data (MeetingOccurrenceChange): Новые дата и/или время повтора.
+            user (User): Получение текущего пользователя.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (MeetingService): Сервис для создания встреч.
+            
+        Returns:
+            MeetingResponse: Схема для ответа эндпоинта.
+    """
+
+    await service.change_occurrence(user, session, meeting_id, occurrence_date, data)
+    return MeetingResponse(message='Повтор встречи перенесен')
+
+@meeting_router.delete('/{meeting_id}/occurrences/{occurrence_date}', status_code=204)
+async def cancel_occurrence(
+    meeting_id: int,
+    occurrence_date: date,
+    user: User = Depends(check_company_role_meeting),
+    session: AsyncSession = Depends(get_session),
+    service: MeetingService = Depends(get_meeting_service)
+) -> None:
+    """
+        Отмена одного повтора повторяющейся встречи.
+
+        Args:
+            meeting_id (int): Идентификатор встречи.
+            occurrence_date (date): Дата повтора по правилу встречи.
+            user (User): Получение текущего пользователя.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (MeetingService): Сервис для создания встреч.
+    """
+
+    await service.change_occurrence(user, session, meeting_id, occurrence_date)
+
+@meeting_router.get('/availability', response_model=MeetingAvailability)
+async def get_availability(
+    user_ids: list[int] = Query(..., max_length=200),
+    date_from: date = Query(..., alias='from'),
+    date_to: date = Query(..., alias='to'),
+    duration: int = Query(setting.MEETING_DURATION_MINUTES, ge=1, description='Минуты'),
+    limit: int = Query(10, ge=1, le=100),
+    weekends: bool = False,
+    user: User = Depends(check_company_role_meeting),
+    session: AsyncSession = Depends(get_session),
+    service: MeetingService = Depends(get_meeting_service)
+) -> Union[MeetingAvailability, Exception]:
+    """
+        Подбор времени встречи, свободного у всех участников.
+
+        Args:
+            user_ids (list[int]): Идентификаторы участников.
+            date_from (date): Начало периода.
+            date_to (date): Конец периода (включительно).
+            duration (int): Длительность встречи в минутах.
+            limit (int): Число слотов в ответе.
+            weekends (bool): Предлагать выходные дни.
+            user (User): Получение текущего пользователя.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (MeetingService): Сервис для создания встреч.
+            
+        Returns:
+            MeetingAvailability: Ближайшие свободные слоты.
+    """
+
+    return await service.get_availability(
+        user, session, user_ids, date_from, date_to, duration, limit, weekends
+    )
+
+@meeting_router.get('', response_model=Page[MeetingRead])
 async def get_owner_meeting(
+    request: Request,
+    page: PageParams = Depends(),
     user: User = Depends(validate_company_presence),
     session: AsyncSession = Depends(get_session),
     service: MeetingService = Depends(get_meeting_service)
-) -> list[MeetingRead]:
+) -> Page[MeetingRead]:
     """
         Получение списка встреч.
 
         Args:
+            request (Request): Запрос (для ссылки на следующую страницу).
+            page (PageParams): Курсор и размер страницы.
             user (User): Получение текущего пользователя.
             session (AsyncSession): SQLAlchemy-сессия.
             service (MeetingService): Сервис для создания встреч.
             
         Returns:
-            MeetingRead: Схема для отображения встречи.
+            Page[MeetingRead]: Страница встреч.
     """
 
-    result = service.get_meeting(user, session, user.company_id)
+    result = await service.get_meeting(user, session, page)
 
-    return MeetingRead.model_validate(result)
+    return build_page(request, MeetingRead, result)
@@ -1,6 +1,8 @@
 from datetime import date, time
 from typing import Annotated, Optional
-from pydantic import BaseModel, Field, constr, field_validator
+from pydantic import BaseModel, Field, constr, field_validator, model_validator
+
+from meeting.models import RecurrenceFreq
 
 
 class MeetingCreate(BaseModel):
@@ -10,14 +12,29 @@ class MeetingCreate(BaseModel):
         Fields:
         - title: Заголовок встречи.
         - description: Описание встречи.
-        - meeting_date: Дата встречи.
+        - meeting_date: Дата встречи (первого повтора).
         - meeting_time: Время встречи.
+        - recurrence_freq: Частота повтора (daily, weekly; не задана - разовая встреча).
+        - recurrence_interval: Повтор каждые N дней или недель.
+        - recurrence_until: Последняя дата повтора (не задана - без окончания).
     """
 
     title: str = Field(min_length=4, max_length=40)
     description: str = Field(min_length=0, max_length=400)
     meeting_date: date
     meeting_time: time
+    recurrence_freq: Optional[RecurrenceFreq] = None
+    recurrence_interval: int = Field(1, ge=1, le=52)
+    recurrence_until: Optional[date] = None
+
+    @model_validator(mode="after")
+    def check_recurrence(self):
+        if self.recurrence_freq is None:
+            self.recurrence_interval = 1
+            self.recurrence_until = None
+        elif self.recurrence_until and self.recurrence_until < self.meeting_date:
+            raise ValueError('Повторы должны заканчиваться не раньше даты встречи')
+        return self
 
 
 class MeetingRead(BaseModel):
@@ -31,6 +48,9 @@ class MeetingRead(BaseModel):
         - description: Описание встречи.
         - meeting_date: Дата встречи.
         - meeting_time: Время встречи.
+        - recurrence_freq: Частота повтора.
+        - recurrence_interval: Повтор каждые N дней или недель.
+        - recurrence_until: Последняя дата повтора.
     """
 
     organizer_id: int
@@ -39,6 +59,9 @@ class MeetingRead(BaseModel):
     description: str
     meeting_date: date
     meeting_time: time
+    recurrence_freq: Optional[RecurrenceFreq] = None
+    recurrence_interval: int = 1
+    recurrence_until: Optional[date] = None
 
     model_config = {
         'from_attributes': True
@@ -80,4 +103,85 @@ class MeetingResponse(BaseModel):
         добавлении пользователя на встречу
     """
 
-    message: str
\ No newline at end of file
+    message: str
+
+
+class MeetingInvite(BaseModel):
+    """
+        Схема для приглашения группы пользователей на встречу
+
+        Fields:
+        - user_ids: Идентификаторы приглашаемых пользователей.
+        - department_id: Отдел, все сотрудники которого приглашаются.
+    """
+
+    user_ids: list[int] = Field(default_factory=list, max_length=1000)
+    department_id: Optional[int] = None
+
+    @model_validator(mode="after")
+    def check_invitees(self):
+        if not self.user_ids and self.department_id is None:
+            raise ValueError('Нужно указать пользователей или отдел')
+        return self
+
+
+class MeetingInviteResult(BaseModel):
+    """
+        Схема результата приглашения на встречу
+
+        Fields:
+        - added: Пользователи, добавленные на встречу.
+        - already_invited: Пользователи, уже приглашенные на эту встречу.
+        - busy: Пользователи, у которых слот встречи занят другим событием.
+    """
+
+    added: list[int]
+    already_invited: list[int]
+    busy: list[int]
+
+
+class MeetingSlot(BaseModel):
+    """
+        Схема свободного слота для встречи
+
+        Fields:
+        - meeting_date: Дата встречи.
+        - meeting_time: Время начала встречи.
+    """
+
+    meeting_date: date
+    meeting_time: time
+
+
+class MeetingAvailability(BaseModel):
+    """
+        Схема подбора времени встречи
+
+        Fields:
+        - user_ids: Участники, для которых подбиралось время.
+        - duration: Длительность встречи в минутах.
+        - slots: Ближайшие слоты, свободные у всех участников.
+    """
+
+    user_ids: list[int]
+    duration: int
+    slots: list[MeetingSlot]
+
+
+class MeetingOccurrenceChange(BaseModel):
+    """
+        Схема для переноса одного повтора встречи
+
+        Fields:
+        - meeting_date: Новая дата повтора.
+        - meeting_time: Новое время повтора.
+    """
+
+    meeting_date: Optional[date] = None
+    meeting_time: Optional[time] = None
+
+    @model_validator(mode="after")
+    def check_change(self):
+        if self.meeting_date is None and self.meeting_time is None:
+            raise ValueError('Нужно указать новую дату или время')
+        return self
\ No newline at end of file
@@ -1,13 +1,30 @@
-from typing import Union
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Optional, Union
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from users.models import User
-from meeting.schemas import MeetingCreate, MeetingChange
-from meeting.models import Meeting
+from meeting.schemas import (
+    MeetingCreate, MeetingChange, MeetingInvite, MeetingInviteResult,
+    MeetingAvailability, MeetingSlot, MeetingOccurrenceChange
+)
+from meeting.availability import SlotGrid
+from meeting.models import Meeting, MeetingException
+from meeting.recurrence import FOREVER, Schedule, Series, expand, step_days
 from calendars.models import Calendar, CalendarStatus
+from calendars.cache import invalidate_months, invalidate_user_months
+from core.pagination import KeysetPage, PageParams, paginate
+from config import get_setting
+
+
+setting = get_setting()
+
+#   максимальная ширина окна подбора времени встречи
+AVAILABILITY_MAX_DAYS = 62
 
 
 class MeetingService:
@@ -17,6 +34,9 @@ class MeetingService:
             - удаление встреч
             - изменение встреч
             - добавление пользователей на встречу
+            - приглашение группы пользователей или отдела
+            - подбор времени, свободного у всех участников
+            - отмена и перенос повторов встречи
     """
 
     async def create_meeting(
@@ -76,9 +96,17 @@ class MeetingService:
                 detail=f'Можно удалять встречи только своей компании'
             )
 
+        query = select(Calendar.user_id, Calendar.event_date).where(Calendar.meeting_id == meeting_id)
+        events = (await session.execute(query)).all()
+        recurring = target_meeting.recurrence_freq is not None
+
         try:
             await session.delete(target_meeting)
             await session.commit()
+            if recurring:
+                invalidate_user_months(user_id for user_id, _ in events)
+            else:
+                invalidate_months(events)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -121,11 +149,37 @@ class MeetingService:
                 detail=f'Можно изменять встречи только своей компании'
             )
 
+        recurring = target_meeting.recurrence_freq is not None
+        #   серии участников и исключения повторов привязаны к дате и времени
+        #   первого повтора: их перенос - через повторы встречи
+        if recurring and data.keys() & {'meeting_date', 'meeting_time'}:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='Дату и время повторяющейся встречи изменить нельзя, '
+                       'переносите отдельные повторы'
+            )
+
+        query = select(Calendar.user_id).where(Calendar.meeting_id == meeting_id)
+        participants = (await session.execute(query)).scalars().all()
+        meeting_dates = {target_meeting.meeting_date, data.get('meeting_date', target_meeting.meeting_date)}
+
         try:
             for k, v in data.items():
                 setattr(target_meeting, k, v)
+            if 'title' in data:
+                await session.execute(
+                    update(Calendar)
+                    .where(Calendar.meeting_id == meeting_id)
+                    .values(title=data['title'])
+                )
 
             await session.commit()
+            if recurring:
+                invalidate_user_months(participants)
+            else:
+                invalidate_months(
+                    (user_id, meeting_date) for user_id in participants for meeting_date in meeting_dates
+                )
             await session.refresh(target_meeting)
 
             return target_meeting
@@ -174,13 +228,7 @@ class MeetingService:
                 detail=f'Добавленные пользователи должны быть из твоей команды'
             )
 
-        query = select(Calendar).where(
-            Calendar.user_id == user_id, 
-            Calendar.event_date == target_meeting.meeting_date,
-            Calendar.event_time == target_meeting.meeting_time
-        )
-        busy_slot = (await session.execute(query)).scalars().first()
-        if busy_slot:
+        if user_id in await self.find_busy_users(session, target_meeting, [user_id]):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f'У пользователя на данный слот уже есть встреча'
@@ -193,12 +241,20 @@ class MeetingService:
                 'event_time': target_meeting.meeting_time,
                 'title': target_meeting.title,
                 'type_event': CalendarStatus.meeting,
-                'meeting_id': target_meeting.id
+                'meeting_id': target_meeting.id,
+                'event_until': self.series_until(target_meeting)
             }
             calendar_data = Calendar(**calendar_data)
 
+            event_date = calendar_data.event_date
+            recurring = calendar_data.event_until is not None
+
             session.add(calendar_data)
             await session.commit()
+            if recurring:
+                invalidate_user_months([user_id])
+            else:
+                invalidate_months([(user_id, event_date)])
             await session.refresh(calendar_data)
 
         except Exception as e:
@@ -207,19 +263,503 @@ class MeetingService:
                 detail=str(e)
             )
         
-    async def get_meeting(self, user: User, session: AsyncSession) -> list[Meeting]:
+    async def invite_users_meeting(
+        self, user: User, session: AsyncSession, meeting_id: int, data: MeetingInvite
+    ) -> Union[MeetingInviteResult, HTTPException]:
+        """
+            Приглашение группы пользователей или отдела на встречу.
+
+            Принадлежность к компании проверяется одним запросом, занятость
+            с учетом повторов - find_busy_users, записи календаря свободных
+            вставляются одним INSERT ... ON CONFLICT ON CONSTRAINT
+            uix_user_datetime DO NOTHING RETURNING: занятый слот не прерывает
+            приглашение остальных, а ограничение закрывает гонку проверки
+            и вставки.
+
+            Args:
+                user (User): Получение текущего пользователя.
+                session (AsyncSession): SQLAlchemy-сессия.
+                meeting_id (int): Идентификатор встречи
+                data (MeetingInvite): Пользователи и/или отдел для приглашения
+
+            Returns:
+                MeetingInviteResult: Добавленные, уже приглашенные и занятые пользователи.
+        """
+
+        query = select(Meeting).where(Meeting.id == meeting_id)
+        target_meeting = (await session.execute(query)).scalars().first()
+        if not target_meeting:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Встреча с таким id {meeting_id} не существует'
+            )
+        if target_meeting.company_id != user.company_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f'Можно изменять встречи только своей компании'
+            )
+
+        conditions = []
+        if data.user_ids:
+            conditions.append(User.id.in_(data.user_ids))
+        if data.department_id is not None:
+            conditions.append(User.department_id == data.department_id)
+
+        query = select(User.id, User.company_id).where(or_(*conditions))
+        invitees = dict((await session.execute(query)).all())
+
+        missing = sorted(set(data.user_ids) - invitees.keys())
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Пользователей с id {missing} не существует'
+            )
+        if not invitees:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'В отделе с id {data.department_id} нет сотрудников'
+            )
+        foreign = sorted(
+            user_id for user_id, company_id in invitees.items()
+            if company_id != user.company_id
+        )
+        if foreign:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f'Добавленные пользователи {foreign} должны быть из твоей команды'
+            )
+
+        busy = await self.find_busy_users(session, target_meeting, list(invitees))
+        free = sorted(invitees.keys() - busy)
+        event_until = self.series_until(target_meeting)
+
+        try:
+            added = set()
+            if free:
+                query = (
+                    insert(Calendar)
+                    .values([
+                        {
+                            'user_id': user_id,
+                            'event_date': target_meeting.meeting_date,
+                            'event_time': target_meeting.meeting_time,
+                            'title': target_meeting.title,
+                            'type_event': CalendarStatus.meeting,
+                            'meeting_id': target_meeting.id,
+                            'event_until': event_until
+                        }
+                        for user_id in free
+                    ])
+                    .on_conflict_do_nothing(constraint='uix_user_datetime')
+                    .returning(Calendar.user_id)
+                )
+                added = set((await session.execute(query)).scalars().all())
+
+            already_invited = set()
+            conflicted = invitees.keys() - added
+            if conflicted:
+                query = select(Calendar.user_id).where(
+                    Calendar.user_id.in_(conflicted),
+                    Calendar.meeting_id == target_meeting.id
+                )
+                already_invited = set((await session.execute(query)).scalars().all())
+
+            meeting_date = target_meeting.meeting_date
+            await session.commit()
+            if event_until is not None:
+                invalidate_user_months(added)
+            else:
+                invalidate_months((user_id, meeting_date) for user_id in added)
+
+            return MeetingInviteResult(
+                added=sorted(added),
+                already_invited=sorted(already_invited),
+                busy=sorted(conflicted - already_invited)
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=str(e)
+            )
+
+    async def get_availability(
+        self, user: User, session: AsyncSession, user_ids: list[int],
+        date_from: date, date_to: date, duration: int,
+        limit: int, weekends: bool = False
+    ) -> Union[MeetingAvailability, HTTPException]:
+        """
+            Подбор ближайших слотов, свободных у всех участников.
+
+            Участники и их события за период (включая серии, начавшиеся
+            раньше) загружаются одним запросом, повторы разворачиваются
+            в периоде, занятость считается битовыми картами NumPy (см. SlotGrid).
+
+            Args:
+                user (User): Получение текущего пользователя.
+                session (AsyncSession): SQLAlchemy-сессия.
+                user_ids (list[int]): Идентификаторы участников.
+                date_from (date): Начало периода.
+                date_to (date): Конец периода (включительно).
+                duration (int): Длительность встречи в минутах.
+                limit (int): Число слотов в ответе.
+                weekends (bool): Предлагать выходные дни.
+
+            Returns:
+                MeetingAvailability: Ближайшие свободные слоты.
+        """
+
+        if date_to < date_from or (date_to - date_from).days >= AVAILABILITY_MAX_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f'Период должен быть не длиннее {AVAILABILITY_MAX_DAYS} дней'
+            )
+
+        user_ids = sorted(set(user_ids))
+        query = (
+            select(
+                User.id, User.company_id, Calendar.event_date, Calendar.event_time,
+                Calendar.event_until, Calendar.meeting_id,
+                Meeting.recurrence_freq, Meeting.recurrence_interval
+            )
+            .outerjoin(Calendar, and_(
+                Calendar.user_id == User.id,
+                Calendar.event_time.is_not(None),
+                or_(
+                    and_(Calendar.event_date >= date_from, Calendar.event_date <= date_to),
+                    and_(
+                        Calendar.event_until.is_not(None),
+                        Calendar.event_until >= date_from,
+                        Calendar.event_date < date_from
+                    )
+                )
+            ))
+            .outerjoin(Meeting, Meeting.id == Calendar.meeting_id)
+            .where(User.id.in_(user_ids))
+        )
+        rows = (await session.execute(query)).all()
+
+        companies = {row.id: row.company_id for row in rows}
+        missing = [user_id for user_id in user_ids if user_id not in companies]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Пользователей с id {missing} не существует'
+            )
+        foreign = [user_id for user_id in user_ids if companies[user_id] != user.company_id]
+        if foreign:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f'Пользователи {foreign} не из твоей команды'
+            )
+
+        grid = SlotGrid(
+            date_from, date_to, setting.MEETING_DAY_START,
+            setting.MEETING_DAY_END, setting.MEETING_SLOT_MINUTES
+        )
+        exceptions = await self.get_exceptions(
+            session, [row.meeting_id for row in rows if row.event_until], date_from, date_to
+        )
+        index = {user_id: i for i, user_id in enumerate(user_ids)}
+        events = []
+        for row in rows:
+            if row.event_date is None:
+                continue
+            if row.event_until is None:
+                events.append((index[row.id], row.event_date, row.event_time))
+                continue
+
+            series = Series(
+                row.event_date, row.event_time,
+                step_days(row.recurrence_freq, row.recurrence_interval), row.event_until
+            )
+            events.extend(
+                (index[row.id], day, at)
+                for day, at in expand(series, exceptions[row.meeting_id], date_from, date_to)
+            )
+
+        busy = grid.busy_bitmaps(
+            len(user_ids),
+            [event[0] for event in events],
+            [event[1] for event in events],
+            [event[2] for event in events],
+            setting.MEETING_DURATION_MINUTES
+        )
+
+        length = -(-duration // setting.MEETING_SLOT_MINUTES)
+        starts = grid.free_starts(busy, length, weekends, datetime.now())
+        slots = [grid.to_slot(i) for i in starts.reshape(-1).nonzero()[0][:limit]]
+
+        return MeetingAvailability(
+            user_ids=user_ids,
+            duration=duration,
+            slots=[
+                MeetingSlot(meeting_date=meeting_date, meeting_time=meeting_time)
+                for meeting_date, meeting_time in slots
+            ]
+        )
+
+    async def change_occurrence(
+        self, user: User, session: AsyncSession, meeting_id: int,
+        occurrence_date: date, data: Optional[MeetingOccurrenceChange] = None
+    ) -> Union[None, HTTPException]:
         """
-            Получение созданных встреч.
+            Перенос или отмена одного повтора встречи.
+
+            Повтор хранится как исключение; при повторном изменении прежнее
+            исключение заменяется новой строкой. Перенос возможен только
+            в пределах серии и на слот, свободный у всех участников.
 
             Args:
                 user (User): Получение текущего пользователя.
                 session (AsyncSession): SQLAlchemy-сессия.
+                meeting_id (int): Идентификатор встречи
+                occurrence_date (date): Дата повтора по правилу встречи
+                data (MeetingOccurrenceChange): Новые дата и время (None - отмена повтора)
+        """
+
+        query = select(Meeting).where(Meeting.id == meeting_id)
+        target_meeting = (await session.execute(query)).scalars().first()
+        if not target_meeting:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Встреча с таким id {meeting_id} не существует'
+            )
+        if target_meeting.company_id != user.company_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f'Можно изменять встречи только своей компании'
+            )
+        if target_meeting.recurrence_freq is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f'Встреча {meeting_id} не повторяется'
+            )
+        series = self.meeting_series(target_meeting)
+        if not series.on_rule(occurrence_date):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'У встречи нет повтора {occurrence_date}'
+            )
+
+        query = select(Calendar.user_id).where(Calendar.meeting_id == meeting_id)
+        participants = (await session.execute(query)).scalars().all()
+
+        if data:
+            #   серия читается по периоду [event_date, event_until]: повтор
+            #   за его пределами пропал бы из расписаний и подбора времени
+            moved = Series(
+                data.meeting_date or occurrence_date,
+                data.meeting_time or target_meeting.meeting_time
+            )
+            if not series.start <= moved.start <= series.until:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f'Повтор можно перенести только в пределах серии '
+                           f'({series.start} - {series.until})'
+                )
+            moved_schedule = Schedule()
+            moved_schedule.add(moved)
+            busy = await self.find_schedule_conflicts(
+                session, moved_schedule, participants, exclude_meeting_id=meeting_id
+            )
+            if busy:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail=f'У пользователей {sorted(busy)} на новый слот уже есть встреча'
+                )
+        query = select(MeetingException).where(
+            MeetingException.meeting_id == meeting_id,
+            MeetingException.occurrence_date == occurrence_date
+        )
+        previous = (await session.execute(query)).scalars().first()
+        dates = {occurrence_date, data.meeting_date if data else None}
+        if previous:
+            dates.add(previous.meeting_date)
+
+        try:
+            if previous:
+                await session.delete(previous)
+                await session.flush()
+
+            session.add(MeetingException(
+                meeting_id=meeting_id,
+                occurrence_date=occurrence_date,
+                cancelled=data is None,
+                meeting_date=data.meeting_date if data else None,
+                meeting_time=data.meeting_time if data else None
+            ))
+            await session.commit()
+            invalidate_months(
+                (user_id, day) for user_id in participants for day in dates if day
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=str(e)
+            )
+
+    async def find_busy_users(
+        self, session: AsyncSession, meeting: Meeting, user_ids: list[int]
+    ) -> set[int]:
+        """
+            Пользователи, у которых хотя бы одно событие встречи (с учетом
+            повторов и исключений) совпадает по дате и времени с их событиями.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                meeting (Meeting): Встреча.
+                user_ids (list[int]): Идентификаторы пользователей.
+
+            Returns:
+                set[int]: Идентификаторы занятых пользователей.
+        """
+
+        series = self.meeting_series(meeting)
+        meeting_schedule = Schedule()
+        exceptions = (
+            await self.get_exceptions(session, [meeting.id])
+            if meeting.recurrence_freq else {}
+        )
+        meeting_schedule.add(series, exceptions.get(meeting.id, []))
+
+        return await self.find_schedule_conflicts(session, meeting_schedule, user_ids)
+
+    async def find_schedule_conflicts(
+        self, session: AsyncSession, schedule: Schedule, user_ids: list[int],
+        exclude_meeting_id: Optional[int] = None
+    ) -> set[int]:
+        """
+            Пользователи, у которых событие совпадает по дате и времени
+            с событиями расписания.
+
+            Читаются разовые события в периоде расписания и все серии
+            пользователей (частичный индекс idx_calendar_user_until), серии
+            сравниваются арифметически, без перебора повторов.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                schedule (Schedule): Проверяемые события.
+                user_ids (list[int]): Идентификаторы пользователей.
+                exclude_meeting_id (int): Встреча, события которой не учитываются.
+
+            Returns:
+                set[int]: Идентификаторы занятых пользователей.
+        """
+
+        if not user_ids or not schedule.series:
+            return set()
+
+        window_start = min([item.start for item in schedule.series] + [day for day, _ in schedule.moved])
+        window_end = max([item.until for item in schedule.series] + [day for day, _ in schedule.moved])
+
+        query = (
+            select(
+                Calendar.user_id, Calendar.event_date, Calendar.event_time,
+                Calendar.event_until, Calendar.meeting_id,
+                Meeting.recurrence_freq, Meeting.recurrence_interval
+            )
+            .outerjoin(Meeting, Meeting.id == Calendar.meeting_id)
+            .where(
+                Calendar.user_id.in_(user_ids),
+                Calendar.event_time.is_not(None),
+                or_(
+                    and_(
+                        Calendar.event_until.is_(None),
+                        Calendar.event_date >= window_start,
+                        Calendar.event_date <= window_end
+                    ),
+                    Calendar.event_until.is_not(None)
+                )
+            )
+        )
+        if exclude_meeting_id is not None:
+            query = query.where(or_(
+                Calendar.meeting_id.is_(None), Calendar.meeting_id != exclude_meeting_id
+            ))
+        rows = (await session.execute(query)).all()
+
+        series_exceptions = await self.get_exceptions(
+            session, [row.meeting_id for row in rows if row.event_until], window_start, window_end
+        )
+        schedules = defaultdict(Schedule)
+        for row in rows:
+            schedules[row.user_id].add(
+                Series(
+                    row.event_date, row.event_time,
+                    step_days(row.recurrence_freq, row.recurrence_interval), row.event_until
+                ),
+                series_exceptions[row.meeting_id] if row.event_until else ()
+            )
+
+        return {
+            user_id for user_id, user_schedule in schedules.items()
+            if user_schedule.conflicts(schedule)
+        }
+
+    async def get_exceptions(
+        self, session: AsyncSession, meeting_ids: list[int],
+        date_from: Optional[date] = None, date_to: Optional[date] = None
+    ) -> defaultdict[int, list[MeetingException]]:
+        """
+            Исключения повторов встреч, затрагивающие период.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                meeting_ids (list[int]): Идентификаторы встреч.
+                date_from (date): Начало периода (None - без ограничения).
+                date_to (date): Конец периода (None - без ограничения).
+
+            Returns:
+                defaultdict: Исключения по идентификатору встречи.
+        """
+
+        exceptions = defaultdict(list)
+        if not meeting_ids:
+            return exceptions
+
+        query = select(MeetingException).where(MeetingException.meeting_id.in_(set(meeting_ids)))
+        if date_from is not None and date_to is not None:
+            query = query.where(or_(
+                MeetingException.occurrence_date.between(date_from, date_to),
+                MeetingException.meeting_date.between(date_from, date_to)
+            ))
+        for exception in (await session.execute(query)).scalars():
+            exceptions[exception.meeting_id].append(exception)
+
+        return exceptions
+
+    @staticmethod
+    def series_until(meeting: Meeting) -> Optional[date]:
+        #   event_until записи календаря: только у повторяющихся встреч
+        if meeting.recurrence_freq is None:
+            return None
+        return meeting.recurrence_until or FOREVER
+
+    @staticmethod
+    def meeting_series(meeting: Meeting) -> Series:
+        return Series(
+            meeting.meeting_date, meeting.meeting_time,
+            step_days(meeting.recurrence_freq, meeting.recurrence_interval),
+            MeetingService.series_until(meeting)
+        )
+
+    async def get_meeting(
+        self, user: User, session: AsyncSession, page: Optional[PageParams] = None
+    ) -> KeysetPage[Meeting]:
+        """
+            Получение созданных встреч по дате и времени.
+
+            Args:
+                user (User): Получение текущего пользователя.
+                session (AsyncSession): SQLAlchemy-сессия.
+                page (PageParams): Параметры страницы (None - все встречи).
             
             Returns:
-                meetings_created (list[Meeting]): Список встреч.
+                meetings_created (KeysetPage[Meeting]): Страница встреч.
         """
         
         query = select(Meeting).where(Meeting.organizer_id == user.id)
-        meetings_created = (await session.execute(query)).scalars().all()
 
-        return meetings_created
+        return await paginate(
+            session, query, (Meeting.meeting_date, Meeting.meeting_time, Meeting.id), page
+        )
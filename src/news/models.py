@@ -1,4 +1,7 @@
-from sqlalchemy import String, Index, ForeignKey
+from typing import Optional
+
+from sqlalchemy import String, Index, ForeignKey, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import mapped_column, Mapped
 
 from database import Base
@@ -15,6 +18,7 @@ class News(Base):
         - company_id: Идентификатор компании.
         - title: Заголовок новости.
         - description: Тело новости.
+        - search_vector: Поисковый вектор заголовка (вес A) и тела (вес B).
     """
 
     __tablename__ = 'news'
@@ -28,9 +32,20 @@ class News(Base):
     )
     title: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str] = mapped_column(String(1024), nullable=False)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('russian', title), 'A') || "
+            "setweight(to_tsvector('russian', description), 'B')",
+            persisted=True
+        ),
+        deferred=True
+    )
 
     #   настройка индексов
     __table_args__ = (
         Index("idx_news_owner_id", "owner_id"),
         Index("idx_news_company_id", "company_id"),
+        Index("idx_news_company_id_id", "company_id", "id"),
+        Index("idx_news_search", "company_id", "search_vector", postgresql_using="gin"),
     )
\ No newline at end of file
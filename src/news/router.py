@@ -1,6 +1,6 @@
 from typing import Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_session
@@ -8,6 +8,7 @@ from users.models import User
 from news.schemas import NewsRead, NewsCreate
 from news.depencies import get_news_service, check_company_news
 from news.service import NewsService
+from core.pagination import Page, PageParams, build_page
 
 
 news_router = APIRouter(
@@ -61,26 +62,30 @@ async def delete_news(
 
     await service.delete_news(session, user, company_id, news_id)
 
-@news_router.get('/{company_id}/news', response_model=list[NewsRead])
+@news_router.get('/{company_id}/news', response_model=Page[NewsRead])
 async def get_news(
     company_id: int,
+    request: Request,
+    page: PageParams = Depends(),
     user: User = Depends(check_company_news),
     session: AsyncSession = Depends(get_session),
     service: NewsService = Depends(get_news_service)
-) -> list[NewsRead]:
+) -> Page[NewsRead]:
     """
         Получение новости.
 
         Args:
             company_id (int): Идентификатор компании
+            request (Request): Запрос (для ссылки на следующую страницу).
+            page (PageParams): Курсор и размер страницы.
             user (User): Получение текущего пользователя.
             session (AsyncSession): SQLAlchemy-сессия.
             service (NewsService): Сервис для создания новости.
         
         Returns:
-            company_news (list[NewsRead]): Список новостей.
+            company_news (Page[NewsRead]): Страница новостей.
     """
 
-    company_news = await service.get_news(session, company_id)
+    company_news = await service.get_news(session, company_id, page)
 
-    return NewsRead.model_validate(company_news)
\ No newline at end of file
+    return build_page(request, NewsRead, company_news)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Optional, Union
 
 from fastapi import HTTPException, status
 from sqlalchemy import select
@@ -7,6 +7,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from users.models import User
 from news.models import News
 from news.schemas import NewsCreate
+from database import replica_read
+from core.pagination import KeysetPage, PageParams, paginate
+from events.broker import broker
+from web.cache import invalidate_company_dashboards
 
 
 
@@ -46,6 +50,10 @@ class NewsService:
             session.add(created_news)
             await session.commit()
             await session.refresh(created_news)
+            invalidate_company_dashboards(company_id)
+            broker.publish_company(
+                company_id, 'news.created', news_id=created_news.id, title=created_news.title
+            )
 
             return created_news
         except Exception as e:
@@ -83,27 +91,30 @@ class NewsService:
         try:
             await session.delete(target_news)
             await session.commit()
+            invalidate_company_dashboards(company_id)
+            broker.publish_company(company_id, 'news.deleted', news_id=news_id)
 
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=str(e))
     
-    async def get_news(self, session: AsyncSession, company_id: int) -> list[News]:
+    @replica_read
+    async def get_news(
+        self, session: AsyncSession, company_id: int, page: Optional[PageParams] = None
+    ) -> KeysetPage[News]:
         """
-            Получение списка новостей.
+            Получение списка новостей, новые первыми.
 
             Args:
                 session (AsyncSession): SQLAlchemy-сессия.
-                user (User): Получение текущего пользователя.
                 company_id (int): Идентификатор компании
-                news_id (int): Идентификатор новости
+                page (PageParams): Параметры страницы (None - все новости).
             
             Returns:
-                result (list[News]): Список новостей.
+                result (KeysetPage[News]): Страница новостей.
         """
 
         query = select(News).where(News.company_id == company_id)
-        company_news = (await session.execute(query)).scalars().all()
 
-        return company_news
\ No newline at end of file
+        return await paginate(session, query, (News.id,), page, descending=True)
\ No newline at end of file
@@ -0,0 +1,177 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+#   оценки - целые от 1 до SCORE_LEVELS
+SCORE_LEVELS = 5
+SCORE_NAMES = ('date', 'quality', 'complete')
+PERCENTILES = (25, 50, 75, 90)
+QUARTERS = 4
+#   строка оценки в упаковке из БД: int4send/int2send - big-endian
+ROW_DTYPE = np.dtype([
+    ('department_id', '>i4'),
+    ('owner_id', '>i4'),
+    ('quarter', '>i2'),
+    ('score_date', '>i2'),
+    ('score_quality', '>i2'),
+    ('score_complete', '>i2'),
+])
+
+
+#   None вместо NaN и округление для JSON
+def _round(values: np.ndarray, digits: int = 3) -> list:
+    return [None if np.isnan(value) else round(float(value), digits) for value in values]
+
+
+class RatingColumns:
+    """
+        Оценки компании за год в виде колонок NumPy:
+            - группировка по отделам и сотрудникам - np.unique(return_inverse)
+            - суммы и гистограммы по группам - np.bincount
+            - процентили по группам - одна сортировка и индексы границ групп
+            - квартальная динамика - матрица (группы x кварталы) и np.diff
+    """
+
+    @classmethod
+    def from_packed(cls, data: Optional[bytes]) -> 'RatingColumns':
+        #   колонки из одного bytea без создания Python-объектов на строку
+        rows = np.frombuffer(data or b'', dtype=ROW_DTYPE)
+        return cls(
+            rows['department_id'], rows['owner_id'], rows['quarter'],
+            rows['score_date'], rows['score_quality'], rows['score_complete']
+        )
+
+    def __init__(
+        self, department_ids: Sequence[int], owner_ids: Sequence[int], quarters: Sequence[int],
+        score_date: Sequence[int], score_quality: Sequence[int], score_complete: Sequence[int]
+    ):
+        self.departments, self.department_index = np.unique(
+            np.asarray(department_ids, dtype=np.int64), return_inverse=True
+        )
+        self.owners, self.owner_index = np.unique(
+            np.asarray(owner_ids, dtype=np.int64), return_inverse=True
+        )
+        self.quarter_index = np.asarray(quarters, dtype=np.int64) - 1
+        #   (оценки, строки): дедлайн, качество, полнота
+        self.scores = np.stack([
+            np.asarray(score_date, dtype=np.int64),
+            np.asarray(score_quality, dtype=np.int64),
+            np.asarray(score_complete, dtype=np.int64),
+        ]).reshape(len(SCORE_NAMES), -1)
+        self.total = self.scores.mean(axis=0)
+
+    def __len__(self) -> int:
+        return self.total.size
+
+    def summarize(self, by_department: bool = True) -> list[dict]:
+        """
+            Статистика по отделам или по компании целиком.
+
+            Args:
+                by_department (bool): Группировать по отделам (False - одна
+                    группа на всю компанию).
+
+            Returns:
+                list[dict]: Для каждой группы: число оценок и сотрудников,
+                    средние и гистограммы оценок, процентили средней оценки
+                    сотрудников, средние по кварталам и изменения к прошлому
+                    кварталу.
+        """
+
+        if not len(self):
+            return []
+
+        if by_department:
+            groups = self.departments.size
+            group_index = self.department_index
+        else:
+            groups = 1
+            group_index = np.zeros(len(self), dtype=np.int64)
+
+        count = np.bincount(group_index, minlength=groups)
+        means = np.stack([
+            np.bincount(group_index, weights=score, minlength=groups) for score in self.scores
+        ]) / count
+        totals = np.bincount(group_index, weights=self.total, minlength=groups) / count
+        histograms = np.stack([
+            np.bincount(
+                group_index * SCORE_LEVELS + score - 1, minlength=groups * SCORE_LEVELS
+            ).reshape(groups, SCORE_LEVELS)
+            for score in self.scores
+        ])
+
+        employees, percentiles = self._employee_percentiles(group_index, groups)
+        quarter_count, quarter_avg, quarter_delta = self._quarters(group_index, groups)
+
+        result = []
+        for g in range(groups):
+            result.append({
+                'department_id': int(self.departments[g]) or None if by_department else None,
+                'rating_count': int(count[g]),
+                'employee_count': int(employees[g]),
+                'avg_total': round(float(totals[g]), 3),
+                'scores': {
+                    name: {
+                        'mean': round(float(means[s, g]), 3),
+                        'histogram': histograms[s, g].tolist()
+                    }
+                    for s, name in enumerate(SCORE_NAMES)
+                },
+                'percentiles': dict(zip(
+                    (f'p{p}' for p in PERCENTILES), _round(percentiles[g])
+                )),
+                'quarters': [
+                    {
+                        'quarter': q + 1,
+                        'rating_count': int(quarter_count[g, q]),
+                        'avg_total': avg,
+                        'delta': delta,
+                    }
+                    for q, (avg, delta) in enumerate(zip(
+                        _round(quarter_avg[g]), [None, *_round(quarter_delta[g])]
+                    ))
+                ],
+            })
+
+        return result
+
+    def _employee_percentiles(
+        self, group_index: np.ndarray, groups: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        #   средняя оценка каждого сотрудника и его группа
+        owner_avg = (
+            np.bincount(self.owner_index, weights=self.total)
+            / np.bincount(self.owner_index)
+        )
+        owner_group = np.zeros(self.owners.size, dtype=np.int64)
+        owner_group[self.owner_index] = group_index
+
+        #   сортировка по (группа, средняя): группа - непрерывный отрезок,
+        #   процентиль - линейная интерполяция между соседними элементами
+        #   отрезка (как np.percentile по умолчанию)
+        values = owner_avg[np.lexsort((owner_avg, owner_group))]
+        sizes = np.bincount(owner_group, minlength=groups)
+        starts = np.cumsum(sizes) - sizes
+
+        position = starts[:, None] + (sizes[:, None] - 1) * (np.array(PERCENTILES) / 100)[None, :]
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        fraction = position - lower
+        percentiles = values[lower] + (values[upper] - values[lower]) * fraction
+
+        return sizes, percentiles
+
+    def _quarters(
+        self, group_index: np.ndarray, groups: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        cell = group_index * QUARTERS + self.quarter_index
+        count = np.bincount(cell, minlength=groups * QUARTERS).reshape(groups, QUARTERS)
+        total = np.bincount(
+            cell, weights=self.total, minlength=groups * QUARTERS
+        ).reshape(groups, QUARTERS)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            avg = np.where(count > 0, total / count, np.nan)
+
+        return count, avg, np.diff(avg, axis=1)
\ No newline at end of file
@@ -0,0 +1,17 @@
+from core.cache import VersionedCache
+from config import get_setting
+
+
+setting = get_setting()
+
+#   кэш рейтинга сотрудников: ключ - (компания, год, квартал, отдел, лимит),
+#   значение - JSON рейтинга
+leaderboard_cache = VersionedCache(
+    'rating_leaderboard', setting.LEADERBOARD_CACHE_TTL,
+    setting.LEADERBOARD_CACHE_SIZE, setting.LEADERBOARD_CACHE_MAX_BYTES
+)
+
+
+#   сброс рейтингов компании после новой или удаленной оценки
+def invalidate_leaderboards(company_id: int) -> None:
+    leaderboard_cache.invalidate_where(lambda key, _: key[0] == company_id)
\ No newline at end of file
@@ -19,4 +19,21 @@ def check_rating_role(user: User = Depends(get_user)) -> Union[User, HTTPExcepti
             detail='Оценивать может только админ или менеджер'
         )
     
+    return user
+
+#   проверка доступа к рейтингу и аналитике оценок компании
+def check_company_ratings_access(
+    company_id: int, user: User = Depends(get_user)
+) -> Union[User, HTTPException]:
+    if user.company_id != company_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Оценки доступны только для своей компании'
+        )
+    if user.company_role == RoleType.employee:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Оценки компании доступны только админу или менеджеру'
+        )
+
     return user
\ No newline at end of file
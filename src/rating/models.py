@@ -1,6 +1,6 @@
 import datetime
 
-from sqlalchemy import Index, ForeignKey
+from sqlalchemy import Index, ForeignKey, PrimaryKeyConstraint
 from sqlalchemy.orm import mapped_column, Mapped
 
 from database import Base
@@ -41,4 +41,38 @@ class Rating(Base):
         Index('idx_rating_owner_id', 'owner_id'),
         Index('idx_head_id', 'head_id'),
         Index('idx_created_at', 'created_at'),
+        Index('idx_rating_owner_created', 'owner_id', 'created_at', 'id'),
+    )
+
+
+class RatingRollup(Base):
+    """
+        Модель квартальных сумм оценок исполнителя. Обновляется в транзакции
+        создания оценки, средняя оценка за квартал - одна строка по
+        первичному ключу.
+
+        Fields:
+        - owner_id: Исполнитель задач.
+        - year: Год.
+        - quarter: Квартал (1-4).
+        - rating_count: Число оценок.
+        - sum_date: Сумма оценок дедлайна.
+        - sum_quality: Сумма оценок качества.
+        - sum_complete: Сумма оценок полноты выполнения.
+    """
+
+    __tablename__ = 'rating_rollup'
+
+    owner_id: Mapped[int] = mapped_column(
+        ForeignKey('user.id', ondelete='CASCADE'), nullable=False)
+    year: Mapped[int] = mapped_column(nullable=False)
+    quarter: Mapped[int] = mapped_column(nullable=False)
+    rating_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    sum_date: Mapped[int] = mapped_column(nullable=False, default=0)
+    sum_quality: Mapped[int] = mapped_column(nullable=False, default=0)
+    sum_complete: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    #   настройка индексов
+    __table_args__ = (
+        PrimaryKeyConstraint('owner_id', 'year', 'quarter', name='pk_rating_rollup'),
     )
\ No newline at end of file
@@ -0,0 +1,146 @@
+import argparse
+import asyncio
+import datetime
+from typing import Optional
+
+from sqlalchemy import Insert, Integer, Numeric, Select, cast, delete, extract, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rating.models import Rating, RatingRollup
+from database import db
+
+
+#   год и квартал оценки в SQL (для пересчета сумм); удаленные оценки,
+#   в том числе каскадом, вычитает триггер rating_rollup_delete
+RATING_YEAR = cast(extract('year', Rating.created_at), Integer)
+RATING_QUARTER = cast(extract('quarter', Rating.created_at), Integer)
+
+
+#   год и квартал даты
+def quarter_of(day: datetime.date) -> tuple[int, int]:
+    return day.year, (day.month - 1) // 3 + 1
+
+def add_rating(rating: Rating) -> Insert:
+    """
+        Прибавление оценки к сумме квартала исполнителя.
+
+        INSERT ... ON CONFLICT DO UPDATE увеличивает суммы атомарно, поэтому
+        одновременные оценки одного исполнителя не теряются.
+
+        Args:
+            rating (Rating): Новая оценка (created_at заполнен).
+
+        Returns:
+            Insert: Запрос для выполнения в транзакции создания оценки.
+    """
+
+    year, quarter = quarter_of(rating.created_at)
+    query = insert(RatingRollup).values(
+        owner_id=rating.owner_id,
+        year=year,
+        quarter=quarter,
+        rating_count=1,
+        sum_date=rating.score_date,
+        sum_quality=rating.score_quality,
+        sum_complete=rating.score_complete
+    )
+    return query.on_conflict_do_update(
+        constraint='pk_rating_rollup',
+        set_={
+            'rating_count': RatingRollup.rating_count + query.excluded.rating_count,
+            'sum_date': RatingRollup.sum_date + query.excluded.sum_date,
+            'sum_quality': RatingRollup.sum_quality + query.excluded.sum_quality,
+            'sum_complete': RatingRollup.sum_complete + query.excluded.sum_complete
+        }
+    )
+
+def average_query(owner_id: int, day: datetime.date) -> Select:
+    """
+        Средние оценки исполнителя за квартал даты.
+
+        Чтение одной строки по первичному ключу; агрегат над ней всегда
+        возвращает одну строку (NULL, если оценок нет), поэтому запрос
+        можно использовать как CTE.
+
+        Args:
+            owner_id (int): Исполнитель задач.
+            day (datetime.date): Дата внутри квартала.
+
+        Returns:
+            Select: Запрос с колонками avg_date, avg_quality, avg_complete.
+    """
+
+    year, quarter = quarter_of(day)
+    count = func.nullif(func.sum(RatingRollup.rating_count), 0)
+    return (
+        select(
+            (cast(func.sum(RatingRollup.sum_date), Numeric) / count).label('avg_date'),
+            (cast(func.sum(RatingRollup.sum_quality), Numeric) / count).label('avg_quality'),
+            (cast(func.sum(RatingRollup.sum_complete), Numeric) / count).label('avg_complete')
+        )
+        .where(
+            RatingRollup.owner_id == owner_id,
+            RatingRollup.year == year,
+            RatingRollup.quarter == quarter
+        )
+    )
+
+async def rebuild(session: AsyncSession, owner_ids: Optional[list[int]] = None) -> int:
+    """
+        Пересчет сумм кварталов по таблице rating.
+
+        На время пересчета таблица rating блокируется от записи (SHARE),
+        чтобы новые оценки не прибавились к удаляемым строкам.
+
+        Args:
+            session (AsyncSession): SQLAlchemy-сессия.
+            owner_ids (list[int]): Исполнители для пересчета (None - все).
+
+        Returns:
+            int: Число записанных строк rating_rollup.
+    """
+
+    source = (
+        select(
+            Rating.owner_id, RATING_YEAR, RATING_QUARTER, func.count(Rating.id),
+            func.sum(Rating.score_date), func.sum(Rating.score_quality),
+            func.sum(Rating.score_complete)
+        )
+        .group_by(Rating.owner_id, RATING_YEAR, RATING_QUARTER)
+    )
+    removed = delete(RatingRollup)
+    if owner_ids:
+        source = source.where(Rating.owner_id.in_(owner_ids))
+        removed = removed.where(RatingRollup.owner_id.in_(owner_ids))
+
+    await session.execute(text('LOCK TABLE rating IN SHARE MODE'))
+    await session.execute(removed)
+    result = await session.execute(
+        insert(RatingRollup).from_select(
+            [
+                'owner_id', 'year', 'quarter', 'rating_count',
+                'sum_date', 'sum_quality', 'sum_complete'
+            ],
+            source
+        )
+    )
+    await session.commit()
+
+    return result.rowcount
+
+async def main(owner_ids: Optional[list[int]]) -> None:
+    #   запуск из src: python -m rating.rollup [--owner-id 1 --owner-id 2]
+    async with db.session() as session:
+        count = await rebuild(session, owner_ids)
+    print(f'Пересчитано строк rating_rollup: {count}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Пересчет квартальных сумм оценок')
+    parser.add_argument(
+        '--owner-id', type=int, action='append', dest='owner_ids',
+        help='Исполнитель для пересчета (можно указать несколько раз)'
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.owner_ids))
\ No newline at end of file
@@ -1,18 +1,22 @@
-from typing import Union
+import datetime
+from typing import Optional, Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_session
 from users.models import User
-from rating.schemas import RatingCreate, RatingRead
-from rating.depencies import get_rating_service, check_rating_role
+from rating.schemas import RatingCreate, RatingRead, Leaderboard, RatingAnalytics
+from rating.depencies import get_rating_service, check_rating_role, check_company_ratings_access
 from rating.service import RatingService
 
 
 rating_router = APIRouter(
     prefix='/companies/tasks/{task_id}/ratings', tags=['Ratings']
 )
+company_rating_router = APIRouter(
+    prefix='/companies/{company_id}/ratings', tags=['Ratings']
+)
 
 @rating_router.post('', response_model=RatingRead)
 async def create_rating(
@@ -37,4 +41,64 @@ async def create_rating(
 
     created_rate = await service.create_rating(user, session, task_id, data)
 
-    return RatingRead.model_validate(created_rate)
\ No newline at end of file
+    return RatingRead.model_validate(created_rate)
+
+@company_rating_router.get('/leaderboard', response_model=Leaderboard)
+async def get_leaderboard(
+    company_id: int,
+    year: Optional[int] = Query(None, ge=2000, le=2100),
+    quarter: Optional[int] = Query(None, ge=1, le=4),
+    department_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    user: User = Depends(check_company_ratings_access),
+    session: AsyncSession = Depends(get_session),
+    service: RatingService = Depends(get_rating_service)
+) -> Response:
+    """
+        Рейтинг сотрудников компании или отдела по средним оценкам за период.
+
+        Args:
+            company_id (int): Идентификатор компании.
+            year (int): Год (по умолчанию текущий).
+            quarter (int): Квартал (не задан - весь год).
+            department_id (int): Отдел (не задан - вся компания).
+            limit (int): Число мест в рейтинге.
+            user (User): Получение текущего пользователя.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (RatingService): Сервис для создания оценок.
+            
+        Returns:
+            Leaderboard: Схема рейтинга сотрудников.
+    """
+
+    leaderboard = await service.get_leaderboard_json(
+        session, company_id, year or datetime.date.today().year,
+        quarter, department_id, limit
+    )
+
+    return Response(leaderboard, media_type='application/json')
+
+@company_rating_router.get('/analytics', response_model=RatingAnalytics)
+async def get_rating_analytics(
+    company_id: int,
+    year: Optional[int] = Query(None, ge=2000, le=2100),
+    user: User = Depends(check_company_ratings_access),
+    session: AsyncSession = Depends(get_session),
+    service: RatingService = Depends(get_rating_service)
+) -> RatingAnalytics:
+    """
+        Аналитика оценок компании за год: распределения, процентили
+        и динамика по кварталам для отделов и всей компании.
+
+        Args:
+            company_id (int): Идентификатор компании.
+            year (int): Год (по умолчанию текущий).
+            user (User): Получение текущего пользователя.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (RatingService): Сервис для создания оценок.
+            
+        Returns:
+            RatingAnalytics: Схема аналитики оценок.
+    """
+
+    return await service.get_analytics(session, company_id, year or datetime.date.today().year)
\ No newline at end of file
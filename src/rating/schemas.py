@@ -84,4 +84,132 @@ class AvgRatingRead(BaseModel):
 
     model_config = {
         'from_attributes': True
-    }
\ No newline at end of file
+    }
+
+class LeaderboardEntry(BaseModel):
+    """
+        Схема строки рейтинга сотрудников
+
+        Fields:
+        - user_id: Идентификатор сотрудника.
+        - first_name: Имя сотрудника.
+        - last_name: Фамилия сотрудника.
+        - department_id: Отдел сотрудника.
+        - rating_count: Число оценок за период.
+        - avg_date: Средняя оценка дедлайна.
+        - avg_quality: Средняя оценка качества.
+        - avg_complete: Средняя оценка полноты выполнения.
+        - avg_total: Средняя из трех оценок.
+        - rank: Место в компании (или отделе при фильтре) по avg_total.
+        - department_rank: Место в своем отделе по avg_total.
+        - rank_date: Место по оценке дедлайна.
+        - rank_quality: Место по оценке качества.
+        - rank_complete: Место по оценке полноты выполнения.
+    """
+
+    user_id: int
+    first_name: str
+    last_name: str
+    department_id: Optional[int] = None
+    rating_count: int
+    avg_date: float
+    avg_quality: float
+    avg_complete: float
+    avg_total: float
+    rank: int
+    department_rank: int
+    rank_date: int
+    rank_quality: int
+    rank_complete: int
+
+    model_config = {
+        'from_attributes': True
+    }
+
+
+class Leaderboard(BaseModel):
+    """
+        Схема рейтинга сотрудников компании за период
+
+        Fields:
+        - company_id: Идентификатор компании.
+        - year: Год.
+        - quarter: Квартал (None - весь год).
+        - department_id: Отдел (None - вся компания).
+        - entries: Строки рейтинга по местам.
+    """
+
+    company_id: int
+    year: int
+    quarter: Optional[int] = None
+    department_id: Optional[int] = None
+    entries: list[LeaderboardEntry]
+
+class ScoreStats(BaseModel):
+    """
+        Схема статистики одной оценки
+
+        Fields:
+        - mean: Средняя оценка.
+        - histogram: Число оценок 1, 2, 3, 4 и 5.
+    """
+
+    mean: float
+    histogram: list[int]
+
+
+class QuarterTrend(BaseModel):
+    """
+        Схема средней оценки за квартал
+
+        Fields:
+        - quarter: Квартал.
+        - rating_count: Число оценок.
+        - avg_total: Средняя из трех оценок (None - оценок нет).
+        - delta: Изменение к прошлому кварталу.
+    """
+
+    quarter: int
+    rating_count: int
+    avg_total: Optional[float] = None
+    delta: Optional[float] = None
+
+
+class RatingGroupAnalytics(BaseModel):
+    """
+        Схема аналитики оценок отдела или компании
+
+        Fields:
+        - department_id: Отдел (None - без отдела или вся компания).
+        - rating_count: Число оценок.
+        - employee_count: Число оцененных сотрудников.
+        - avg_total: Средняя из трех оценок.
+        - scores: Статистика оценок date, quality, complete.
+        - percentiles: Процентили средней оценки сотрудников (p25, p50, p75, p90).
+        - quarters: Средние по кварталам.
+    """
+
+    department_id: Optional[int] = None
+    rating_count: int
+    employee_count: int
+    avg_total: float
+    scores: dict[str, ScoreStats]
+    percentiles: dict[str, Optional[float]]
+    quarters: list[QuarterTrend]
+
+
+class RatingAnalytics(BaseModel):
+    """
+        Схема аналитики оценок компании за год
+
+        Fields:
+        - company_id: Идентификатор компании.
+        - year: Год.
+        - company: Статистика по всей компании (None - оценок нет).
+        - departments: Статистика по отделам.
+    """
+
+    company_id: int
+    year: int
+    company: Optional[RatingGroupAnalytics] = None
+    departments: list[RatingGroupAnalytics]
\ No newline at end of file
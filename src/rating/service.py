@@ -1,19 +1,27 @@
-from typing import Union
+import asyncio
+import datetime
+from typing import Optional, Union
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import LargeBinary, Numeric, SmallInteger, cast, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from users.models import User
 from tasks.models.task import Task, TaskStatus
-from rating.models import Rating
-from rating.schemas import RatingCreate
+from rating.models import Rating, RatingRollup
+from rating.rollup import RATING_QUARTER, add_rating
+from rating.analytics import RatingColumns
+from rating.cache import leaderboard_cache, invalidate_leaderboards
+from rating.schemas import RatingCreate, Leaderboard, LeaderboardEntry, RatingAnalytics
+from database import replica_read
 
 
 class RatingService:
     """
         Сервисный слой для работы с оценками задач:
-            - создание оценки
+            - создание оценки и обновление квартальных сумм исполнителя
+            - рейтинг сотрудников компании за период
+            - аналитика оценок компании (NumPy)
     """
 
     async def create_rating(
@@ -57,12 +65,16 @@ class RatingService:
                 'head_id': user.id,
                 'score_date': data.score_date,
                 'score_quality': data.score_quality,
-                'score_complete': data.score_complete
+                'score_complete': data.score_complete,
+                'created_at': datetime.date.today()
             }
 
             data = Rating(**data)
+            company_id = target_task.company_id
             session.add(data)
+            await session.execute(add_rating(data))
             await session.commit()
+            invalidate_leaderboards(company_id)
             await session.refresh(data)
 
             return data
@@ -70,4 +82,173 @@ class RatingService:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=str(e)
-            )
\ No newline at end of file
+            )
+
+    async def get_leaderboard_json(
+        self, session: AsyncSession, company_id: int, year: int,
+        quarter: Optional[int] = None, department_id: Optional[int] = None,
+        limit: int = 100
+    ) -> bytes:
+        """
+            Получение рейтинга сотрудников в виде JSON через кэш leaderboard_cache.
+
+            Версия кэша запоминается до запроса: если оценку создали, пока
+            запрос выполнялся, результат не попадет в кэш.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                company_id (int): Идентификатор компании.
+                year (int): Год.
+                quarter (int): Квартал (None - весь год).
+                department_id (int): Отдел (None - вся компания).
+                limit (int): Число мест в рейтинге.
+
+            Returns:
+                bytes: JSON рейтинга (схема Leaderboard).
+        """
+
+        key = (company_id, year, quarter, department_id, limit)
+        payload = leaderboard_cache.get(key)
+        if payload is not None:
+            return payload
+
+        version = leaderboard_cache.version(key)
+        entries = await self.get_leaderboard(
+            session, company_id, year, quarter, department_id, limit
+        )
+        payload = Leaderboard(
+            company_id=company_id, year=year, quarter=quarter,
+            department_id=department_id,
+            entries=[LeaderboardEntry.model_validate(entry) for entry in entries]
+        ).model_dump_json().encode()
+        leaderboard_cache.set(key, payload, version)
+
+        return payload
+
+    async def get_leaderboard(
+        self, session: AsyncSession, company_id: int, year: int,
+        quarter: Optional[int] = None, department_id: Optional[int] = None,
+        limit: int = 100
+    ) -> list:
+        """
+            Рейтинг сотрудников одним запросом с оконными функциями.
+
+            Суммы оценок за период берутся из rating_rollup (кварталы года
+            складываются), места считаются rank() по средним оценкам: общее,
+            внутри отдела и по каждой оценке отдельно. Читается основная БД:
+            результат кэшируется, и отставание реплики попало бы в кэш.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                company_id (int): Идентификатор компании.
+                year (int): Год.
+                quarter (int): Квартал (None - весь год).
+                department_id (int): Отдел (None - вся компания).
+                limit (int): Число мест в рейтинге.
+
+            Returns:
+                list: Строки рейтинга по местам.
+        """
+
+        sums = (
+            select(
+                RatingRollup.owner_id,
+                func.sum(RatingRollup.rating_count).label('rating_count'),
+                func.sum(RatingRollup.sum_date).label('sum_date'),
+                func.sum(RatingRollup.sum_quality).label('sum_quality'),
+                func.sum(RatingRollup.sum_complete).label('sum_complete')
+            )
+            .join(User, User.id == RatingRollup.owner_id)
+            .where(User.company_id == company_id, RatingRollup.year == year)
+            .group_by(RatingRollup.owner_id)
+            .having(func.sum(RatingRollup.rating_count) > 0)
+        )
+        if quarter is not None:
+            sums = sums.where(RatingRollup.quarter == quarter)
+        if department_id is not None:
+            sums = sums.where(User.department_id == department_id)
+        sums = sums.subquery()
+
+        count = cast(sums.c.rating_count, Numeric)
+        avg_date = func.round(sums.c.sum_date / count, 2)
+        avg_quality = func.round(sums.c.sum_quality / count, 2)
+        avg_complete = func.round(sums.c.sum_complete / count, 2)
+        avg_total = func.round(
+            (sums.c.sum_date + sums.c.sum_quality + sums.c.sum_complete) / (3 * count), 2
+        )
+        rank = func.rank().over(order_by=avg_total.desc()).label('rank')
+
+        query = (
+            select(
+                User.id.label('user_id'), User.first_name, User.last_name, User.department_id,
+                sums.c.rating_count,
+                avg_date.label('avg_date'),
+                avg_quality.label('avg_quality'),
+                avg_complete.label('avg_complete'),
+                avg_total.label('avg_total'),
+                rank,
+                func.rank().over(
+                    partition_by=User.department_id, order_by=avg_total.desc()
+                ).label('department_rank'),
+                func.rank().over(order_by=avg_date.desc()).label('rank_date'),
+                func.rank().over(order_by=avg_quality.desc()).label('rank_quality'),
+                func.rank().over(order_by=avg_complete.desc()).label('rank_complete')
+            )
+            .join(sums, sums.c.owner_id == User.id)
+            .order_by(rank, User.id)
+            .limit(limit)
+        )
+
+        return (await session.execute(query)).mappings().all()
+
+    @replica_read
+    async def get_analytics(
+        self, session: AsyncSession, company_id: int, year: int
+    ) -> RatingAnalytics:
+        """
+            Аналитика оценок компании за год: средние, гистограммы и
+            процентили по отделам, динамика по кварталам.
+
+            Оценки читаются одним запросом в виде одного bytea: строка -
+            упакованные int4send/int2send колонки, которые NumPy читает
+            без копирования (RatingColumns.from_packed). Расчет выполняется
+            в потоке, чтобы не занимать цикл событий.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                company_id (int): Идентификатор компании.
+                year (int): Год.
+
+            Returns:
+                RatingAnalytics: Схема аналитики оценок.
+        """
+
+        row = (
+            func.int4send(func.coalesce(User.department_id, 0))
+            .op('||')(func.int4send(Rating.owner_id))
+            .op('||')(func.int2send(cast(RATING_QUARTER, SmallInteger)))
+            .op('||')(func.int2send(cast(Rating.score_date, SmallInteger)))
+            .op('||')(func.int2send(cast(Rating.score_quality, SmallInteger)))
+            .op('||')(func.int2send(cast(Rating.score_complete, SmallInteger)))
+        )
+        query = (
+            select(func.string_agg(row, literal(b'', LargeBinary), type_=LargeBinary))
+            .join(User, User.id == Rating.owner_id)
+            .where(
+                User.company_id == company_id,
+                Rating.created_at >= datetime.date(year, 1, 1),
+                Rating.created_at < datetime.date(year + 1, 1, 1)
+            )
+        )
+        packed = (await session.execute(query)).scalar()
+
+        def summarize():
+            columns = RatingColumns.from_packed(packed)
+            company = columns.summarize(by_department=False)
+            return company[0] if company else None, columns.summarize()
+
+        company, departments = await asyncio.to_thread(summarize)
+
+        return RatingAnalytics(
+            company_id=company_id, year=year, company=company, departments=departments
+        )
\ No newline at end of file
@@ -0,0 +1,22 @@
+from fastapi import Depends, HTTPException, status
+
+from users.models import User
+from core_depencies import get_user
+from search.service import SearchService
+
+
+#   получение объекта сервиса поиска
+def get_search_service() -> SearchService:
+    return SearchService()
+
+#   искать можно только в данных своей компании
+def check_search_access(
+    company_id: int, user: User = Depends(get_user)
+) -> User:
+    if user.company_id != company_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Поиск доступен только по своей компании'
+        )
+
+    return user
\ No newline at end of file
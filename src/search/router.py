@@ -0,0 +1,48 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_session
+from users.models import User
+from search.schemas import SearchHit, SearchKind
+from search.depencies import get_search_service, check_search_access
+from search.service import SearchService
+from core.pagination import Page, PageParams, build_page
+
+
+search_router = APIRouter(
+    prefix='/companies/{company_id}/search', tags=['Search']
+)
+
+@search_router.get('', response_model=Page[SearchHit])
+async def search(
+    request: Request,
+    company_id: int,
+    q: str = Query(..., min_length=1, max_length=200),
+    kind: Optional[list[SearchKind]] = Query(None),
+    page: PageParams = Depends(),
+    user: User = Depends(check_search_access),
+    session: AsyncSession = Depends(get_session),
+    service: SearchService = Depends(get_search_service)
+) -> Page[SearchHit]:
+    """
+        Полнотекстовый поиск по задачам, комментариям и новостям компании.
+
+        Args:
+            request (Request): Запрос (для ссылки на следующую страницу).
+            company_id (int): Идентификатор компании.
+            q (str): Поисковая строка: слова, "фраза", -исключение, or.
+            kind (list[SearchKind]): Типы документов (по умолчанию все).
+            page (PageParams): Курсор и размер страницы.
+            user (User): Получение текущего пользователя.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (SearchService): Сервис поиска.
+            
+        Returns:
+            Page[SearchHit]: Страница результатов по убыванию релевантности.
+    """
+
+    result = await service.search(session, company_id, q, page, kind)
+
+    return build_page(request, SearchHit, result)
\ No newline at end of file
@@ -0,0 +1,37 @@
+import enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class SearchKind(enum.Enum):
+    task = 'task'
+    comment = 'comment'
+    news = 'news'
+
+
+class SearchHit(BaseModel):
+    """
+        Схема результата поиска
+
+        Fields:
+        - kind: Тип документа (task, comment, news).
+        - id: Идентификатор документа.
+        - task_id: Задача (для задач и комментариев).
+        - title: Заголовок с подсветкой (для комментария - название задачи).
+        - snippet: Фрагменты текста с подсветкой совпадений.
+
+        title и snippet - HTML: текст экранирован, совпадения в <mark>.
+        - rank: Релевантность (ts_rank_cd).
+    """
+
+    kind: SearchKind
+    id: int
+    task_id: Optional[int] = None
+    title: Optional[str] = None
+    snippet: Optional[str] = None
+    rank: float
+
+    model_config = {
+        'from_attributes': True
+    }
\ No newline at end of file
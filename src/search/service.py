@@ -0,0 +1,161 @@
+from typing import Optional
+
+from sqlalchemy import Float, Integer, String, and_, cast, func, literal, literal_column, null, select, tuple_, union_all
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tasks.models.task import Task
+from tasks.models.comment import Comment
+from news.models import News
+from search.schemas import SearchKind
+from database import replica_read
+from core.pagination import KeysetPage, PageParams, decode_cursor, encode_cursor
+
+
+#   конфигурация разбора текста - та же, что в generated-колонках search_vector
+SEARCH_CONFIG = literal_column("'russian'::regconfig")
+#   подсветка совпадений: заголовок целиком, текст - фрагментами
+TITLE_OPTIONS = 'StartSel=<mark>, StopSel=</mark>, HighlightAll=true'
+SNIPPET_OPTIONS = 'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5'
+
+
+#   экранирование HTML до ts_headline: в ответе разметка - только <mark>,
+#   а не сохраненный пользователями текст
+def _escape_html(text):
+    for char, entity in (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;')):
+        text = func.replace(text, char, entity)
+    return text
+
+
+class SearchService:
+    """
+        Сервисный слой полнотекстового поиска по данным компании:
+            - задачи, комментарии и новости по generated-колонкам tsvector
+              и GIN-индексам
+            - сортировка по релевантности (ts_rank_cd) и keyset-пагинация
+            - подсветка совпадений (ts_headline) только для строк страницы
+    """
+
+    def hits_query(self, company_id: int, tsquery, kinds: list[SearchKind]):
+        """
+            Совпадения всех типов документов одной выборкой UNION ALL.
+
+            Задачи и новости фильтруются составным GIN-индексом
+            (company_id, search_vector), комментарии - индексом по
+            search_vector и компании задачи.
+
+            Args:
+                company_id (int): Идентификатор компании.
+                tsquery: Поисковый запрос (tsquery).
+                kinds (list[SearchKind]): Типы документов.
+
+            Returns:
+                Subquery: Колонки kind, id, task_id, rank.
+        """
+
+        def rank(vector):
+            return func.ts_rank_cd(vector, tsquery, type_=Float).label('rank')
+
+        parts = {
+            SearchKind.task: (
+                select(
+                    literal(SearchKind.task.value, String).label('kind'),
+                    Task.id.label('id'), Task.id.label('task_id'),
+                    rank(Task.search_vector)
+                )
+                .where(Task.company_id == company_id, Task.search_vector.op('@@')(tsquery))
+            ),
+            SearchKind.comment: (
+                select(
+                    literal(SearchKind.comment.value, String).label('kind'),
+                    Comment.id.label('id'), Comment.task_id.label('task_id'),
+                    rank(Comment.search_vector)
+                )
+                .join(Task, Task.id == Comment.task_id)
+                .where(Task.company_id == company_id, Comment.search_vector.op('@@')(tsquery))
+            ),
+            SearchKind.news: (
+                select(
+                    literal(SearchKind.news.value, String).label('kind'),
+                    News.id.label('id'), cast(null(), Integer).label('task_id'),
+                    rank(News.search_vector)
+                )
+                .where(News.company_id == company_id, News.search_vector.op('@@')(tsquery))
+            ),
+        }
+
+        return union_all(*(parts[kind] for kind in kinds)).subquery('hits')
+
+    @replica_read
+    async def search(
+        self, session: AsyncSession, company_id: int, text: str, page: PageParams,
+        kinds: Optional[list[SearchKind]] = None
+    ) -> KeysetPage:
+        """
+            Поиск по задачам, комментариям и новостям компании.
+
+            Страница выбирается по ключу (rank, kind, id) по убыванию,
+            заголовки и фрагменты с подсветкой строятся только для нее:
+            ts_headline перечитывает текст документа и дорог на всех
+            совпадениях.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                company_id (int): Идентификатор компании.
+                text (str): Поисковая строка (синтаксис websearch_to_tsquery).
+                page (PageParams): Параметры страницы.
+                kinds (list[SearchKind]): Типы документов (None - все).
+
+            Returns:
+                KeysetPage: Результаты страницы и курсор следующей.
+        """
+
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, text)
+        #   повтор типа в ?kind= дублировал бы ветку union_all и каждое совпадение
+        kinds = list(dict.fromkeys(kinds or SearchKind))
+        hits = self.hits_query(company_id, tsquery, kinds)
+        order_by = (hits.c.rank, hits.c.kind, hits.c.id)
+
+        query = select(hits)
+        if page.cursor:
+            values = decode_cursor(page.cursor, order_by)
+            bound = tuple_(*(literal(value, column.type) for column, value in zip(order_by, values)))
+            query = query.where(tuple_(*order_by) < bound)
+        page_hits = (
+            query
+            .order_by(*(column.desc() for column in order_by))
+            .limit(page.limit + 1)
+            .subquery('page_hits')
+        )
+
+        comment_task = aliased(Task)
+        query = (
+            select(
+                page_hits.c.kind, page_hits.c.id, page_hits.c.task_id, page_hits.c.rank,
+                func.coalesce(
+                    func.ts_headline(
+                        SEARCH_CONFIG, _escape_html(func.coalesce(Task.title, News.title)),
+                        tsquery, TITLE_OPTIONS
+                    ),
+                    _escape_html(comment_task.title)
+                ).label('title'),
+                func.ts_headline(
+                    SEARCH_CONFIG,
+                    _escape_html(func.coalesce(Task.description, News.description, Comment.description)),
+                    tsquery, SNIPPET_OPTIONS
+                ).label('snippet')
+            )
+            .outerjoin(Task, and_(page_hits.c.kind == SearchKind.task.value, Task.id == page_hits.c.id))
+            .outerjoin(News, and_(page_hits.c.kind == SearchKind.news.value, News.id == page_hits.c.id))
+            .outerjoin(Comment, and_(page_hits.c.kind == SearchKind.comment.value, Comment.id == page_hits.c.id))
+            .outerjoin(comment_task, comment_task.id == Comment.task_id)
+            .order_by(*(page_hits.c[column.key].desc() for column in order_by))
+        )
+        items = (await session.execute(query)).all()
+
+        next_cursor = None
+        if len(items) > page.limit:
+            items = items[:page.limit]
+            next_cursor = encode_cursor([getattr(items[-1], column.key) for column in order_by])
+
+        return KeysetPage(items, next_cursor)
\ No newline at end of file
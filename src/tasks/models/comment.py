@@ -1,4 +1,7 @@
-from sqlalchemy import String, Index, ForeignKey
+from typing import Optional
+
+from sqlalchemy import String, Index, ForeignKey, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from database import Base
@@ -13,6 +16,7 @@ class Comment(Base):
         - author_id: Идентификатор пользователя.
         - task_id: Идентификатор задачи.
         - description: Тело комментария.
+        - search_vector: Поисковый вектор тела комментария.
     """
 
     __tablename__ = 'comment'
@@ -25,11 +29,17 @@ class Comment(Base):
         ForeignKey('task.id', ondelete='CASCADE'), nullable=False
     )
     description: Mapped[str] = mapped_column(String(1024), nullable=False)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('russian', description)", persisted=True),
+        deferred=True
+    )
 
     task = relationship("Task", back_populates="comments")
 
     #   настройка индексов
     __table_args__ = (
         Index('idx_author_id', 'author_id'),
-        Index('idx_task_id', 'task_id'),
+        Index('idx_comment_task_id_id', 'task_id', 'id'),
+        Index('idx_comment_search', 'search_vector', postgresql_using='gin'),
     )
\ No newline at end of file
@@ -1,7 +1,10 @@
 import datetime
 import enum
 
-from sqlalchemy import String, Enum, Index, ForeignKey
+from typing import Optional
+
+from sqlalchemy import String, Enum, Index, ForeignKey, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from database import Base
@@ -27,6 +30,7 @@ class Task(Base):
         - title: Название задачи.
         - description: Описание задачи.
         - status: Статус задачи.
+        - search_vector: Поисковый вектор названия (вес A) и описания (вес B).
     """
 
     __tablename__ = 'task'
@@ -45,6 +49,15 @@ class Task(Base):
     title: Mapped[str] = mapped_column(String(400), nullable=False)
     description: Mapped[str] = mapped_column(String(1024))
     status: Mapped[TaskStatus] = mapped_column(Enum(TaskStatus), default=TaskStatus.todo)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('russian', coalesce(description, '')), 'B')",
+            persisted=True
+        ),
+        deferred=True
+    )
 
     comments = relationship("Comment", back_populates="task", cascade="all, delete-orphan")
 
@@ -55,4 +68,7 @@ class Task(Base):
         Index('idx_target_id', 'target_id'),
         Index('idx_status', 'status'),
         Index('idx_start_end_date', 'start_date', 'end_date'),
+        Index('idx_task_target_end', 'target_id', 'end_date', 'id'),
+        Index('idx_task_owner_end', 'owner_id', 'end_date', 'id'),
+        Index('idx_task_search', 'company_id', 'search_vector', postgresql_using='gin'),
     )
\ No newline at end of file
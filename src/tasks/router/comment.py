@@ -1,6 +1,6 @@
 from typing import Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_session
@@ -10,12 +10,41 @@ from tasks.schemas.comment import CommentCreate, CommentRead
 from core_depencies import get_user
 from tasks.service.comment import CommentService
 from tasks.depencies import get_comment_service
+from core.pagination import Page, PageParams, build_page
 
 
 comment_router = APIRouter(
     prefix='/companies/tasks/{task_id}/comments', tags=['Comments']
 )
 
+@comment_router.get('', response_model=Page[CommentRead])
+async def comment_list(
+    task_id: int,
+    request: Request,
+    page: PageParams = Depends(),
+    user: User = Depends(get_user),
+    session: AsyncSession = Depends(get_session),
+    service: CommentService = Depends(get_comment_service)
+) -> Page[CommentRead]:
+    """
+        Получение комментариев задачи от новых к старым.
+
+        Args:
+            task_id (int): Идентификатор задачи.
+            request (Request): Запрос (для ссылки на следующую страницу).
+            page (PageParams): Курсор и размер страницы.
+            user (User): Получение текущего пользователя.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (CommentService): Сервис для получения комментариев.
+
+        Returns:
+            Page[CommentRead]: Страница комментариев.
+    """
+
+    comments = await service.get_comments(user, session, task_id, page)
+
+    return build_page(request, CommentRead, comments)
+
 @comment_router.post('', response_model=CommentRead)
 async def comment_create(
     task_id: int,
@@ -6,7 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_session
 from users.models import User
 from tasks.depencies import check_company
-from tasks.schemas.task import TaskRead, TaskCreate, TaskChange, TaskChangeRole
+from tasks.schemas.task import (
+    TaskRead, TaskCreate, TaskBulkCreate, TaskChange, TaskChangeRole
+)
 from core_depencies import get_user
 from tasks.service.task import TaskService
 from tasks.depencies import get_task_service
@@ -41,6 +43,30 @@ async def create_task(
     
     return TaskRead(**created_task)
 
+@task_router.post('/bulk', response_model=list[TaskRead])
+async def create_tasks(
+    data: TaskBulkCreate,
+    user: User = Depends(check_company),
+    session: AsyncSession = Depends(get_session),
+    service: TaskService = Depends(get_task_service)
+) -> Union[list[TaskRead], Exception]:
+    """
+        Массовое создание задач и занесение их в календари исполнителей.
+
+        Args:
+            data (TaskBulkCreate): Входные данные для создания задач.
+            user (User): Получение текущего пользователя.
+            session (AsyncSession): SQLAlchemy-сессия.
+            service (TaskService): Сервис для создания задач.
+                        
+        Returns:
+            list[TaskRead]: Созданные задачи в порядке запроса.
+    """
+
+    created_tasks = await service.create_tasks(user, session, data)
+
+    return [TaskRead(**task) for task in created_tasks]
+
 @task_router.delete('/{task_id}', status_code=204)
 async def delete_task(
     task_id: int,
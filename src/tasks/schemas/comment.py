@@ -17,11 +17,13 @@ class CommentRead(BaseModel):
         Схема для получения информации о комментарии
 
         Fields:
+        - id: Идентификатор комментария.
         - author_id: Идентификатор пользователя.
         - task_id: Идентификатор задачи.
         - description: Тело комментария.
     """
 
+    id: int
     author_id: int
     task_id: int
     description: str
@@ -4,6 +4,7 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 from tasks.models.task import TaskStatus
+from tasks.schemas.comment import CommentRead
 
 
 class TaskRead(BaseModel):
@@ -35,6 +36,21 @@ class TaskRead(BaseModel):
     }
 
 
+class TaskListRead(TaskRead):
+    """
+        Схема задачи в списках задач пользователя
+
+        Fields:
+        - id: Идентификатор задачи.
+        - comment_count: Число комментариев к задаче.
+        - latest_comments: Последние комментарии (от новых к старым).
+    """
+
+    id: int
+    comment_count: int = 0
+    latest_comments: list[CommentRead] = []
+
+
 class TaskCreate(BaseModel):
     """
         Схема для создания новой задачи
@@ -54,6 +70,17 @@ class TaskCreate(BaseModel):
     description: str = Field(max_length=400)
 
 
+class TaskBulkCreate(BaseModel):
+    """
+        Схема для массового создания задач
+
+        Fields:
+        - tasks: Задачи для создания (до 1000 за запрос).
+    """
+
+    tasks: list[TaskCreate] = Field(min_length=1, max_length=1000)
+
+
 class TaskChange(BaseModel):
     """
         Схема для изменения данных задачи
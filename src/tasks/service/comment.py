@@ -1,22 +1,125 @@
-from typing import Union
+from typing import Optional, Sequence, Union
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import Select, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from users.models import User
 from tasks.models.task import Task
 from tasks.models.comment import Comment
 from tasks.schemas.comment import CommentCreate
+from events.broker import broker
+from web.cache import invalidate_dashboards
+from database import replica_read
+from core.pagination import KeysetPage, PageParams, paginate
 
 
+#   последние limit комментариев каждой задачи и их общее число:
+#   LATERAL с ORDER BY id DESC LIMIT читает по индексу (task_id, id) только
+#   limit строк, число комментариев - отдельный count по тому же индексу
+def latest_comments_query(task_ids: Sequence[int], limit: int) -> Select:
+    latest = (
+        select(Comment.id, Comment.author_id, Comment.description)
+        .where(Comment.task_id == Task.id)
+        .order_by(Comment.id.desc())
+        .limit(limit)
+        .lateral('latest_comments')
+    )
+    comment_count = (
+        select(func.count())
+        .where(Comment.task_id == Task.id)
+        .scalar_subquery()
+    )
+
+    return (
+        select(
+            Task.id.label('task_id'), latest.c.id, latest.c.author_id,
+            latest.c.description, comment_count.label('comment_count')
+        )
+        .join(latest, true())
+        .where(Task.id.in_(task_ids))
+        .order_by(Task.id, latest.c.id.desc())
+    )
+
 class CommentService:
     """
         Сервисный слой для работы с комментариями:
             - создание комментариев
             - удаление комментариев
+            - уведомление участников задачи о новых комментариях
+            - постраничное получение комментариев задачи
+            - последние комментарии для списков задач
     """
 
+    async def attach_latest_comments(
+        self, session: AsyncSession, tasks: Sequence[Task], limit: int
+    ) -> None:
+        """
+            Добавление задачам числа комментариев и последних комментариев.
+
+            Один запрос на страницу задач вместо загрузки всех комментариев
+            через selectinload; результат кладется в атрибуты comment_count
+            и latest_comments объектов задач.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                tasks (Sequence[Task]): Задачи страницы.
+                limit (int): Число последних комментариев на задачу.
+        """
+
+        for task in tasks:
+            task.comment_count = 0
+            task.latest_comments = []
+        if not tasks or limit < 1:
+            return
+
+        by_id = {task.id: task for task in tasks}
+        rows = (await session.execute(latest_comments_query(list(by_id), limit))).mappings()
+        for row in rows:
+            task = by_id[row['task_id']]
+            task.comment_count = row['comment_count']
+            task.latest_comments.append({
+                'id': row['id'],
+                'author_id': row['author_id'],
+                'task_id': row['task_id'],
+                'description': row['description']
+            })
+
+    @replica_read
+    async def get_comments(
+        self, user: User, session: AsyncSession, task_id: int,
+        page: Optional[PageParams] = None
+    ) -> Union[KeysetPage[Comment], HTTPException]:
+        """
+            Получение комментариев задачи от новых к старым.
+
+            Args:
+                user (User): Получение текущего пользователя.
+                session (AsyncSession): SQLAlchemy-сессия.
+                task_id (int): Идентификатор задачи.
+                page (PageParams): Параметры страницы (None - все комментарии).
+
+            Returns:
+                comments (KeysetPage[Comment]): Страница комментариев.
+        """
+
+        query = select(Task.company_id).where(Task.id == task_id)
+        company_id = (await session.execute(query)).scalars().first()
+        if company_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Задача с таким id {task_id} не существует'
+            )
+        if company_id != user.company_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f'Задача не из твоей команды'
+            )
+
+        query = select(Comment).where(Comment.task_id == task_id)
+
+        return await paginate(session, query, (Comment.id,), page, descending=True)
+
     async def create_comment(
         self, user: User, session: AsyncSession, task_id: int, data: CommentCreate 
     ) -> Union[Comment, HTTPException]:
@@ -59,9 +162,15 @@ class CommentService:
                 'description': data.description
             }
             comment = Comment(**comment)
+            recipients = (target_task.owner_id, target_task.target_id)
             session.add(comment)
             await session.commit()
             await session.refresh(comment)
+            invalidate_dashboards(*recipients)
+            broker.publish_users(
+                recipients, 'comment.created',
+                task_id=comment.task_id, comment_id=comment.id, author_id=comment.author_id
+            )
 
             return comment
 
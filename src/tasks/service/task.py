@@ -1,23 +1,28 @@
 from typing import Union
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from tasks.schemas.task import TaskChange, TaskCreate
+from tasks.schemas.task import TaskBulkCreate, TaskChange, TaskCreate
 from users.models import User
 from tasks.models.task import Task, TaskStatus
 from calendars.models import CalendarStatus, Calendar
+from calendars.cache import invalidate_months
+from rating.cache import invalidate_leaderboards
+from events.broker import broker
+from web.cache import invalidate_dashboards
 
 
 class TaskService:
     """
         Сервисный слой для работы с задачами:
             - создание задачи
+            - массовое создание задач с записями календаря
             - добавление задачи в календарь
             - удаление задачи
             - изменение данных задачи
-            - изменение статуса задачи
+            - изменение статуса задачи с уведомлением участников
     """
 
     async def create_task(
@@ -84,6 +89,86 @@ class TaskService:
                 detail=str(e)
             )
     
+    async def create_tasks(
+        self, user: User, session: AsyncSession, data: TaskBulkCreate
+    ) -> Union[list[dict], HTTPException]:
+        """
+            Массовое создание задач и их записей в календарях исполнителей.
+
+            Исполнители проверяются одним запросом, задачи вставляются
+            одним INSERT ... RETURNING, записи календаря - одним
+            многострочным INSERT; все в одной транзакции.
+
+            Args:
+                user (User): Получение текущего пользователя.
+                session (AsyncSession): SQLAlchemy-сессия.
+                data (TaskBulkCreate): Входные данные для создания задач.
+
+            Returns:
+                tasks (list[dict]): Словари созданных задач в порядке запроса.
+        """
+
+        target_ids = {task.target_id for task in data.tasks}
+        query = select(User.id, User.company_id).where(User.id.in_(target_ids))
+        targets = dict((await session.execute(query)).all())
+
+        missing = sorted(target_ids - targets.keys())
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f'Пользователей с id {missing} не существует'
+            )
+        foreign = sorted(
+            target_id for target_id, company_id in targets.items()
+            if company_id != user.company_id
+        )
+        if foreign:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f'Пользователи {foreign} не из твоей команды'
+            )
+
+        try:
+            query = insert(Task).returning(
+                Task.id, Task.owner_id, Task.company_id, Task.target_id,
+                Task.start_date, Task.end_date, Task.title, Task.description,
+                Task.status, sort_by_parameter_order=True
+            )
+            tasks = (await session.execute(query, [
+                {
+                    'owner_id': user.id,
+                    'company_id': user.company_id,
+                    'target_id': task.target_id,
+                    'start_date': task.start_date,
+                    'end_date': task.end_date,
+                    'title': task.title,
+                    'description': task.description,
+                    'status': TaskStatus.todo
+                }
+                for task in data.tasks
+            ])).mappings().all()
+
+            await session.execute(insert(Calendar).values([
+                {
+                    'user_id': task['target_id'],
+                    'event_date': task['end_date'],
+                    'title': task['title'],
+                    'type_event': CalendarStatus.task,
+                    'task_id': task['id']
+                }
+                for task in tasks
+            ]))
+            await session.commit()
+            invalidate_months((task['target_id'], task['end_date']) for task in tasks)
+
+            return [dict(task) for task in tasks]
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=str(e)
+            )
+
     async def add_task_calendar(
         self, session: AsyncSession, task: dict
     ) -> Union[None, HTTPException]:
@@ -106,6 +191,7 @@ class TaskService:
             calendar = Calendar(**calendar)
             session.add(calendar)
             await session.commit()
+            invalidate_months([(task['target_id'], task['end_date'])])
             await session.refresh(calendar)
 
         except Exception as e:
@@ -141,11 +227,15 @@ class TaskService:
         
         query = select(Calendar).where(Calendar.task_id == task_id)
         target_calendar = (await session.execute(query)).scalars().first()
+        events = [(target_calendar.user_id, target_calendar.event_date)] if target_calendar else []
+        company_id = target_task.company_id
 
         try:
             await session.delete(target_calendar)
             await session.delete(target_task)
             await session.commit()
+            invalidate_months(events)
+            invalidate_leaderboards(company_id)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -229,6 +319,11 @@ class TaskService:
             target_task.status = task_status.status
             await session.commit()
             await session.refresh(target_task)
+            invalidate_dashboards(target_task.owner_id, target_task.target_id)
+            broker.publish_users(
+                (target_task.owner_id, target_task.target_id), 'task.status',
+                task_id=target_task.id, status=target_task.status.value
+            )
 
             return target_task
 
@@ -0,0 +1,44 @@
+from typing import Any, Callable, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import TTLCache
+from config import get_setting
+from users.models import User
+
+
+setting = get_setting()
+
+#   кэш авторизованных пользователей: ключ - идентификатор пользователя,
+#   значение - снимок колонок строки user
+user_cache = TTLCache('user', setting.USER_CACHE_TTL, setting.USER_CACHE_SIZE)
+
+
+#   снимок колонок пользователя для хранения в кэше
+def snapshot(user: User) -> dict[str, Any]:
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+#   получение пользователя из кэша без запроса к БД
+async def get_cached_user(session: AsyncSession, user_id: int) -> Optional[User]:
+    values = user_cache.get(user_id)
+    if values is None:
+        return None
+
+    user = User(**values)
+    make_transient_to_detached(user)
+
+    return await session.merge(user, load=False)
+
+#   сохранение пользователя в кэш
+def cache_user(user: User) -> None:
+    user_cache.set(user.id, snapshot(user))
+
+#   сброс записей пользователей после изменения их профиля
+def invalidate_users(*user_ids: int) -> None:
+    user_cache.invalidate(*user_ids)
+
+#   сброс записей по условию на снимок пользователя
+def invalidate_users_where(predicate: Callable[[dict], bool]) -> None:
+    user_cache.invalidate_where(lambda _, values: predicate(values))
\ No newline at end of file
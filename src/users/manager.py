@@ -1,12 +1,16 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Optional
 
-from fastapi import Depends
-from fastapi_users import BaseUserManager, FastAPIUsers, IntegerIDMixin
+from fastapi import Depends, Request
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import BaseUserManager, FastAPIUsers, IntegerIDMixin, exceptions
 from fastapi_users.db import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from users.models import User
 from users.config_token import auth_backend
+from users.cache import cache_user, get_cached_user, invalidate_users
+from users.schemas import UserCreate
+from core.hashing import password_pool
 from config import get_setting
 from database import get_session
 
@@ -18,9 +22,83 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
     reset_password_token_secret = setting.SECRET
     verification_token_secret = setting.SECRET
 
+    def __init__(self, user_db):
+        super().__init__(user_db, password_pool.helper)
+
+    #   регистрация: хеш пароля считается в пуле password_pool
+    async def create(
+        self, user_create: UserCreate, safe: bool = False,
+        request: Optional[Request] = None
+    ) -> User:
+        await self.validate_password(user_create.password, user_create)
+
+        existing_user = await self.user_db.get_by_email(user_create.email)
+        if existing_user is not None:
+            raise exceptions.UserAlreadyExists()
+
+        user_dict = (
+            user_create.create_update_dict()
+            if safe
+            else user_create.create_update_dict_superuser()
+        )
+        password = user_dict.pop('password')
+        user_dict['hashed_password'] = await password_pool.hash(password)
+
+        created_user = await self.user_db.create(user_dict)
+        await self.on_after_register(created_user, request)
+
+        return created_user
+
+    #   вход через API: проверка пароля выполняется в пуле password_pool
+    async def authenticate(
+        self, credentials: OAuth2PasswordRequestForm
+    ) -> Optional[User]:
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            #   хеширование выравнивает время ответа для несуществующих почт
+            await password_pool.hash(credentials.password)
+            return None
+
+        verified, updated_password_hash = await password_pool.verify_and_update(
+            credentials.password, user.hashed_password
+        )
+        if not verified:
+            return None
+        if updated_password_hash is not None:
+            await self.user_db.update(user, {'hashed_password': updated_password_hash})
+
+        return user
+
+
+#   хранилище пользователей с кэшем: проверка токена не обращается к БД,
+#   пока пользователь есть в кэше
+class CachedUserDatabase(SQLAlchemyUserDatabase):
+    async def get(self, id: int) -> Optional[User]:
+        user = await get_cached_user(self.session, id)
+        if user is not None:
+            return user
+
+        user = await super().get(id)
+        if user is not None:
+            cache_user(user)
+
+        return user
+
+    async def update(self, user: User, update_dict: dict[str, Any]) -> User:
+        user = await super().update(user, update_dict)
+        invalidate_users(user.id)
+
+        return user
+
+    async def delete(self, user: User) -> None:
+        user_id = user.id
+        await super().delete(user)
+        invalidate_users(user_id)
+
 
 async def get_user_db(session: AsyncSession = Depends(get_session)) -> AsyncGenerator:
-    yield SQLAlchemyUserDatabase(session, User)
+    yield CachedUserDatabase(session, User)
 
 async def get_user_manager(user_db = Depends(get_user_db)):
     yield UserManager(user_db)
@@ -55,4 +55,5 @@ class User(SQLAlchemyBaseUserTable, Base):
     #   настройка индексов
     __table_args__ = (
         Index('idx_email', 'email'),
+        Index('idx_user_company_last_name', 'company_id', 'last_name', 'id'),
     )
\ No newline at end of file
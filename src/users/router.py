@@ -1,6 +1,6 @@
 from typing import Union
 
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from users.manager import fastapi_users
@@ -13,8 +13,9 @@ from users.service import UserService
 from users.depencies import get_user_service
 from core_depencies import check_role
 from rating.schemas import AvgRatingRead, RatingReadUser
-from tasks.schemas.task import TaskRead
+from tasks.schemas.task import TaskListRead
 from database import get_session
+from core.pagination import Page, PageParams, build_page
 
 
 registration_router = APIRouter(prefix='/registration', tags=['Registration'])
@@ -155,27 +156,31 @@ async def delete_department(
 
     return changed_user
 
-@operation_user.get('/me/rating', response_model=list[RatingReadUser])
+@operation_user.get('/me/rating', response_model=Page[RatingReadUser])
 async def get_rating(
+    request: Request,
+    page: PageParams = Depends(),
     user: User = Depends(get_user),
     session: AsyncSession = Depends(get_session),
     service: UserService = Depends(get_user_service)
-) -> list[RatingReadUser]:
+) -> Page[RatingReadUser]:
     """
         Получение оценок задач.
 
         Args:
+            request (Request): Запрос (для ссылки на следующую страницу).
+            page (PageParams): Курсор и размер страницы.
             user (User): Получение текущего пользователя.
             session (AsyncSession): SQLAlchemy-сессия.
             service (UserService): Сервис для создания пользователя.
             
         Returns:
-            RatingReadUser (list[RatingReadUser]): Информация об оценках задач.
+            Page[RatingReadUser]: Страница оценок задач.
     """
 
-    my_rating = await service.get_rating(session, user)
+    my_rating = await service.get_rating(session, user, page)
 
-    return [RatingReadUser.model_validate(item) for item in my_rating]
+    return build_page(request, RatingReadUser, my_rating)
 
 @operation_user.get("/me/ratings/average", response_model=AvgRatingRead)
 async def get_quarter_avg(
@@ -197,47 +202,55 @@ async def get_quarter_avg(
 
     return await service.get_avg_rating(session, user)
 
-@operation_user.get('/me/tasks', response_model=list[TaskRead])
+@operation_user.get('/me/tasks', response_model=Page[TaskListRead])
 async def get_my_tasks(
+    request: Request,
+    page: PageParams = Depends(),
     user: User = Depends(get_user),
     session: AsyncSession = Depends(get_session),
     service: UserService = Depends(get_user_service)
-) -> list[TaskRead]:
+) -> Page[TaskListRead]:
     """
         Получение назначенных задач.
 
         Args:
+            request (Request): Запрос (для ссылки на следующую страницу).
+            page (PageParams): Курсор и размер страницы.
             session (AsyncSession): SQLAlchemy-сессия.
             user (User): Получение текущего пользователя.
             service (UserService): Сервис для создания пользователя.
 
         Returns:
-            result (list[Task]): Список назначенных задач.
+            result (Page[TaskListRead]): Страница назначенных задач.
             
     """
     
-    user_tasks = await service.get_my_tasks(user, session)
+    user_tasks = await service.get_my_tasks(user, session, page)
 
-    return TaskRead.model_validate(user_tasks)
+    return build_page(request, TaskListRead, user_tasks)
 
-@operation_user.get('/me/tasks_owner', response_model=list[TaskRead])
+@operation_user.get('/me/tasks_owner', response_model=Page[TaskListRead])
 async def get_my_tasks(
+    request: Request,
+    page: PageParams = Depends(),
     user: User = Depends(get_user),
     session: AsyncSession = Depends(get_session),
     service: UserService = Depends(get_user_service)
-) -> list[TaskRead]:
+) -> Page[TaskListRead]:
     """
         Получение выданных задач.
 
         Args:
+            request (Request): Запрос (для ссылки на следующую страницу).
+            page (PageParams): Курсор и размер страницы.
             session (AsyncSession): SQLAlchemy-сессия.
             user (User): Получение текущего пользователя.
 
         Returns:
-            result (list[Task]): Список выданных задач.
+            result (Page[TaskListRead]): Страница выданных задач.
         
     """
     
-    owner_tasks = await service.get_owner_tasks(user, session)
+    owner_tasks = await service.get_owner_tasks(user, session, page)
 
-    return TaskRead.model_validate(owner_tasks)
\ No newline at end of file
+    return build_page(request, TaskListRead, owner_tasks)
\ No newline at end of file
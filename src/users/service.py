@@ -1,19 +1,28 @@
 from datetime import datetime, timezone
-from typing import Union
+from typing import Optional, Union
 
 from fastapi import HTTPException, status
 from fastapi_users.exceptions import UserAlreadyExists
-from sqlalchemy import func, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from company.models.department import Department
 from rating.schemas import AvgRatingRead
 from users.schemas import UserCreate, UserChange, UserInformation, UserRegistration
 from users.models import RoleType, User
+from users.cache import invalidate_users
 from company.models.company import Company
 from rating.models import Rating
+from rating.rollup import average_query
+from rating.cache import invalidate_leaderboards
 from tasks.models.task import Task
+from tasks.service.comment import CommentService
+from database import replica_read
+from core.pagination import KeysetPage, PageParams, paginate
+from config import get_setting
+
+
+setting = get_setting()
 
 
 class UserService:
@@ -107,6 +116,7 @@ class UserService:
 
         await session.commit()
         await session.refresh(user)
+        invalidate_users(user.id)
 
         return user
     
@@ -124,8 +134,24 @@ class UserService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail='Перед удалением нужно выйти из отделов компании'
             )
+        user_id = user.id
+        #   каскадом удаляются выданные оценки и оценки задач пользователя:
+        #   суммы кварталов уменьшает триггер, рейтинги компаний сбрасываются
+        query = (
+            select(Task.company_id)
+            .join(Rating, Rating.task_id == Task.id)
+            .where(or_(
+                Rating.head_id == user_id, Task.owner_id == user_id, Task.target_id == user_id
+            ))
+            .distinct()
+        )
+        companies = (await session.execute(query)).scalars().all()
+
         await session.delete(user)
         await session.commit()
+        invalidate_users(user_id)
+        for company_id in companies:
+            invalidate_leaderboards(company_id)
 
     async def change_role(
         self, session: AsyncSession, user: User, user_id: int, role: RoleType
@@ -166,6 +192,7 @@ class UserService:
         target_user.company_role = role
         await session.commit()
         await session.refresh(target_user)
+        invalidate_users(user_id)
 
         return target_user
     
@@ -212,34 +239,42 @@ class UserService:
         target_user.department_id = None
         await session.commit()
         await session.refresh(target_user)
+        invalidate_users(user_id)
 
         return target_user
     
-    async def get_rating(self, session: AsyncSession, user: User) -> list[Rating]:
+    @replica_read
+    async def get_rating(
+        self, session: AsyncSession, user: User, page: Optional[PageParams] = None
+    ) -> KeysetPage[Rating]:
         """
-            Получение оценок задач пользователя.
+            Получение оценок задач пользователя, новые первыми.
 
             Args:
                 session (AsyncSession): SQLAlchemy-сессия.
                 user (User): Получение текущего пользователя.
+                page (PageParams): Параметры страницы (None - все оценки).
 
             Returns:
-                list (Rating): Получение оценок задач пользователя.
+                KeysetPage (Rating): Страница оценок задач пользователя.
             
         """
 
         query = (
             select(Rating).where(Rating.owner_id == user.id)
         )
-        user_ratings = await session.execute(query)
 
-        return user_ratings.scalars().all()
+        return await paginate(
+            session, query, (Rating.created_at, Rating.id), page, descending=True
+        )
     
+    @replica_read
     async def get_avg_rating(
         self, session: AsyncSession, user: User
     ) -> AvgRatingRead:
         """
-            Получение средних оценок задач пользователя.
+            Получение средних оценок задач пользователя за текущий квартал:
+            одна строка rating_rollup по первичному ключу.
 
             Args:
                 session (AsyncSession): SQLAlchemy-сессия.
@@ -252,62 +287,60 @@ class UserService:
 
         # today = datetime.utcnow().date()
         today = datetime.now(timezone.utc).date()
-        quarter = (today.month - 1) // 3 + 1
-        quarter_start_month = 3 * (quarter - 1) + 1
-        quarter_start = datetime(today.year, quarter_start_month, 1).date()
-
-        query = (
-            select(
-                func.avg(Rating.score_date).label("avg_date"),
-                func.avg(Rating.score_quality).label("avg_quality"),
-                func.avg(Rating.score_complete).label("avg_complete"),
-            )
-            .where(
-                Rating.owner_id == user.id,
-                Rating.created_at >= quarter_start,
-            )
-        )
+        query = average_query(user.id, today)
 
         result = await session.execute(query)
         row = result.mappings().first() or {}
         return AvgRatingRead(**row)
     
+    @replica_read
     async def get_my_tasks(
-        self, user: User, session: AsyncSession
-    ) -> list[Task]:
+        self, user: User, session: AsyncSession, page: Optional[PageParams] = None
+    ) -> KeysetPage[Task]:
         """
-            Получение назначенных задач.
+            Получение назначенных задач по сроку выполнения
+            с числом комментариев и последними комментариями.
 
             Args:
                 session (AsyncSession): SQLAlchemy-сессия.
                 user (User): Получение текущего пользователя.
+                page (PageParams): Параметры страницы (None - все задачи).
 
             Returns:
-                user_tasks (list[Task]): Список назначенных задач.
+                user_tasks (KeysetPage[Task]): Страница назначенных задач.
             
         """
 
-        query = select(Task).options(selectinload(Task.comments)).where(Task.target_id == user.id)
-        user_tasks = (await session.execute(query)).scalars().all()
+        query = select(Task).where(Task.target_id == user.id)
+        result = await paginate(session, query, (Task.end_date, Task.id), page)
+        await CommentService().attach_latest_comments(
+            session, result.items, setting.TASK_LATEST_COMMENTS
+        )
 
-        return user_tasks
+        return result
     
+    @replica_read
     async def get_owner_tasks(
-        self, user: User, session: AsyncSession
-    ):
+        self, user: User, session: AsyncSession, page: Optional[PageParams] = None
+    ) -> KeysetPage[Task]:
         """
-            Получение выданных задач.
+            Получение выданных задач по сроку выполнения
+            с числом комментариев и последними комментариями.
 
             Args:
                 session (AsyncSession): SQLAlchemy-сессия.
                 user (User): Получение текущего пользователя.
+                page (PageParams): Параметры страницы (None - все задачи).
 
             Returns:
-                result (list[Task]): Список выданных задач.
+                result (KeysetPage[Task]): Страница выданных задач.
             
         """
 
-        query = select(Task).options(selectinload(Task.comments)).where(Task.owner_id == user.id)
-        owner_tasks = (await session.execute(query)).scalars().all()
+        query = select(Task).where(Task.owner_id == user.id)
+        result = await paginate(session, query, (Task.end_date, Task.id), page)
+        await CommentService().attach_latest_comments(
+            session, result.items, setting.TASK_LATEST_COMMENTS
+        )
 
-        return owner_tasks
\ No newline at end of file
+        return result
\ No newline at end of file
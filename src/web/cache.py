@@ -0,0 +1,24 @@
+from typing import Optional
+
+from core.cache import TTLCache
+from config import get_setting
+
+
+setting = get_setting()
+
+#   кэш контекста главной страницы: ключ - идентификатор пользователя
+dashboard_cache = TTLCache(
+    'dashboard', setting.DASHBOARD_CACHE_TTL, setting.DASHBOARD_CACHE_SIZE
+)
+
+
+#   сброс дашбордов пользователей после изменения их задач, встреч и т.д.
+def invalidate_dashboards(*user_ids: int) -> None:
+    dashboard_cache.invalidate(*user_ids)
+
+#   сброс дашбордов всех сотрудников компании (новости, состав)
+def invalidate_company_dashboards(company_id: Optional[int]) -> None:
+    if company_id:
+        dashboard_cache.invalidate_where(
+            lambda _, dashboard: dashboard.profile.company_id == company_id
+        )
\ No newline at end of file
@@ -0,0 +1,104 @@
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.template import templates
+from users.models import User
+from web.schemas import DashboardRead
+from web.service import DashboardService
+from web.cache import dashboard_cache, invalidate_company_dashboards, invalidate_dashboards
+
+
+class DashboardContextBuilder:
+    """
+        Построитель контекста страницы index.html для Jinja-маршрутов:
+            - получение дашборда из кэша или одним запросом
+            - отрисовка страницы с дополнительными полями (ошибки, формы)
+            - сброс кэша после изменений
+    """
+
+    def __init__(self, dashboard_service: DashboardService):
+        self.dashboard_service = dashboard_service
+
+    async def get_dashboard(
+        self, session: AsyncSession, user: User, fresh: bool = False
+    ) -> DashboardRead:
+        """
+            Получение контекста главной страницы.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                user (User): Получение текущего пользователя.
+                fresh (bool): Игнорировать кэш и перечитать данные.
+
+            Returns:
+                (DashboardRead): Схема контекста главной страницы.
+        """
+
+        user_id = inspect(user).identity[0]
+        if not fresh:
+            dashboard = dashboard_cache.get(user_id)
+            if dashboard is not None:
+                return dashboard
+
+        await self.restore_session(session, user)
+        dashboard = await self.dashboard_service.get_dashboard(session, user)
+        dashboard_cache.set(user_id, dashboard)
+
+        return dashboard
+
+    async def render(
+        self, request: Request, user: Optional[User], session: AsyncSession,
+        status_code: int = 200, fresh: bool = False, **extra
+    ):
+        """
+            Отрисовка главной страницы.
+
+            Ошибочные отправки форм отрисовываются из кэша, без повторного
+            выполнения запросов дашборда.
+
+            Args:
+                request (Request): Запрос.
+                user (User): Получение текущего пользователя.
+                session (AsyncSession): SQLAlchemy-сессия.
+                status_code (int): Код ответа.
+                fresh (bool): Игнорировать кэш и перечитать данные.
+                extra: Дополнительные поля шаблона (error, edit_task и т.д.).
+
+            Returns:
+                TemplateResponse: Страница index.html.
+        """
+
+        context = {"request": request, "user": user}
+        if user:
+            dashboard = await self.get_dashboard(session, user, fresh)
+            await self.restore_session(session, user)
+            context.update(dashboard.to_context())
+        context.update(extra)
+
+        return templates.TemplateResponse("index.html", context, status_code=status_code)
+
+    def invalidate_user(self, *user_ids: int) -> None:
+        invalidate_dashboards(*user_ids)
+
+    def invalidate_company(self, company_id: Optional[int]) -> None:
+        invalidate_company_dashboards(company_id)
+
+    async def restore_session(self, session: AsyncSession, user: User) -> None:
+        """
+            Восстановление сессии после неудачной записи.
+
+            Откатывает прерванную транзакцию и перечитывает пользователя,
+            если его поля были сброшены коммитом или откатом.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                user (User): Получение текущего пользователя.
+        """
+
+        if not session.is_active:
+            await session.rollback()
+        if inspect(user).expired_attributes:
+            await session.refresh(user)
@@ -0,0 +1,11 @@
+from web.service import DashboardService
+from web.context import DashboardContextBuilder
+
+
+#   возврат сервиса главной страницы
+def get_dashboard_service() -> DashboardService:
+    return DashboardService()
+
+#   возврат построителя контекста главной страницы
+def get_context_builder() -> DashboardContextBuilder:
+    return DashboardContextBuilder(DashboardService())
\ No newline at end of file
@@ -4,13 +4,12 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, HTTPException, Request, Form, Depends
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi_users.password import PasswordHelper
 
 from core.template import templates
 from company.schemas.department import DepartmentCreate
 from company.service.department import DepartmentService
 from calendars.depencies import get_calendar_service
-from calendars.service import CalendarService
+from calendars.service import CalendarService, month_adapter
 from meeting.depencies import get_meeting_service
 from meeting.schemas import MeetingChange, MeetingCreate
 from meeting.service import MeetingService
@@ -32,13 +31,18 @@ from users.config_token import auth_backend
 from users.service import UserService
 from users.depencies import get_user_service
 from users.schemas import UserChange, UserRegistration
+from users.cache import invalidate_users
 from database import get_session
-from core_depencies import check_role, get_user
+from core_depencies import check_role, get_user, get_loader
+from core.loader import ConcurrentLoader
+from core.hashing import password_pool
 from news.depencies import get_news_service
 from company.service.company import CompanyService
 from company.depencies import validate_company_presence, get_company_service, get_department_service
 from company.schemas.company import CompanyCreate
 from meeting.depencies import get_meeting_service
+from web.depencies import get_context_builder
+from web.context import DashboardContextBuilder
 
 
 router = APIRouter(tags=['Jinja endpoints'])
@@ -47,43 +51,23 @@ router = APIRouter(tags=['Jinja endpoints'])
 async def index_page(
     request: Request,
     user: User = Depends(fastapi_users.current_user(optional=True)),
-    user_service: UserService = Depends(get_user_service),
-    news_service: UserService = Depends(get_news_service),
-    company_service: CompanyService = Depends(get_company_service),
-    meeting_service: MeetingService = Depends(get_meeting_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
-    profile = None
-    users = []
-    ratings = []
-    news = []
-    owner_meetings = []
-    tasks = {"owner_tasks": [], "assigned_tasks": []}
-    avg = None
-
-    if user:
-        profile = await user_service.get_user(user)
-        if user.company_id:
-            users = await company_service.get_company_users(session, user, user.company_id)
-            news = await news_service.get_news(session, user.company_id)
-            owner_meetings = await meeting_service.get_meeting(user, session, user.company_id)
-        ratings = await user_service.get_rating(session, user)
-        avg = await user_service.get_avg_rating(session, user)
-
-        tasks["owner_tasks"] = await user_service.get_owner_tasks(user, session)
-        tasks["assigned_tasks"] = await user_service.get_my_tasks(user, session)
+    if not user:
+        return templates.TemplateResponse("index.html", {
+            "request": request,
+            "user": None,
+            "profile": None,
+            "users": [],
+            "ratings": [],
+            "avg": None,
+            "news": [],
+            "tasks": {"owner_tasks": [], "assigned_tasks": []},
+            "owner_meetings": []
+        })
 
-    return templates.TemplateResponse("index.html", {
-        "request": request,
-        "user": user,
-        "profile": profile,
-        "users": users,
-        "ratings": ratings,
-        "avg": avg,
-        'news': news,
-        "tasks": tasks,
-        "owner_meetings": owner_meetings
-    })
+    return await builder.render(request, user, session, fresh=True)
 
 @router.post("/login")
 async def login_post(
@@ -97,8 +81,9 @@ async def login_post(
         if not db_user:
             raise Exception("User not found")
 
-        helper = PasswordHelper()
-        valid, _ = helper.verify_and_update(password, db_user.hashed_password)
+        valid, _ = await password_pool.verify_and_update(
+            password, db_user.hashed_password
+        )
 
         if not valid:
             raise Exception("Invalid password")
@@ -181,9 +166,11 @@ async def edit_profile(
     email: Optional[str] = Form(None),
     user: User = Depends(fastapi_users.current_user()),
     service: UserService = Depends(get_user_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
+        company_id = user.company_id
         if company_code == "":
             company_code = None
 
@@ -196,55 +183,39 @@ async def edit_profile(
         )
 
         await service.change_user(session, user, data)
+        builder.invalidate_user(user.id)
+        builder.invalidate_company(company_id)
+        builder.invalidate_company(user.company_id)
 
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        profile = await service.get_user(user)
-    
-        tasks = {
-            "owner_tasks": await service.get_owner_tasks(user, session),
-            "assigned_tasks": await service.get_my_tasks(user, session)
-        }
-        ratings = await service.get_rating(session, user)
-        avg = await service.get_avg_rating(session, user)
-        users = []
-        if user.company_id:
-            users = await get_company_service().get_company_users(session, user, user.company_id)
-
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "tasks": tasks,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "error": str(e)
-        }, status_code=400)
+        return await builder.render(
+            request, user, session, status_code=400, error=str(e)
+        )
 
 @router.post("/delete-profile")
 async def delete_profile(
     request: Request,
     user: User = Depends(fastapi_users.current_user()),
     service: UserService = Depends(get_user_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
+        user_id = user.id
         await service.delete_user(session, user)
+        builder.invalidate_user(user_id)
+
         response = RedirectResponse(url="/", status_code=302)
         response.delete_cookie("project")
         return response
 
     except Exception as e:
-        profile = await service.get_user(user)
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "error": str(e)
-        }, status_code=400)
-    
+        return await builder.render(
+            request, user, session, status_code=400, error=str(e)
+        )
+
 @router.post("/change-role")
 async def change_role_post(
     request: Request,
@@ -252,65 +223,51 @@ async def change_role_post(
     role: str = Form(...),
     user: User = Depends(fastapi_users.current_user()),
     user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
         if user.company_role != RoleType.admin:
             raise HTTPException(status_code=403, detail="Недостаточно прав")
 
+        company_id = user.company_id
         await user_service.change_role(session, user, user_id, RoleType(role))
+        builder.invalidate_company(company_id)
+
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-
-        profile = await user_service.get_user(user)
-        users = await company_service.get_company_users(session, user, user.company_id)
-        tasks = {
-        "owner_tasks": await user_service.get_owner_tasks(user, session),
-        "assigned_tasks": await user_service.get_my_tasks(user, session)
-    }
+        return await builder.render(
+            request, user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "tasks": tasks,
-            "error": error
-        }, status_code=400)
-    
 @router.post("/remove-department")
 async def remove_department_post(
     request: Request,
     user_id: int = Form(...),
     user: User = Depends(fastapi_users.current_user()),
     user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
         if user.company_role != RoleType.admin:
             raise HTTPException(status_code=403, detail="Недостаточно прав")
 
+        company_id = user.company_id
         await user_service.delete_department(session, user, user_id)
-        users = await company_service.get_company_users(session, user, user.company_id)
+        builder.invalidate_company(company_id)
+
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
         print(f"[REMOVE DEPT ERROR]: {e}")
-        profile = await user_service.get_user(user)
-        users = await company_service.get_company_users(session, user, user.company_id)
+        return await builder.render(
+            request, user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "error": e.detail if isinstance(e, HTTPException) else str(e)
-        }, status_code=400)
-    
 
 @router.post("/create-company")
 async def create_company_post(
@@ -320,8 +277,8 @@ async def create_company_post(
     company_code: str = Form(...),
     admin_code: str = Form(...),
     user: User = Depends(fastapi_users.current_user()),
-    user_service: UserService = Depends(get_user_service),
     company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
@@ -343,34 +300,23 @@ async def create_company_post(
         user.company_role = RoleType.admin
         await session.commit()
         await session.refresh(user)
+        invalidate_users(user.id)
+        builder.invalidate_user(user.id)
 
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        profile = await user_service.get_user(user)
-        users = []
-        ratings = await user_service.get_rating(session, user)
-        avg = await user_service.get_avg_rating(session, user)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session)
-        }
+        return await builder.render(
+            request, user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "tasks": tasks,
-            "error": e.detail if isinstance(e, HTTPException) else str(e)
-        }, status_code=400)
-    
 @router.post("/add-user")
 async def add_user_post(
     request: Request,
     user_id: int = Form(...),
-    user_service: UserService = Depends(get_user_service),
     company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(fastapi_users.current_user(optional=True)),
 ):
@@ -384,43 +330,37 @@ async def add_user_post(
         if not current_user.company_id:
             raise HTTPException(status_code=400, detail="Вы не состоите в компании")
 
-        await company_service.add_user(session, current_user.company_id, user_id)
+        company_id = current_user.company_id
+        await company_service.add_user(session, company_id, user_id)
+        builder.invalidate_user(user_id)
+        builder.invalidate_company(company_id)
 
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
         print(f"[ADD USER ERROR]: {e}")
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-
-        profile = await user_service.get_user(current_user) if current_user else None
-        users = await company_service.get_company_users(session, current_user, current_user.company_id) if current_user else []
-        ratings = await user_service.get_rating(session, current_user) if current_user else []
-        avg = await user_service.get_avg_rating(session, current_user) if current_user else None
+        return await builder.render(
+            request, current_user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": current_user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "error": error
-        }, status_code=400)
-    
 @router.post("/remove-user-from-company")
 async def remove_user_from_company(
     request: Request,
     user_id: int = Form(...),
     user: User = Depends(check_role),
     session: AsyncSession = Depends(get_session),
-    user_service: UserService = Depends(get_user_service),
     company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
 ):
     try:
         if not user.company_id:
             raise HTTPException(status_code=400, detail="Вы не состоите в компании")
 
-        await company_service.delete_user(session, user.company_id, user_id)
+        company_id = user.company_id
+        await company_service.delete_user(session, company_id, user_id)
+        builder.invalidate_user(user_id)
+        builder.invalidate_company(company_id)
 
         return RedirectResponse(url="/", status_code=302)
 
@@ -428,62 +368,40 @@ async def remove_user_from_company(
         error = e.detail if isinstance(e, HTTPException) else str(e)
         print(f"[REMOVE COMPANY USER ERROR]: {error}")
 
-        profile = await user_service.get_user(user)
-        users = await company_service.get_company_users(session, user, user.company_id)
-        ratings = await user_service.get_rating(session, user)
-        avg = await user_service.get_avg_rating(session, user)
+        return await builder.render(
+            request, user, session, status_code=400, error=error
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "error": error
-        }, status_code=400)
-    
 @router.post("/delete-company")
 async def delete_company_post(
     request: Request,
     company_id: int = Form(...),
     user: User = Depends(get_user),
     session: AsyncSession = Depends(get_session),
-    user_service: UserService = Depends(get_user_service),
     company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
 ):
-    
+
     try:
         if user.company_role != RoleType.admin:
             raise HTTPException(status_code=403, detail="Недостаточно прав")
-        
+
         await company_service.delete_company(session, company_id)
         user.company_id = None
         user.company_role = RoleType.employee
         await session.commit()
         await session.refresh(user)
+        invalidate_users(user.id)
+        builder.invalidate_user(user.id)
+        builder.invalidate_company(company_id)
+
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-
-        profile = await user_service.get_user(user)
-        users = []
-        ratings = await user_service.get_rating(session, user)
-        avg = await user_service.get_avg_rating(session, user)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session)
-        }
-
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "tasks": tasks,
-            "error": error
-        }, status_code=400)
+        return await builder.render(
+            request, user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
 @router.post("/create-department")
 async def create_department_post(
@@ -493,32 +411,23 @@ async def create_department_post(
     current_user: User = Depends(fastapi_users.current_user()),
     session: AsyncSession = Depends(get_session),
     department_service: DepartmentService = Depends(get_department_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service)
+    builder: DashboardContextBuilder = Depends(get_context_builder)
 ):
     try:
         user = validate_company_presence(current_user)
+        company_id = user.company_id
         data = DepartmentCreate(name=name, head_user_id=head_user_id)
-        await department_service.create_department(session, user, user.company_id, data)
+        await department_service.create_department(session, user, company_id, data)
+        builder.invalidate_company(company_id)
+
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-        profile = await user_service.get_user(current_user)
-        users = await company_service.get_company_users(session, current_user, current_user.company_id)
-        ratings = await user_service.get_rating(session, current_user)
-        avg = await user_service.get_avg_rating(session, current_user)
+        return await builder.render(
+            request, current_user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": current_user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "error": error
-        }, status_code=400)
-    
 @router.post("/change-department-head")
 async def change_department_head_post(
     request: Request,
@@ -526,66 +435,46 @@ async def change_department_head_post(
     user_id: int = Form(...),
     current_user: User = Depends(fastapi_users.current_user()),
     department_service: DepartmentService = Depends(get_department_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
         user = validate_company_presence(current_user)
-        await department_service.change_head_user(session, user, user.company_id, department_id, user_id)
+        company_id = user.company_id
+        await department_service.change_head_user(session, user, company_id, department_id, user_id)
+        builder.invalidate_company(company_id)
+
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-        profile = await user_service.get_user(current_user)
-        users = await company_service.get_company_users(session, current_user, current_user.company_id)
-        ratings = await user_service.get_rating(session, current_user)
-        avg = await user_service.get_avg_rating(session, current_user)
+        return await builder.render(
+            request, current_user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": current_user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "error": error
-        }, status_code=400)
-    
 @router.post("/delete-department")
 async def delete_department_post(
     request: Request,
     department_id: int = Form(...),
     current_user: User = Depends(fastapi_users.current_user()),
     department_service: DepartmentService = Depends(get_department_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
         user = validate_company_presence(current_user)
+        company_id = user.company_id
+        await department_service.delete_department(session, user, company_id, department_id)
+        builder.invalidate_company(company_id)
 
-        await department_service.delete_department(session, user, user.company_id, department_id)
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-
-        profile = user_service.get_user(current_user)
-        users = await company_service.get_company_users(session, current_user, current_user.company_id)
-        ratings = await user_service.get_rating(session, current_user)
-        avg = await user_service.get_avg_rating(session, current_user)
+        return await builder.render(
+            request, current_user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": current_user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "error": error
-        }, status_code=400)
-    
 @router.post("/create-task")
 async def create_task_post(
     request: Request,
@@ -596,8 +485,7 @@ async def create_task_post(
     description: str = Form(...),
     current_user: User = Depends(fastapi_users.current_user()),
     task_service: TaskService = Depends(get_task_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
@@ -611,92 +499,50 @@ async def create_task_post(
         )
 
         result = await task_service.create_task(user, session, data)
+        builder.invalidate_user(result['owner_id'], result['target_id'])
         await task_service.add_task_calendar(session, result)
 
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-
-        profile = user_service.get_user(current_user)
-        users = await company_service.get_company_users(session, current_user, current_user.company_id)
-        ratings = await user_service.get_rating(session, current_user)
-        avg = await user_service.get_avg_rating(session, current_user)
+        return await builder.render(
+            request, current_user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": current_user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "error": error
-        }, status_code=400)
-    
 @router.post("/delete-task")
 async def delete_task_post(
     request: Request,
     task_id: int = Form(...),
     user: User = Depends(fastapi_users.current_user()),
     task_service: TaskService = Depends(get_task_service),
-    user_service: UserService = Depends(get_user_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
+        company_id = user.company_id
         await task_service.delete_task(user, task_id, session)
-        
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session)
-        }
+        builder.invalidate_company(company_id)
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": await user_service.get_user(user),
-            "tasks": tasks,
-            "error": None
-        }, status_code=200)
+        return await builder.render(request, user, session, fresh=True, error=None)
 
     except Exception as e:
         print(f"[DELETE TASK ERROR]: {e}")
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session)
-        }
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": await user_service.get_user(user),
-            "tasks": tasks,
-            "error": str(e)
-        }, status_code=400)
-    
+        return await builder.render(
+            request, user, session, status_code=400, error=str(e)
+        )
+
 @router.get("/edit-task-form")
 async def edit_task_form(
     request: Request,
     task_id: int,
     user: User = Depends(fastapi_users.current_user()),
-    task_service: TaskService = Depends(get_task_service),
-    user_service: UserService = Depends(get_user_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     task = await session.get(Task, task_id)
 
-    tasks = {
-        "owner_tasks": await user_service.get_owner_tasks(user, session),
-        "assigned_tasks": await user_service.get_my_tasks(user, session)
-    }
-
-    profile = await user_service.get_user(user)
-
-    return templates.TemplateResponse("index.html", {
-        "request": request,
-        "user": user,
-        "profile": profile,
-        "tasks": tasks,
-        "edit_task": task
-    })
+    return await builder.render(request, user, session, edit_task=task)
 
 @router.post("/edit-task/{task_id}")
 async def edit_task_post(
@@ -709,10 +555,11 @@ async def edit_task_post(
     status: str = Form(...),
     user: User = Depends(fastapi_users.current_user()),
     task_service: TaskService = Depends(get_task_service),
-    user_service: UserService = Depends(get_user_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
+        company_id = user.company_id
         data = TaskChange(
             title=title,
             description=description,
@@ -721,26 +568,19 @@ async def edit_task_post(
             status=status
         )
         await task_service.change_task(user, session, data, task_id)
+        builder.invalidate_company(company_id)
 
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
         print(f"[EDIT TASK ERROR]: {e}")
 
+        await builder.restore_session(session, user)
         task = await session.get(Task, task_id)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session)
-        }
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": await user_service.get_user(user),
-            "tasks": tasks,
-            "edit_task": task,
-            "error": str(e)
-        }, status_code=400)
+        return await builder.render(
+            request, user, session, status_code=400, edit_task=task, error=str(e)
+        )
 
 @router.post("/change-task-status")
 async def change_task_status_post(
@@ -750,36 +590,22 @@ async def change_task_status_post(
     user: User = Depends(fastapi_users.current_user()),
     session: AsyncSession = Depends(get_session),
     service: TaskService = Depends(get_task_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
 ):
     try:
+        company_id = user.company_id
         status_enum = TaskStatus(status)
         await service.change_task_role(user, session, task_id, TaskChangeRole(status=status_enum))
+        builder.invalidate_company(company_id)
 
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        profile = await user_service.get_user(user)
-        users = await company_service.get_company_users(session, user, user.company_id)
-        ratings = await user_service.get_rating(session, user)
-        avg = await user_service.get_avg_rating(session, user)
-        tasks = {
-            "assigned_tasks": await user_service.get_my_tasks(user, session),
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-        }
+        return await builder.render(
+            request, user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "tasks": tasks,
-            "error": e.detail if isinstance(e, HTTPException) else str(e),
-        }, status_code=400)
-    
 @router.post("/add-comment")
 async def add_comment_post(
     request: Request,
@@ -787,30 +613,23 @@ async def add_comment_post(
     description: str = Form(...),
     user: User = Depends(fastapi_users.current_user()),
     comment_service: CommentService = Depends(get_comment_service),
-    user_service: UserService = Depends(get_user_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session),
 ):
     try:
+        company_id = user.company_id
         data = CommentCreate(description=description)
         await comment_service.create_comment(user, session, task_id, data)
+        builder.invalidate_company(company_id)
 
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        profile = await user_service.get_user(user)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session),
-        }
+        return await builder.render(
+            request, user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "tasks": tasks,
-            "error": e.detail if isinstance(e, HTTPException) else str(e)
-        }, status_code=400)
-    
 @router.post("/delete-comment")
 async def delete_comment_post(
     request: Request,
@@ -818,38 +637,20 @@ async def delete_comment_post(
     task_id: int = Form(...),
     user: User = Depends(fastapi_users.current_user()),
     comment_service: CommentService = Depends(get_comment_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
+        company_id = user.company_id
         await comment_service.delete_comment(user, session, task_id, comment_id)
+        builder.invalidate_company(company_id)
 
-        profile = await user_service.get_user(user)
-        users = await company_service.get_company_users(session, user, user.company_id)
-        ratings = await user_service.get_rating(session, user)
-        avg = await user_service.get_avg_rating(session, user)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session)
-        }
-
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "tasks": tasks
-        })
+        return await builder.render(request, user, session, fresh=True)
 
     except Exception as e:
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "error": str(e)
-        }, status_code=400)
+        return await builder.render(
+            request, user, session, status_code=400, error=str(e)
+        )
 
 @router.post("/rate-task")
 async def rate_task_post(
@@ -860,11 +661,11 @@ async def rate_task_post(
     score_complete: int = Form(...),
     user: User = Depends(fastapi_users.current_user()),
     rating_service: RatingService = Depends(get_rating_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session)
 ):
     try:
+        company_id = user.company_id
         data = RatingCreate(
             score_date=score_date,
             score_quality=score_quality,
@@ -872,22 +673,15 @@ async def rate_task_post(
         )
 
         await rating_service.create_rating(user, session, task_id, data)
+        builder.invalidate_company(company_id)
 
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        profile = await user_service.get_user(user)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session)
-        }
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "tasks": tasks,
-            "error": e.detail if isinstance(e, HTTPException) else str(e)
-        }, status_code=400)
+        return await builder.render(
+            request, user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
 @router.post("/create-news")
 async def create_news_post(
@@ -897,28 +691,21 @@ async def create_news_post(
     user: User = Depends(fastapi_users.current_user()),
     session: AsyncSession = Depends(get_session),
     news_service: NewsService = Depends(get_news_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service)
+    builder: DashboardContextBuilder = Depends(get_context_builder)
 ):
     try:
+        company_id = user.company_id
         data = NewsCreate(title=title, description=description)
-        await news_service.create_news(session, user, user.company_id, data)
+        await news_service.create_news(session, user, company_id, data)
+        builder.invalidate_company(company_id)
+
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-        profile = await user_service.get_user(user)
-        users = await company_service.get_company_users(session, user, user.company_id)
-        news = await news_service.get_news_by_company(session, user.company_id)
-
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "news": news,
-            "news_error": error
-        }, status_code=400)
+        return await builder.render(
+            request, user, session, status_code=400,
+            news_error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
 @router.post("/delete-news")
 async def delete_news_post(
@@ -928,36 +715,19 @@ async def delete_news_post(
     user: User = Depends(fastapi_users.current_user()),
     session: AsyncSession = Depends(get_session),
     service: NewsService = Depends(get_news_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service)
+    builder: DashboardContextBuilder = Depends(get_context_builder)
 ):
     try:
         await service.delete_news(session, user, company_id, news_id)
+        builder.invalidate_company(company_id)
+
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-        profile = await user_service.get_user(user)
-        users = await company_service.get_company_users(session, user, user.company_id)
-        ratings = await user_service.get_rating(session, user)
-        avg = await user_service.get_avg_rating(session, user)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session)
-        }
-        news = await service.get_news(session, user.company_id)
-
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "tasks": tasks,
-            "news": news,
-            "error": error
-        }, status_code=400)
+        return await builder.render(
+            request, user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
 @router.post("/create-meeting")
 async def create_meeting_post(
@@ -969,10 +739,10 @@ async def create_meeting_post(
     user: User = Depends(fastapi_users.current_user()),
     session: AsyncSession = Depends(get_session),
     meeting_service: MeetingService = Depends(get_meeting_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service)
+    builder: DashboardContextBuilder = Depends(get_context_builder)
 ):
     try:
+        user_id = user.id
         meeting_data = MeetingCreate(
             title=title,
             description=description,
@@ -980,30 +750,16 @@ async def create_meeting_post(
             meeting_time=meeting_time
         )
         await meeting_service.create_meeting(user, session, meeting_data)
+        builder.invalidate_user(user_id)
+
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-        profile = await user_service.get_user(user)
-        users = await company_service.get_company_users(session, user, user.company_id)
-        ratings = await user_service.get_rating(session, user)
-        avg = await user_service.get_avg_rating(session, user)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session)
-        }
+        return await builder.render(
+            request, user, session, status_code=400,
+            meeting_error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "tasks": tasks,
-            "meeting_error": error
-        }, status_code=400)
-    
 @router.post("/delete-meeting")
 async def delete_meeting_post(
     request: Request,
@@ -1011,40 +767,20 @@ async def delete_meeting_post(
     user: User = Depends(fastapi_users.current_user()),
     session: AsyncSession = Depends(get_session),
     meeting_service: MeetingService = Depends(get_meeting_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service)
+    builder: DashboardContextBuilder = Depends(get_context_builder)
 ):
     try:
+        user_id = user.id
         await meeting_service.delete_meeting(user, session, meeting_id)
+        builder.invalidate_user(user_id)
 
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        error = e.detail if isinstance(e, HTTPException) else str(e)
-
-        profile = await user_service.get_user(user)
-        users = await company_service.get_company_users(session, user, user.company_id)
-        ratings = await user_service.get_rating(session, user)
-        avg = await user_service.get_avg_rating(session, user)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session)
-        }
-        news = await company_service.get_news(session, user.company_id)
-        owner_meetings = await meeting_service.get_meeting(user, session, user.company_id)
-
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "tasks": tasks,
-            "news": news,
-            "owner_meetings": owner_meetings,
-            "error": error
-        }, status_code=400)
+        return await builder.render(
+            request, user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
 @router.post("/change-meeting")
 async def change_meeting_post(
@@ -1056,9 +792,11 @@ async def change_meeting_post(
     meeting_time_str: str = Form(""),
     user: User = Depends(fastapi_users.current_user()),
     meeting_service: MeetingService = Depends(get_meeting_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
     session: AsyncSession = Depends(get_session),
 ):
     try:
+        user_id = user.id
         parsed_date = datetime.date.fromisoformat(meeting_date_str) if meeting_date_str else None
         parsed_time = datetime.time.fromisoformat(meeting_time_str) if meeting_time_str else None
 
@@ -1070,15 +808,15 @@ async def change_meeting_post(
         )
 
         await meeting_service.change_meeting(user, session, meeting_id, data)
+        builder.invalidate_user(user_id)
+
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
         print(f"[CHANGE MEETING ERROR]: {e}")
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "error": str(e),
-            "user": user,
-        }, status_code=400)
+        return await builder.render(
+            request, user, session, status_code=400, error=str(e)
+        )
 
 @router.post("/add-meeting-user")
 async def add_meeting_user_post(
@@ -1087,74 +825,57 @@ async def add_meeting_user_post(
     user_id: int = Form(...),
     user: User = Depends(fastapi_users.current_user()),
     meeting_service: MeetingService = Depends(get_meeting_service),
-    user_service: UserService = Depends(get_user_service),
-    session: AsyncSession = Depends(get_session),
-    company_service: CompanyService = Depends(get_company_service)
+    builder: DashboardContextBuilder = Depends(get_context_builder),
+    session: AsyncSession = Depends(get_session)
 ):
     try:
         await meeting_service.add_user_meeting(user, session, meeting_id, user_id)
+
         return RedirectResponse(url="/", status_code=302)
 
     except Exception as e:
-        profile = await user_service.get_user(user)
-        users = await company_service.get_company_users(session, user, user.company_id)
-        meetings = await meeting_service.get_meeting(user, session, user.company_id)
+        return await builder.render(
+            request, user, session, status_code=400,
+            error=e.detail if isinstance(e, HTTPException) else str(e)
+        )
 
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "owner_meetings": meetings,
-            "error": e.detail if isinstance(e, HTTPException) else str(e),
-        }, status_code=400)
-    
 @router.get("/calendar", response_class=HTMLResponse)
 async def view_calendar_day(
     request: Request,
     day: int,
     user: User = Depends(fastapi_users.current_user()),
     calendar_service: CalendarService = Depends(get_calendar_service),
-    user_service: UserService = Depends(get_user_service),
-    company_service: CompanyService = Depends(get_company_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
+    loader: ConcurrentLoader = Depends(get_loader),
     session: AsyncSession = Depends(get_session),
 ):
-    profile = await user_service.get_user(user)
-    users = await company_service.get_company_users(session, user, user.company_id)
-    ratings = await user_service.get_rating(session, user)
-    avg = await user_service.get_avg_rating(session, user)
-    tasks = {
-        "owner_tasks": await user_service.get_owner_tasks(user, session),
-        "assigned_tasks": await user_service.get_my_tasks(user, session)
+    #   ошибка расписания не должна отменять загрузку дашборда
+    async def load_events(events_session: AsyncSession):
+        try:
+            return await calendar_service.get_day_schedule(user, events_session, day), None
+        except Exception as e:
+            return [], str(e)
+
+    dashboard, (events, error) = await loader.run(
+        session,
+        lambda dashboard_session: builder.get_dashboard(dashboard_session, user),
+        load_events
+    )
+
+    context = {
+        "request": request,
+        "user": user,
+        **dashboard.to_context(),
+        "calendar_day": events,
+        "selected_day": day
     }
-
-    try:
-        events = await calendar_service.get_day_schedule(user, session, day)
+    if error:
         return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "tasks": tasks,
-            "calendar_day": events,
-            "selected_day": day
-        })
-    except Exception as e:
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "users": users,
-            "ratings": ratings,
-            "avg": avg,
-            "tasks": tasks,
-            "calendar_day": [],
-            "selected_day": day,
-            "calendar_error": str(e)
+            **context, "calendar_error": error
         }, status_code=400)
 
+    return templates.TemplateResponse("index.html", context)
+
 @router.get("/calendar-month", response_class=HTMLResponse)
 async def view_month_schedule(
     request: Request,
@@ -1162,41 +883,37 @@ async def view_month_schedule(
     month: int,
     user: User = Depends(fastapi_users.current_user()),
     calendar_service: CalendarService = Depends(get_calendar_service),
-    user_service: UserService = Depends(get_user_service),
+    builder: DashboardContextBuilder = Depends(get_context_builder),
+    loader: ConcurrentLoader = Depends(get_loader),
     session: AsyncSession = Depends(get_session),
 ):
-    try:
-        profile = await user_service.get_user(user)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session),
-        }
-        print(f'\n\n\n\n\n\n{year, month}\n\n\n\n')
-        events = await calendar_service.get_month_schedule(session, user, year, month)
-        print(f'\n\n\n\n\n\n{events}\n\n\n\n')
-
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "tasks": tasks,
-            "calendar_month": events,
-            "selected_month": month,
-            "selected_year": year
-        })
-    except Exception as e:
-        profile = await user_service.get_user(user)
-        tasks = {
-            "owner_tasks": await user_service.get_owner_tasks(user, session),
-            "assigned_tasks": await user_service.get_my_tasks(user, session),
-        }
+    #   ошибка расписания не должна отменять загрузку дашборда
+    async def load_events(events_session: AsyncSession):
+        try:
+            schedule = await calendar_service.get_month_schedule_json(
+                events_session, user, year, month
+            )
+            return month_adapter.validate_json(schedule), None
+        except Exception as e:
+            return [], str(e)
+
+    dashboard, (events, error) = await loader.run(
+        session,
+        lambda dashboard_session: builder.get_dashboard(dashboard_session, user),
+        load_events
+    )
+
+    context = {
+        "request": request,
+        "user": user,
+        **dashboard.to_context(),
+        "calendar_month": events,
+        "selected_month": month,
+        "selected_year": year
+    }
+    if error:
         return templates.TemplateResponse("index.html", {
-            "request": request,
-            "user": user,
-            "profile": profile,
-            "tasks": tasks,
-            "calendar_month": [],
-            "selected_month": month,
-            "selected_year": year,
-            "calendar_month_error": str(e)
-        }, status_code=400)
\ No newline at end of file
+            **context, "calendar_month_error": error
+        }, status_code=400)
+
+    return templates.TemplateResponse("index.html", context)
@@ -0,0 +1,138 @@
+import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from tasks.models.task import TaskStatus
+from users.schemas import UserInformation
+from rating.schemas import AvgRatingRead, RatingReadUser
+
+
+class DashboardComment(BaseModel):
+    """
+        Схема комментария для отображения на главной странице
+
+        Fields:
+        - id: Идентификатор комментария.
+        - author_id: Идентификатор пользователя.
+        - task_id: Идентификатор задачи.
+        - description: Тело комментария.
+    """
+
+    id: int
+    author_id: int
+    task_id: int
+    description: str
+
+
+class DashboardTask(BaseModel):
+    """
+        Схема задачи для отображения на главной странице
+
+        Fields:
+        - id: Идентификатор задачи.
+        - owner_id: Идентификатор пользователя, установившего задачу.
+        - company_id: Идентификатор компании.
+        - target_id: Идентификатор исполнителя задачи.
+        - start_date: Начало задачи.
+        - end_date: Окончание задачи.
+        - title: Название задачи.
+        - description: Описание задачи.
+        - status: Статус задачи.
+        - comments: Последние комментарии к задаче.
+        - comment_count: Число комментариев к задаче.
+    """
+
+    id: int
+    owner_id: int
+    company_id: int
+    target_id: int
+    start_date: datetime.date
+    end_date: datetime.date
+    title: str
+    description: Optional[str] = None
+    status: TaskStatus
+    comments: list[DashboardComment] = []
+    comment_count: int = 0
+
+
+class DashboardNews(BaseModel):
+    """
+        Схема новости для отображения на главной странице
+
+        Fields:
+        - id: Идентификатор новости.
+        - owner_id: Идентификатор пользователя, который выставил новость.
+        - company_id: Идентификатор компании.
+        - title: Заголовок новости.
+        - description: Тело новости.
+    """
+
+    id: int
+    owner_id: int
+    company_id: int
+    title: str
+    description: str
+
+
+class DashboardMeeting(BaseModel):
+    """
+        Схема встречи для отображения на главной странице
+
+        Fields:
+        - id: Идентификатор встречи.
+        - organizer_id: Идентификатор организатора встречи.
+        - company_id: Идентификатор компании.
+        - title: Заголовок встречи.
+        - description: Описание встречи.
+        - meeting_date: Дата встречи.
+        - meeting_time: Время встречи.
+    """
+
+    id: int
+    organizer_id: int
+    company_id: int
+    title: str
+    description: Optional[str] = None
+    meeting_date: datetime.date
+    meeting_time: datetime.time
+
+
+class DashboardTasks(BaseModel):
+    """
+        Схема задач пользователя на главной странице
+
+        Fields:
+        - owner_tasks: Выданные задачи.
+        - assigned_tasks: Назначенные задачи.
+    """
+
+    owner_tasks: list[DashboardTask] = []
+    assigned_tasks: list[DashboardTask] = []
+
+
+class DashboardRead(BaseModel):
+    """
+        Схема полного контекста главной страницы
+
+        Fields:
+        - profile: Профиль текущего пользователя.
+        - users: Сотрудники компании.
+        - news: Новости компании.
+        - owner_meetings: Созданные пользователем встречи.
+        - ratings: Оценки задач пользователя.
+        - avg: Средние оценки за текущий квартал.
+        - tasks: Выданные и назначенные задачи.
+    """
+
+    profile: UserInformation
+    users: list[UserInformation] = []
+    news: list[DashboardNews] = []
+    owner_meetings: list[DashboardMeeting] = []
+    ratings: list[RatingReadUser] = []
+    avg: AvgRatingRead
+    tasks: DashboardTasks
+
+    #   контекст для шаблона index.html без сериализации вложенных объектов
+    def to_context(self) -> dict:
+        return {name: getattr(self, name) for name in type(self).model_fields}
@@ -0,0 +1,228 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, func, literal_column, or_, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from users.models import User
+from users.schemas import UserInformation
+from news.models import News
+from meeting.models import Meeting
+from rating.models import Rating
+from rating.rollup import average_query
+from tasks.models.task import Task
+from tasks.models.comment import Comment
+from web.schemas import DashboardRead
+from config import get_setting
+
+
+setting = get_setting()
+
+
+#   пустой json-массив для секций без данных
+EMPTY_JSON = literal_column("'[]'::json", JSON)
+
+
+#   json-объект из набора колонок: {"id": ..., "title": ...}
+def _json_object(*columns):
+    pairs = []
+    for column in columns:
+        pairs.extend((literal_column(f"'{column.key}'"), column))
+
+    return func.json_build_object(*pairs)
+
+#   json-массив строк, упорядоченный по order_by; пустой массив вместо NULL
+def _json_list(columns, order_by):
+    return func.coalesce(
+        func.json_agg(aggregate_order_by(_json_object(*columns), order_by)),
+        EMPTY_JSON,
+        type_=JSON
+    )
+
+
+class DashboardService:
+    """
+        Сервисный слой для главной страницы:
+            - сборка контекста дашборда одним SQL-запросом
+    """
+
+    async def get_dashboard(
+        self, session: AsyncSession, user: User
+    ) -> DashboardRead:
+        """
+            Получение контекста главной страницы.
+
+            Сотрудники, новости, встречи, оценки, средние оценки за квартал
+            и задачи с комментариями собираются в одном запросе через CTE
+            и json_agg, вместо семи последовательных запросов.
+
+            Args:
+                session (AsyncSession): SQLAlchemy-сессия.
+                user (User): Получение текущего пользователя.
+
+            Returns:
+                (DashboardRead): Схема контекста главной страницы.
+        """
+
+        row = (await session.execute(self._build_query(user))).mappings().one()
+
+        return DashboardRead(
+            profile=UserInformation.model_validate(user),
+            users=row['users'] or [],
+            news=row['news'] or [],
+            owner_meetings=row['owner_meetings'] or [],
+            ratings=row['ratings'] or [],
+            avg={
+                'avg_date': row['avg_date'],
+                'avg_quality': row['avg_quality'],
+                'avg_complete': row['avg_complete'],
+            },
+            tasks={
+                'owner_tasks': row['owner_tasks'] or [],
+                'assigned_tasks': row['assigned_tasks'] or [],
+            }
+        )
+
+    def _build_query(self, user: User):
+        """
+            Построение единого запроса дашборда.
+
+            Args:
+                user (User): Получение текущего пользователя.
+
+            Returns:
+                (Select): Запрос, возвращающий одну строку с json-секциями.
+        """
+
+        today = datetime.now(timezone.utc).date()
+
+        #   задачи пользователя (выданные и назначенные), число комментариев
+        #   и последние TASK_LATEST_COMMENTS комментариев каждой задачи
+        user_tasks = (
+            select(Task)
+            .where(or_(Task.owner_id == user.id, Task.target_id == user.id))
+            .cte('user_tasks')
+        )
+        latest_comments = (
+            select(
+                Comment.id, Comment.author_id, Comment.task_id, Comment.description
+            )
+            .where(Comment.task_id == user_tasks.c.id)
+            .order_by(Comment.id.desc())
+            .limit(setting.TASK_LATEST_COMMENTS)
+            .lateral('latest_comments')
+        )
+        task_comments = (
+            select(
+                user_tasks.c.id.label('task_id'),
+                func.json_agg(
+                    aggregate_order_by(
+                        _json_object(
+                            latest_comments.c.id, latest_comments.c.author_id,
+                            latest_comments.c.task_id, latest_comments.c.description
+                        ),
+                        latest_comments.c.id
+                    )
+                ).label('comments')
+            )
+            .select_from(user_tasks)
+            .join(latest_comments, true())
+            .group_by(user_tasks.c.id)
+            .cte('task_comments')
+        )
+        comment_count = (
+            select(func.count())
+            .where(Comment.task_id == user_tasks.c.id)
+            .scalar_subquery()
+        )
+        task_rows = (
+            select(
+                user_tasks,
+                func.coalesce(task_comments.c.comments, EMPTY_JSON).label('comments'),
+                comment_count.label('comment_count')
+            )
+            .outerjoin(task_comments, task_comments.c.task_id == user_tasks.c.id)
+            .cte('task_rows')
+        )
+        task_columns = (
+            task_rows.c.id, task_rows.c.owner_id, task_rows.c.company_id,
+            task_rows.c.target_id, task_rows.c.start_date, task_rows.c.end_date,
+            task_rows.c.title, task_rows.c.description, task_rows.c.status,
+            task_rows.c.comments, task_rows.c.comment_count
+        )
+
+        #   средние оценки за текущий квартал из rating_rollup
+        avg_rating = average_query(user.id, today).cte('avg_rating')
+
+        #   секции компании доступны только сотрудникам компании
+        if user.company_id:
+            users = (
+                select(_json_list(
+                    (
+                        User.id, User.first_name, User.last_name, User.email,
+                        User.company_role, User.company_id, User.department_id
+                    ),
+                    User.id
+                ))
+                .where(User.company_id == user.company_id)
+                .scalar_subquery()
+            )
+            news = (
+                select(_json_list(
+                    (
+                        News.id, News.owner_id, News.company_id,
+                        News.title, News.description
+                    ),
+                    News.id
+                ))
+                .where(News.company_id == user.company_id)
+                .scalar_subquery()
+            )
+            owner_meetings = (
+                select(_json_list(
+                    (
+                        Meeting.id, Meeting.organizer_id, Meeting.company_id,
+                        Meeting.title, Meeting.description,
+                        Meeting.meeting_date, Meeting.meeting_time
+                    ),
+                    Meeting.id
+                ))
+                .where(Meeting.organizer_id == user.id)
+                .scalar_subquery()
+            )
+        else:
+            users = news = owner_meetings = EMPTY_JSON
+
+        ratings = (
+            select(_json_list(
+                (
+                    Rating.task_id, Rating.head_id, Rating.score_date,
+                    Rating.score_quality, Rating.score_complete, Rating.created_at
+                ),
+                Rating.id
+            ))
+            .where(Rating.owner_id == user.id)
+            .scalar_subquery()
+        )
+        owner_tasks = (
+            select(_json_list(task_columns, task_rows.c.id))
+            .where(task_rows.c.owner_id == user.id)
+            .scalar_subquery()
+        )
+        assigned_tasks = (
+            select(_json_list(task_columns, task_rows.c.id))
+            .where(task_rows.c.target_id == user.id)
+            .scalar_subquery()
+        )
+
+        return select(
+            users.label('users'),
+            news.label('news'),
+            owner_meetings.label('owner_meetings'),
+            ratings.label('ratings'),
+            owner_tasks.label('owner_tasks'),
+            assigned_tasks.label('assigned_tasks'),
+            avg_rating.c.avg_date,
+            avg_rating.c.avg_quality,
+            avg_rating.c.avg_complete,
+        ).select_from(avg_rating)